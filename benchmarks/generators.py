@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+
+# Config dicts for the synthetic frames below. Thresholds are the defaults
+# used across the examples so every fault condition and report can run.
+AHU_CONFIG = {
+    "DUCT_STATIC_COL": "duct_static",
+    "DUCT_STATIC_SETPOINT_COL": "duct_static_setpoint",
+    "SUPPLY_VFD_SPEED_COL": "supply_vfd_speed",
+    "MAT_COL": "mat",
+    "OAT_COL": "oat",
+    "SAT_COL": "sat",
+    "RAT_COL": "rat",
+    "HEATING_SIG_COL": "heating_sig",
+    "COOLING_SIG_COL": "cooling_sig",
+    "ECONOMIZER_SIG_COL": "economizer_sig",
+    "SUPPLY_FAN_AIR_VOLUME_COL": "supply_cfm",
+    "SAT_SETPOINT_COL": "sat_setpoint",
+    "CLG_COIL_ENTER_TEMP_COL": "clg_enter",
+    "CLG_COIL_LEAVE_TEMP_COL": "clg_leave",
+    "HTG_COIL_ENTER_TEMP_COL": "htg_enter",
+    "HTG_COIL_LEAVE_TEMP_COL": "htg_leave",
+    "CLT_COL": "clg_leave",
+    "HLT_COL": "htg_leave",
+    "ERV_OAT_ENTER_COL": "erv_oat_enter",
+    "ERV_OAT_LEAVING_COL": "erv_oat_leaving",
+    "ERV_EAT_ENTER_COL": "erv_eat_enter",
+    "ERV_EAT_LEAVING_COL": "erv_eat_leaving",
+    "VFD_SPEED_PERCENT_ERR_THRES": 0.05,
+    "VFD_SPEED_PERCENT_MAX": 0.99,
+    "DUCT_STATIC_INCHES_ERR_THRES": 0.1,
+    "OUTDOOR_DEGF_ERR_THRES": 5.0,
+    "MIX_DEGF_ERR_THRES": 2.0,
+    "RETURN_DEGF_ERR_THRES": 2.0,
+    "SUPPLY_DEGF_ERR_THRES": 2.0,
+    "DELTA_T_SUPPLY_FAN": 2.0,
+    "DELTA_SUPPLY_FAN": 2.0,
+    "DELTA_OS_MAX": 7,
+    "AHU_MIN_OA_DPR": 0.2,
+    "OAT_RAT_DELTA_MIN": 10.0,
+    "AIRFLOW_ERR_THRES": 0.3,
+    "AHU_MIN_OA_CFM_DESIGN": 2500,
+    "COIL_TEMP_ENTER_ERR_THRES": 1.0,
+    "COIL_TEMP_LEAV_ERR_THRES": 1.0,
+    "TROUBLESHOOT_MODE": False,
+    "ROLLING_WINDOW_SIZE": 5,
+}
+
+CHILLER_CONFIG = {
+    "DIFF_PRESSURE_COL": "diff_pressure",
+    "DIFF_PRESSURE_SETPOINT_COL": "diff_pressure_setpoint",
+    "PUMP_SPEED_COL": "pump_speed",
+    "FLOW_COL": "flow",
+    "PUMP_SPEED_PERCENT_ERR_THRES": 0.05,
+    "PUMP_SPEED_PERCENT_MAX": 0.99,
+    "DIFF_PRESSURE_PSI_ERR_THRES": 1.0,
+    "FLOW_ERROR_THRESHOLD": 100.0,
+    "TROUBLESHOOT_MODE": False,
+    "ROLLING_WINDOW_SIZE": 5,
+}
+
+
+def time_index(rows, freq="1min", start="2024-01-01") -> pd.DatetimeIndex:
+    return pd.date_range(start, periods=rows, freq=freq)
+
+
+def ahu_data(rows, seed=0, freq="1min") -> pd.DataFrame:
+    """Returns ``rows`` samples of AHU trend data for AHU_CONFIG.
+
+    Temperatures follow a daily cycle with noise, and the fan, heating,
+    cooling and economizer signals switch between a few positions, so
+    every fault condition sees both passing and failing samples.
+    """
+    rng = np.random.default_rng(seed)
+    index = time_index(rows, freq)
+    day = 2 * np.pi * (index.hour.to_numpy() * 60 + index.minute.to_numpy()) / 1440
+
+    def temps(center, swing, noise):
+        return center + swing * np.sin(day) + noise * rng.standard_normal(rows)
+
+    def signal(levels):
+        return rng.choice(levels, size=rows)
+
+    oat = temps(55.0, 15.0, 3.0)
+    columns = {
+        "duct_static": lambda: temps(1.0, 0.1, 0.15),
+        "duct_static_setpoint": lambda: np.full(rows, 1.0),
+        "supply_vfd_speed": lambda: signal([0.0, 0.5, 0.8, 0.96, 1.0]),
+        "mat": lambda: temps(62.0, 5.0, 3.0),
+        "oat": lambda: oat,
+        "sat": lambda: temps(56.0, 2.0, 3.0),
+        "rat": lambda: temps(70.0, 1.0, 1.5),
+        "heating_sig": lambda: signal([0.0, 0.0, 0.3, 0.95]),
+        "cooling_sig": lambda: signal([0.0, 0.0, 0.5, 1.0]),
+        "economizer_sig": lambda: signal([0.2, 0.2, 0.6, 1.0]),
+        "supply_cfm": lambda: temps(8000.0, 500.0, 800.0),
+        "sat_setpoint": lambda: np.full(rows, 55.0),
+        "clg_enter": lambda: temps(60.0, 3.0, 2.0),
+        "clg_leave": lambda: temps(55.0, 3.0, 2.0),
+        "htg_enter": lambda: temps(55.0, 3.0, 2.0),
+        "htg_leave": lambda: temps(60.0, 3.0, 2.0),
+        "erv_oat_enter": lambda: oat.copy(),
+        "erv_oat_leaving": lambda: oat + 0.6 * (70.0 - oat) + rng.standard_normal(rows),
+        "erv_eat_enter": lambda: temps(70.0, 1.0, 1.0),
+        "erv_eat_leaving": lambda: temps(60.0, 5.0, 2.0),
+    }
+
+    # Columns are added one at a time so a 1e7 row frame is never held
+    # twice, once as arrays and once consolidated
+    df = pd.DataFrame(index=index)
+    for col, make in columns.items():
+        df[col] = make()
+    return df
+
+
+def chiller_data(rows, seed=0, freq="1min") -> pd.DataFrame:
+    """Returns ``rows`` samples of chilled water pump data for CHILLER_CONFIG."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "diff_pressure": 10.0 + 2.0 * rng.standard_normal(rows),
+            "diff_pressure_setpoint": np.full(rows, 10.0),
+            "pump_speed": rng.choice([0.0, 0.5, 0.96, 1.0], size=rows),
+            "flow": 300.0 + 150.0 * rng.standard_normal(rows),
+        },
+        index=time_index(rows, freq),
+    )
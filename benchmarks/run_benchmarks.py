@@ -0,0 +1,364 @@
+"""
+Times every AHU and chiller fault condition, the fault rules on each
+installed acceleration backend, process_all_faults, the FC4 hourly resample, every report's summarize_fault_times, the summary engine,
+the mechanical cooling mode classifier and the FC1 report plot on synthetic
+data, and writes the timings to JSON.
+
+Run from the repository root:
+$ python -m benchmarks.run_benchmarks
+$ python -m benchmarks.run_benchmarks --sizes 1e4 1e6 --filter ahu.fc
+$ python -m benchmarks.run_benchmarks --rows 10000000 --filter .evaluate[
+$ python -m benchmarks.run_benchmarks --compare benchmarks/results/0.1.7-20241001-120000.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from importlib.metadata import PackageNotFoundError, version
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import open_fdd.air_handling_unit.faults as ahu_faults
+import open_fdd.air_handling_unit.reports as ahu_reports
+import open_fdd.chiller_plant.faults as chiller_faults
+from open_fdd.air_handling_unit.faults.acceleration import (
+    BACKENDS,
+    backend_available,
+)
+from open_fdd.air_handling_unit.faults.fault_registry import FAULT_REGISTRY
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+from open_fdd.air_handling_unit.reports.summary_engine import FaultSummaryEngine
+from open_fdd.energy_efficiency.reports.ahu_mech_clg_tracker import (
+    MechanicalCoolingTracker,
+)
+
+from benchmarks.generators import AHU_CONFIG, CHILLER_CONFIG, ahu_data, chiller_data
+
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+AHU_FAULTS = {
+    1: ahu_faults.FaultConditionOne,
+    2: ahu_faults.FaultConditionTwo,
+    3: ahu_faults.FaultConditionThree,
+    4: ahu_faults.FaultConditionFour,
+    5: ahu_faults.FaultConditionFive,
+    6: ahu_faults.FaultConditionSix,
+    7: ahu_faults.FaultConditionSeven,
+    8: ahu_faults.FaultConditionEight,
+    9: ahu_faults.FaultConditionNine,
+    10: ahu_faults.FaultConditionTen,
+    11: ahu_faults.FaultConditionEleven,
+    12: ahu_faults.FaultConditionTwelve,
+    13: ahu_faults.FaultConditionThirteen,
+    14: ahu_faults.FaultConditionFourteen,
+    15: ahu_faults.FaultConditionFifteen,
+    16: ahu_faults.FaultConditionSixteen,
+}
+
+AHU_REPORTS = {
+    1: ahu_reports.FaultCodeOneReport,
+    2: ahu_reports.FaultCodeTwoReport,
+    3: ahu_reports.FaultCodeThreeReport,
+    4: ahu_reports.FaultCodeFourReport,
+    5: ahu_reports.FaultCodeFiveReport,
+    6: ahu_reports.FaultCodeSixReport,
+    7: ahu_reports.FaultCodeSevenReport,
+    8: ahu_reports.FaultCodeEightReport,
+    9: ahu_reports.FaultCodeNineReport,
+    10: ahu_reports.FaultCodeTenReport,
+    11: ahu_reports.FaultCodeElevenReport,
+    12: ahu_reports.FaultCodeTwelveReport,
+    13: ahu_reports.FaultCodeThirteenReport,
+    14: ahu_reports.FaultCodeFourteenReport,
+    15: ahu_reports.FaultCodeFifteenReport,
+    16: ahu_reports.FaultCodeSixteenReport,
+}
+
+CHILLER_FAULTS = {
+    1: chiller_faults.FaultConditionOne,
+    2: chiller_faults.FaultConditionTwo,
+}
+
+
+def ahu_cases(rows, wanted):
+    """Yields the (name, function) pairs for one AHU frame of ``rows``
+    whose name passes ``wanted``. Setup is skipped for the others."""
+    df = ahu_data(rows)
+
+    for n, cls in AHU_FAULTS.items():
+        if wanted(f"ahu.fc{n}.apply"):
+            fc = cls(AHU_CONFIG)
+            yield f"ahu.fc{n}.apply", lambda fc=fc: fc.apply(df.copy(deep=False))
+
+    # The rules of fault equations 1 to 15 on each installed backend. The
+    # kernel is compiled on a slice first so numba's compile isn't timed.
+    backends = [backend for backend in BACKENDS if backend_available(backend)]
+    for spec in FAULT_REGISTRY:
+        if spec.expression is None:
+            continue
+        for backend in backends:
+            name = f"ahu.{spec.name}.evaluate[{backend}]"
+            if wanted(name):
+                fc = spec.build({**AHU_CONFIG, "ACCELERATION_BACKEND": backend})
+                fc.evaluate(df.iloc[:1000])
+                yield name, lambda fc=fc: fc.evaluate(df)
+
+    if wanted("ahu.fc4.resample"):
+        fc4 = ahu_faults.FaultConditionFour(AHU_CONFIG)
+        states = fc4.operating_states(df.copy(deep=False))
+        yield "ahu.fc4.resample", lambda: SharedUtils.count_rising_edges(
+            states, fc4.delta_os_window
+        )
+        del states
+
+    helper = HelperUtils()
+    if wanted("ahu.process_all_faults"):
+        yield "ahu.process_all_faults", lambda: helper.process_all_faults(
+            df, AHU_CONFIG
+        )
+    if wanted("ahu.process_all_faults.fused"):
+        yield "ahu.process_all_faults.fused", lambda: helper.process_all_faults(
+            df, AHU_CONFIG, fused=True
+        )
+
+    if wanted("ahu.report.mech_clg.identify_modes"):
+        tracker = MechanicalCoolingTracker(
+            {
+                "STATIC_MIN": 0.5,
+                "STATIC_COL": AHU_CONFIG["DUCT_STATIC_COL"],
+                "ECONOMIZER_MIN_OA_POS": AHU_CONFIG["AHU_MIN_OA_DPR"],
+                "ECONOMIZER_DAMPER_POSITION": 0.5,
+                "MECHANICAL_VALVE_POSITION": 0.1,
+                "OAT_COL": AHU_CONFIG["OAT_COL"],
+                "MA_DAMPERS_COL": AHU_CONFIG["ECONOMIZER_SIG_COL"],
+                "CW_VALVE_COL": AHU_CONFIG["COOLING_SIG_COL"],
+            }
+        )
+        yield "ahu.report.mech_clg.identify_modes", lambda: tracker.identify_modes(df)
+
+    reports = {
+        f"ahu.report.fc{n}.summarize_fault_times": cls for n, cls in AHU_REPORTS.items()
+    }
+    plot = "ahu.report.fc1.create_plot"
+    engine = "ahu.report.summary_engine"
+    if not any(wanted(name) for name in [*reports, plot, engine]):
+        return
+
+    # Reports summarize the flags, so they are computed once outside the
+    # timing, without the smoothed copy process_all_faults would make. The
+    # FC4 report only reads the mode and flag columns, so FC4 runs on its
+    # own columns to keep 1e7 rows in memory.
+    flags = {}
+    df_fc4 = None
+    for name, fc in helper.build_fault_conditions(AHU_CONFIG):
+        if name != "fc4":
+            flags[fc.flag_col] = fc.evaluate(df).astype(np.uint8)
+        elif wanted("ahu.report.fc4.summarize_fault_times") or wanted(engine):
+            df_fc4 = fc.apply(df[fc.required_columns])
+    fc16 = ahu_faults.FaultConditionSixteen(AHU_CONFIG)
+    flags["fc16_flag"] = fc16.evaluate(df).reindex(df.index, fill_value=0)
+    df_combined = df.assign(**flags)
+    del flags
+    for name, cls in reports.items():
+        if wanted(name):
+            report = cls(AHU_CONFIG)
+            frame = df_fc4 if report.fault_col == "fc4_flag" else df_combined
+            yield name, lambda report=report, frame=frame: report.summarize_fault_times(
+                frame
+            )
+
+    if wanted(engine):
+        summary_engine = FaultSummaryEngine(AHU_CONFIG)
+        yield engine, lambda: summary_engine.summarize(df_combined, df_fc4)
+
+    if wanted(plot):
+        report = ahu_reports.FaultCodeOneReport(AHU_CONFIG)
+        figure = Figure()
+        FigureCanvasAgg(figure)
+
+        def render():
+            report.create_plot(df_combined, figure)
+            figure.savefig(io.BytesIO(), format="png")
+
+        yield plot, render
+
+
+def chiller_cases(rows, wanted):
+    """Yields the (name, function) pairs for one chiller frame of ``rows``
+    whose name passes ``wanted``."""
+    df = chiller_data(rows)
+    for n, cls in CHILLER_FAULTS.items():
+        if wanted(f"chiller.fc{n}.apply"):
+            fc = cls(CHILLER_CONFIG)
+            yield f"chiller.fc{n}.apply", lambda fc=fc: fc.apply(df.copy(deep=False))
+
+
+SUITES = [ahu_cases, chiller_cases]
+
+
+def time_case(function, repeat) -> list:
+    """Returns the wall time in seconds of ``repeat`` calls. The fault
+    conditions print on every call, which is kept out of the output."""
+    seconds = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            function()
+            seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def run(sizes, repeat=3, name_filter=None, verbose=True) -> list:
+    """Runs every benchmark whose name contains ``name_filter`` at each
+    size and returns one record per benchmark and size."""
+
+    def wanted(name):
+        return not name_filter or name_filter in name
+
+    results = []
+    for rows in sizes:
+        for suite in SUITES:
+            cases = suite(rows, wanted)
+            while True:
+                # Setup also prints, e.g. process_all_faults for the reports
+                with contextlib.redirect_stdout(io.StringIO()):
+                    name, function = next(cases, (None, None))
+                if name is None:
+                    break
+                record = {"benchmark": name, "rows": rows, "repeat": repeat}
+                try:
+                    seconds = time_case(function, repeat)
+                    record["best_s"] = min(seconds)
+                    record["mean_s"] = sum(seconds) / len(seconds)
+                    record["rows_per_s"] = rows / record["best_s"]
+                except MemoryError:
+                    record["error"] = "MemoryError"
+                results.append(record)
+                if verbose:
+                    best = record.get("best_s")
+                    timing = f"{best:.4f}s" if best is not None else record["error"]
+                    print(f"{name:<45} {rows:>10,} {timing}")
+                    sys.stdout.flush()
+                del function
+            del cases
+            gc.collect()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def open_fdd_version():
+    try:
+        return version("open_fdd")
+    except PackageNotFoundError:
+        return None
+
+
+def environment() -> dict:
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "open_fdd": open_fdd_version(),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(results, baseline, threshold=1.2) -> list:
+    """Returns (benchmark, rows, baseline_s, best_s, ratio) for the
+    benchmarks that are more than ``threshold`` times slower than in the
+    ``baseline`` JSON document."""
+    previous = {
+        (record["benchmark"], record["rows"]): record["best_s"]
+        for record in baseline["results"]
+        if "best_s" in record
+    }
+    regressions = []
+    for record in results:
+        key = (record["benchmark"], record["rows"])
+        if "best_s" not in record or key not in previous:
+            continue
+        ratio = record["best_s"] / previous[key]
+        if ratio > threshold:
+            regressions.append((*key, previous[key], record["best_s"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        "--rows",
+        nargs="+",
+        type=lambda size: int(float(size)),
+        default=DEFAULT_SIZES,
+        help="rows per frame, e.g. 1e4 1e6 1e7",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", help="only run benchmarks containing this")
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--compare", help="baseline JSON file to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="slowdown ratio reported as a regression by --compare",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat, args.filter)
+    document = {"environment": environment(), "results": results}
+
+    output = args.output
+    if output is None:
+        release = document["environment"]["open_fdd"] or "dev"
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{release}-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(document, f, indent=2)
+    print(f"Info: Benchmark results saved to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for name, rows, before, after, ratio in regressions:
+            print(
+                f"Warning: {name} at {rows:,} rows took {after:.4f}s, "
+                f"{ratio:.2f}x the baseline {before:.4f}s"
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,51 +1,10 @@
-import sqlite3
 import pandas as pd
-import re
+from open_fdd.data_sources.sqlite_store import TimeseriesStore
 
 # Step 1: Connect to SQLite database (or create it)
-conn = sqlite3.connect("brick_timeseries.db")
-cursor = conn.cursor()
-
 # Step 2: Create tables for timeseries data and metadata
-cursor.execute(
-    """
-CREATE TABLE IF NOT EXISTS TimeseriesData (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    sensor_name TEXT NOT NULL,
-    timestamp TEXT NOT NULL,
-    value REAL NOT NULL
-)
-"""
-)
-
-cursor.execute(
-    """
-CREATE TABLE IF NOT EXISTS TimeseriesReference (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    timeseries_id TEXT NOT NULL,
-    stored_at TEXT NOT NULL
-)
-"""
-)
-
-cursor.execute(
-    """
-CREATE TABLE IF NOT EXISTS DatabaseStorage (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    label TEXT NOT NULL,
-    connstring TEXT NOT NULL
-)
-"""
-)
-
 # Step 3: Insert database metadata (SQLite reference)
-cursor.execute(
-    """
-INSERT INTO DatabaseStorage (label, connstring)
-VALUES
-    ('SQLite Timeseries Storage', 'sqlite:///brick_timeseries.db')
-"""
-)
+store = TimeseriesStore("brick_timeseries.db")
 
 # Step 4: Load the CSV data
 csv_file = r"C:\Users\bbartling\Documents\brick_data_July_2024.csv"
@@ -70,56 +29,20 @@ df.columns = df.columns.str.strip()
 # Print columns after modification to verify changes
 print("Modified df.columns", df.columns)
 
-# Step 5: Insert CSV data into the TimeseriesData table
-for column in df.columns:
-    if column != "timestamp":  # Skip the timestamp column itself
-        # Only process columns related to AHU fan VFD speed, static pressure sensor, and setpoint
-        if "StaticSPt" in column or "SaStatic" in column or "SaFanSpeedAO" in column:
-            for index, row in df.iterrows():
-                cursor.execute(
-                    """
-                INSERT INTO TimeseriesData (sensor_name, timestamp, value)
-                VALUES (?, ?, ?)
-                """,
-                    (
-                        column.strip(),  # Trim the sensor_name
-                        row["timestamp"].strftime("%Y-%m-%d %H:%M:%S"),
-                        row[column],
-                    ),
-                )
-                if index < 5:  # Print the first 5 rows only
-                    print(
-                        f"Inserted sensor name {column.strip()} with value {row[column]} at {row['timestamp']}"
-                    )
-            print(f"Processed {column} in step 5")
-        else:
-            pass
-
-conn.commit()
-
-print("Starting step 6")
-
-# Step 6: Insert timeseries references based on sensor names
-for column in df.columns:
-    if column != "timestamp":  # Skip the timestamp column itself
-        # Only process columns related to AHU fan VFD speed, static pressure sensor, and setpoint
-        if "StaticSPt" in column or "SaStatic" in column or "SaFanSpeedAO" in column:
-            cursor.execute(
-                """
-            INSERT INTO TimeseriesReference (timeseries_id, stored_at)
-            VALUES (?, ?)
-            """,
-                (column.strip(), "SQLite Timeseries Storage"),
-            )
-            print(f"Inserted reference for {column.strip()} in step 6")
-        else:
-            pass
-
-conn.commit()
+# Step 5: Bulk insert CSV data into the TimeseriesData table
+# Only process columns related to AHU fan VFD speed, static pressure sensor, and setpoint
+sensor_columns = [
+    column
+    for column in df.columns
+    if column != "timestamp"
+    and ("StaticSPt" in column or "SaStatic" in column or "SaFanSpeedAO" in column)
+]
 
-print("Step 6 is done")
+# Step 6: Insert timeseries references based on sensor names,
+# this also happens inside load_dataframe along with the index build
+store.load_dataframe(df, columns=sensor_columns)
 
 # Close the connection
-conn.close()
+store.close()
 
 print("SQLite database created and populated with CSV data.")
@@ -0,0 +1,267 @@
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+BACKENDS = ("numpy", "numexpr", "numba")
+
+
+@lru_cache(maxsize=None)
+def backend_available(backend) -> bool:
+    """True if the module the backend needs can be imported."""
+    if backend == "numpy":
+        return True
+    try:
+        __import__(backend)
+    except ImportError:
+        return False
+    return True
+
+
+def resolve_backend(backend) -> str:
+    """Returns the backend to use for the config key ACCELERATION_BACKEND.
+
+    * "numpy" (default) walks the expression tree with one numpy call per
+      operator. Sub-expressions are shared between rules through the run's
+      ExpressionCache.
+    * "numexpr" evaluates the whole expression as one numexpr string, in
+      cache sized blocks without full size temporaries.
+    * "numba" compiles a loop over the samples with numba.njit, so the
+      whole expression is one pass over the columns.
+
+    numexpr and numba are optional dependencies. When the one selected is
+    not installed the rules fall back to "numpy", with a warning printed
+    once.
+    """
+    if backend is None:
+        return "numpy"
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"ACCELERATION_BACKEND should be one of {', '.join(BACKENDS)}, but got {backend}"
+        )
+    if not backend_available(backend):
+        warn_fallback(backend)
+        return "numpy"
+    return backend
+
+
+@lru_cache(maxsize=None)
+def warn_fallback(backend):
+    """Warns once per process that ``backend`` is not installed."""
+    print(
+        f"Warning: {backend} is not installed, fault rules fall back to numpy. "
+        f"Install it with: pip install {backend}"
+    )
+    sys.stdout.flush()
+
+
+def constant_names(node, path=()) -> dict:
+    """Maps the path of each constant in a bound node, the positions of
+    the operands leading to it, to a variable name, k0, k1, ...
+
+    Constants are passed to the kernels as variables rather than written
+    as literals, so each one can be given the dtype numpy computes it in.
+    """
+    if node[0] == "const":
+        return {path: "k0"}
+    if node[0] == "col":
+        return {}
+    names = {}
+    for position, operand in enumerate(node[1:]):
+        for constant in constant_names(operand, path + (position,)):
+            names[constant] = f"k{len(names)}"
+    return names
+
+
+def typed_constants(node, dtypes: dict) -> dict:
+    """Maps the path of each constant in a bound node to its value at the
+    dtype numpy computes it in, for columns of ``dtypes``.
+
+    numpy treats Python scalars as weak, so 0.2 compared with a float32
+    column is compared as a float32. A float64 literal in numexpr or numba
+    would promote the column instead and flag different samples. The
+    dtypes are found by running each operator on empty arrays.
+    """
+    # The operator table lives with the parser, which imports this module
+    from open_fdd.air_handling_unit.faults.fault_registry import OPERATIONS
+
+    values = {}
+
+    def probe(node, path):
+        kind = node[0]
+        if kind == "col":
+            return np.empty(0, dtype=dtypes[node[1]])
+        if kind == "const":
+            return node[2]
+        operands = [
+            probe(operand, path + (position,))
+            for position, operand in enumerate(node[1:])
+        ]
+        common = np.result_type(*operands)
+        for position, operand in enumerate(node[1:]):
+            if operand[0] == "const":
+                values[path + (position,)] = common.type(operand[2])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return OPERATIONS[kind](*operands)
+
+    probe(node, ())
+    return values
+
+
+def numexpr_source(node, names: dict, constants: dict, path=()) -> str:
+    """Translates a bound node into numexpr syntax.
+
+    Columns become the variable given for them in ``names`` and constants
+    the variable given for their path in ``constants``. numexpr has no
+    minimum or maximum, so they are written with where() and a NaN check
+    that keeps numpy's NaN propagation.
+    """
+    kind = node[0]
+    if kind == "col":
+        return names[node[1]]
+    if kind == "const":
+        return constants[path]
+
+    operands = [
+        numexpr_source(operand, names, constants, path + (position,))
+        for position, operand in enumerate(node[1:])
+    ]
+    if kind == "neg":
+        return f"(-{operands[0]})"
+    if kind == "~":
+        return f"(~{operands[0]})"
+    if kind in ("abs", "sqrt"):
+        return f"{kind}({operands[0]})"
+    if kind in ("minimum", "maximum"):
+        a, b = operands
+        op = "<" if kind == "minimum" else ">"
+        return f"where(({a} {op} {b}) | ({a} != {a}), {a}, {b})"
+    return f"({operands[0]} {kind} {operands[1]})"
+
+
+def loop_source(node, names: dict, constants: dict, path=()) -> str:
+    """Translates a bound node into a Python expression over one sample
+    ``i`` of the column arrays named in ``names``, for the numba loop.
+    Constants are the scalar variables given for their path in
+    ``constants``."""
+    kind = node[0]
+    if kind == "col":
+        return f"{names[node[1]]}[i]"
+    if kind == "const":
+        return constants[path]
+
+    operands = [
+        loop_source(operand, names, constants, path + (position,))
+        for position, operand in enumerate(node[1:])
+    ]
+    if kind == "neg":
+        return f"(-{operands[0]})"
+    if kind == "~":
+        return f"(not {operands[0]})"
+    if kind == "abs":
+        return f"abs({operands[0]})"
+    if kind in ("sqrt", "minimum", "maximum"):
+        return f"np.{kind}({', '.join(operands)})"
+    return f"({operands[0]} {kind} {operands[1]})"
+
+
+def column_names(node) -> dict:
+    """Maps each column of a bound node to a variable name, c0, c1, ..."""
+    if node[0] == "col":
+        return {node[1]: "c0"}
+    if node[0] == "const":
+        return {}
+    names = {}
+    for operand in node[1:]:
+        for column in column_names(operand):
+            names.setdefault(column, f"c{len(names)}")
+    return names
+
+
+def compile_loop(node, jit=True):
+    """Builds ``kernel(*columns, *constants, out)`` that writes the bound
+    node's mask for every sample into the bool array ``out``. With ``jit``
+    the loop is compiled with numba, otherwise it runs as plain Python.
+    Returns the kernel, the columns and the ``constant_names``."""
+    names = column_names(node)
+    constants = constant_names(node)
+    args = ", ".join([*names.values(), *constants.values(), "out"])
+    source = (
+        f"def kernel({args}):\n"
+        f"    for i in range(out.shape[0]):\n"
+        f"        out[i] = {loop_source(node, names, constants)}\n"
+    )
+    namespace = {"np": np}
+    exec(source, namespace)
+    kernel = namespace["kernel"]
+    if jit:
+        import numba
+
+        kernel = numba.njit(error_model="numpy")(kernel)
+    return kernel, list(names), constants
+
+
+class Kernel:
+    """Base of the compiled kernels. Holds the bound node's columns and
+    constants and types the constants for the dtypes of each frame."""
+
+    def __init__(self, node):
+        self.node = node
+        self.columns = list(column_names(node))
+        self.constants = constant_names(node)
+        self._typed = {}
+
+    def arrays(self, df) -> list:
+        return [df[col].to_numpy() for col in self.columns]
+
+    def constant_values(self, arrays) -> list:
+        """Returns the constants in ``self.constants`` order at the dtypes
+        numpy would compute them in for ``arrays``."""
+        dtypes = tuple(array.dtype for array in arrays)
+        if dtypes not in self._typed:
+            values = typed_constants(self.node, dict(zip(self.columns, dtypes)))
+            self._typed[dtypes] = [values[path] for path in self.constants]
+        return self._typed[dtypes]
+
+
+class NumexprKernel(Kernel):
+    """Evaluates a bound node as a single numexpr expression."""
+
+    def __init__(self, node):
+        import numexpr
+
+        super().__init__(node)
+        self.numexpr = numexpr
+        names = column_names(node)
+        self.variables = list(names.values())
+        self.source = numexpr_source(node, names, self.constants)
+
+    def __call__(self, df):
+        arrays = self.arrays(df)
+        local_dict = dict(zip(self.variables, arrays))
+        local_dict.update(zip(self.constants.values(), self.constant_values(arrays)))
+        return self.numexpr.evaluate(self.source, local_dict=local_dict)
+
+
+class NumbaKernel(Kernel):
+    """Evaluates a bound node with a numba compiled loop over the samples."""
+
+    def __init__(self, node):
+        super().__init__(node)
+        self.kernel, _, _ = compile_loop(node)
+
+    def __call__(self, df):
+        arrays = self.arrays(df)
+        out = np.empty(len(df), dtype=bool)
+        self.kernel(*arrays, *self.constant_values(arrays), out)
+        return out
+
+
+def compile_kernel(node, backend):
+    """Returns a callable that maps a frame to the bound node's mask, or
+    None for the "numpy" backend, which evaluates the tree directly."""
+    if backend == "numexpr":
+        return NumexprKernel(node)
+    if backend == "numba":
+        return NumbaKernel(node)
+    return None
@@ -0,0 +1,66 @@
+import operator
+import pandas as pd
+
+
+class ExpressionCache:
+    """Per-run cache of the masks and offsets shared between fault conditions.
+
+    Many faults evaluate the same sub-expressions on the same batch, such as
+    ``df[supply_vfd_speed_col] > 0.01`` or ``df[mat_col] - mix_degf_err_thres``.
+    Results are keyed on ``(column, operator, threshold)`` and computed once
+    per batch. A cache is bound to the index of the frame it serves so a
+    stale cache is never used for a different batch; create a new one per run.
+    """
+
+    OPERATORS = {
+        ">": operator.gt,
+        ">=": operator.ge,
+        "<": operator.lt,
+        "<=": operator.le,
+        "==": operator.eq,
+        "+": operator.add,
+        "-": operator.sub,
+    }
+
+    def __init__(self, df: pd.DataFrame):
+        self.index = df.index
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}
+
+    def serves(self, df: pd.DataFrame) -> bool:
+        """True if ``df`` is (a view of) the batch this cache was built for."""
+        return df.index.is_(self.index)
+
+    def get(self, df: pd.DataFrame, column, op: str, threshold) -> pd.Series:
+        """Return ``df[column] <op> threshold``, computing it on first use."""
+        key = (column, op, threshold)
+        if key in self._cache:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._cache[key] = self.OPERATORS[op](df[column], threshold)
+        return self._cache[key]
+
+    def abs_diff(self, df: pd.DataFrame, col_a, col_b) -> pd.Series:
+        """Return ``abs(df[col_a] - df[col_b])``, computing it on first use."""
+        key = (col_a, "abs_diff", col_b)
+        if key in self._cache:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._cache[key] = abs(df[col_a] - df[col_b])
+        return self._cache[key]
+
+    def clear(self):
+        self._cache.clear()
+
+    def lookup(self, key, compute):
+        """Return the value cached under ``key``, calling ``compute()`` on
+        first use. Used by compiled fault rules for any sub-expression."""
+        if key in self._cache:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self._cache[key] = compute()
+        return self._cache[key]
@@ -1,6 +1,11 @@
+import contextlib
+import numpy as np
 import pandas as pd
 import pandas.api.types as pdtypes
 from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+from open_fdd.air_handling_unit.faults.expression_cache import ExpressionCache
+from open_fdd.air_handling_unit.faults.metrics import FaultMetrics
 import sys
 
 """see __init__.py for fault classes"""
@@ -25,8 +30,15 @@ class InvalidParameterError(Exception):
 class FaultCondition:
     """Parent class for Fault Conditions. Methods are inherited to all children."""
 
+    # Name of the flag column written by apply, set on each child class
+    flag_col = None
+
     def __init__(self):
         self.required_columns = []
+        self.expression_cache = None
+        self.metrics = None
+        self._streaming = False
+        self.reset_stream()
 
     def set_attributes(self, dict_):
         """Passes dictionary into initialization of class instance"""
@@ -34,8 +46,92 @@ class FaultCondition:
             upper = attribute.upper()
             if upper in dict_:
                 value = dict_[upper]
+                # A numpy scalar threshold would upcast float32 columns to
+                # float64 in comparisons, a Python scalar keeps their precision
+                if isinstance(value, np.generic):
+                    value = value.item()
                 self.__setattr__(attribute, value)
 
+    def cached(self, df: pd.DataFrame, col, op, threshold) -> pd.Series:
+        """Returns df[col] <op> threshold, shared through the run's
+        expression cache when one is attached for this batch."""
+        if self.expression_cache is not None and self.expression_cache.serves(df):
+            return self.expression_cache.get(df, col, op, threshold)
+        return ExpressionCache.OPERATORS[op](df[col], threshold)
+
+    def cached_abs_diff(self, df: pd.DataFrame, col_a, col_b) -> pd.Series:
+        """Returns abs(df[col_a] - df[col_b]), shared through the run's
+        expression cache when one is attached for this batch."""
+        if self.expression_cache is not None and self.expression_cache.serves(df):
+            return self.expression_cache.abs_diff(df, col_a, col_b)
+        return abs(df[col_a] - df[col_b])
+
+    def measure(self, df: pd.DataFrame, stage="evaluate"):
+        """Context manager that records ``stage`` on ``df`` in the attached
+        MetricsRecorder, see metrics.py. Does nothing when none is attached."""
+        fault = self.flag_col[: -len("_flag")] if self.flag_col else None
+        if self.metrics is None:
+            return contextlib.nullcontext(FaultMetrics(fault, stage, len(df)))
+        return self.metrics.measure(fault, len(df), stage)
+
+    def consecutive_true_flag(self, combined_check) -> pd.Series:
+        """Flag samples where combined_check has been true for
+        rolling_window_size consecutive values. While streaming, the
+        run still open at the end of the last chunk is carried over."""
+        if not self._streaming:
+            return SharedUtils.consecutive_true_flags(
+                combined_check, self.rolling_window_size
+            ).rename(self.flag_col)
+
+        SharedUtils.check_window(self.rolling_window_size)
+        runs = SharedUtils.run_lengths(combined_check, self._stream_run)
+        if len(runs):
+            # Runs longer than the window flag the same, so cap the carry
+            self._stream_run = int(min(runs[-1], self.rolling_window_size))
+        return pd.Series(
+            (runs >= self.rolling_window_size).astype(int),
+            index=combined_check.index,
+            name=self.flag_col,
+        )
+
+    def reset_stream(self):
+        """Forget the state carried between update calls."""
+        self._stream_run = 0
+
+    def evaluate(self, df: pd.DataFrame) -> pd.Series:
+        """Returns the fault flag Series for ``df`` without writing to it.
+
+        Implemented by each fault condition. ``df`` is only read, so
+        callers do not need to pass a copy.
+        """
+        raise NotImplementedError
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Adds the fault flag column to ``df`` and returns it."""
+        with self.measure(df, "apply") as metrics:
+            flags = metrics.flags = self.evaluate(df)
+        df[self.flag_col] = flags
+        return df
+
+    def update(self, chunk: pd.DataFrame) -> pd.Series:
+        """Evaluate the next chunk of a stream and return its flags.
+
+        Chunks must arrive in time order. The flags are identical to the
+        flag column of a batch apply over all chunks concatenated.
+        """
+        self._streaming = True
+        try:
+            with self.measure(chunk, "update") as metrics:
+                flags = metrics.flags = self.evaluate(chunk)
+            return flags
+        finally:
+            self._streaming = False
+
+    def flush(self) -> pd.Series:
+        """Return flags still held back at the end of a stream. Only
+        faults that aggregate over time buckets hold any back."""
+        return pd.Series(dtype=int, name=self.flag_col)
+
     def check_required_columns(self, df: pd.DataFrame):
         """Checks if required columns are present in the DataFrame."""
         missing_columns = [
@@ -60,10 +156,15 @@ class FaultCondition:
             sys.stdout.flush()
 
     def check_analog_pct(self, df, columns):
-        """Check analog outputs [data with units of %] are floats only."""
+        """Check analog outputs [data with units of %] are floats only.
+
+        Returns ``df``, or a shallow copy of it with the non-float columns
+        converted, so the caller's frame is never written to.
+        """
         helper = HelperUtils()
         for col in columns:
             if not pdtypes.is_float_dtype(df[col]):
-                df = helper.convert_to_float(df, col)
+                df = helper.convert_to_float(df.copy(deep=False), col)
             if df[col].max() > 1.0:
                 raise TypeError(helper.float_max_check_err(col))
+        return df
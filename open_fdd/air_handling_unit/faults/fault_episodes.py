@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+
+STATS = ("max", "min", "mean")
+EPISODE_COLUMNS = ["fault", "start", "end", "duration", "samples", "ongoing"]
+
+
+def segment_reduce(values, starts, stops, stat) -> np.ndarray:
+    """Reduces ``values[start:stop]`` for each episode with ``stat``,
+    ignoring NaN, in one ``reduceat`` call."""
+    if not len(starts):
+        return np.empty(0)
+    # reduceat over the (start, stop) pairs, every other result is an
+    # episode. The NaN pad lets a stop equal the length of the data.
+    padded = np.append(values, np.nan)
+    bounds = np.column_stack([starts, stops]).ravel()
+    if stat == "mean":
+        valid = ~np.isnan(padded)
+        sums = np.add.reduceat(np.where(valid, padded, 0.0), bounds)[::2]
+        counts = np.add.reduceat(valid.astype(np.int64), bounds)[::2]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / counts
+    reduce = np.fmax if stat == "max" else np.fmin
+    return reduce.reduceat(padded, bounds)[::2]
+
+
+def extract_episodes(df, flag_cols=None, metrics=None, stats=("max", "mean")):
+    """Converts fault flag columns into a table of fault episodes.
+
+    An episode is a run of consecutive samples flagged 1. Each row holds
+    the first and last flagged sample (``start``, ``end``), the number of
+    ``samples`` and the ``duration``. The duration is the time from the
+    sample before the episode to its last sample. That is the time the
+    reports count as ``hours_fcN_mode``, so the durations of a fault add up
+    to its hours in fault. ``ongoing`` marks an episode still open at the
+    end of ``df``.
+
+    ``flag_cols`` defaults to every ``*_flag`` column. For each column in
+    ``metrics`` the ``stats`` ("max", "min", "mean") over the episode are
+    added as ``<column>_<stat>``, ignoring NaN.
+
+    The edges are found with one diff per flag column and the metrics are
+    reduced per episode with ``reduceat``, so nothing loops over samples.
+    The table is indexed by ``(fault, start)``, which stays the same when
+    the flags are recomputed or more data is appended, so it can be used to
+    join or deduplicate episodes across runs.
+
+    episodes = extract_episodes(df_combined, metrics=["sat", "mat"])
+    episodes.loc["fc1_flag"]
+    """
+    if flag_cols is None:
+        flag_cols = [col for col in df.columns if str(col).endswith("_flag")]
+    metrics = [] if metrics is None else list(metrics)
+    unknown = [stat for stat in stats if stat not in STATS]
+    if unknown:
+        raise ValueError(f"Unsupported episode stats {unknown}, choose from {STATS}")
+
+    columns = EPISODE_COLUMNS + [f"{col}_{stat}" for col in metrics for stat in stats]
+    times = df.index.to_numpy()
+    metric_values = {col: df[col].to_numpy(dtype=float) for col in metrics}
+
+    frames = []
+    for flag_col in flag_cols:
+        starts, stops = SharedUtils.flag_edges(df[flag_col])
+        if not len(starts):
+            continue
+        last = stops - 1
+        episode = {
+            "fault": np.full(len(starts), flag_col, dtype=object),
+            "start": df.index[starts],
+            "end": df.index[last],
+            # The first sample has no delta, like the NaT of index.diff()
+            "duration": pd.to_timedelta(times[last] - times[np.maximum(starts - 1, 0)]),
+            "samples": stops - starts,
+            "ongoing": stops == len(df),
+        }
+        for col, values in metric_values.items():
+            for stat in stats:
+                episode[f"{col}_{stat}"] = segment_reduce(values, starts, stops, stat)
+        frames.append(pd.DataFrame(episode, columns=columns))
+
+    if frames:
+        episodes = pd.concat(frames, ignore_index=True)
+    else:
+        episodes = pd.DataFrame(columns=columns)
+        episodes["start"] = pd.DatetimeIndex([], tz=getattr(df.index, "tz", None))
+    return episodes.set_index(["fault", "start"])
+
+
+def episodes_to_flags(episodes, index, flag_cols=None) -> pd.DataFrame:
+    """Rebuilds the dense 0/1 flag columns of ``episodes`` on ``index``.
+
+    Samples from each episode's start to its end are flagged. ``flag_cols``
+    defaults to the faults in ``episodes``; faults without episodes get a
+    column of 0s.
+    """
+    faults = episodes.index.get_level_values("fault")
+    if flag_cols is None:
+        flag_cols = list(dict.fromkeys(faults))
+
+    flags = {}
+    for flag_col in flag_cols:
+        selected = faults == flag_col
+        starts = index.searchsorted(
+            episodes.index.get_level_values("start")[selected], side="left"
+        )
+        stops = index.searchsorted(episodes["end"].to_numpy()[selected], side="right")
+        # +1 where an episode starts and -1 past its end, summed into runs
+        marks = np.zeros(len(index) + 1, dtype=np.int64)
+        np.add.at(marks, starts, 1)
+        np.add.at(marks, stops, -1)
+        flags[flag_col] = (np.cumsum(marks[:-1]) > 0).astype(int)
+    return pd.DataFrame(flags, index=index, columns=flag_cols)
@@ -0,0 +1,787 @@
+import ast
+import operator
+import sys
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from open_fdd.air_handling_unit.faults.acceleration import (
+    compile_kernel,
+    resolve_backend,
+)
+from open_fdd.air_handling_unit.faults.expression_cache import ExpressionCache
+from open_fdd.air_handling_unit.faults.fault_condition import (
+    FaultCondition,
+    MissingColumnError,
+    InvalidParameterError,
+)
+
+BINARY_OPERATORS = {
+    ast.Add: ("+", operator.add),
+    ast.Sub: ("-", operator.sub),
+    ast.Mult: ("*", operator.mul),
+    ast.Div: ("/", operator.truediv),
+    ast.Pow: ("**", operator.pow),
+    ast.BitAnd: ("&", operator.and_),
+    ast.BitOr: ("|", operator.or_),
+}
+
+COMPARE_OPERATORS = {
+    ast.Lt: ("<", operator.lt),
+    ast.LtE: ("<=", operator.le),
+    ast.Gt: (">", operator.gt),
+    ast.GtE: (">=", operator.ge),
+    ast.Eq: ("==", operator.eq),
+    ast.NotEq: ("!=", operator.ne),
+}
+
+UNARY_OPERATORS = {
+    ast.USub: ("neg", operator.neg),
+    ast.Invert: ("~", operator.invert),
+}
+
+FUNCTIONS = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "minimum": np.minimum,
+    "maximum": np.maximum,
+}
+
+OPERATIONS = {
+    symbol: function
+    for symbol, function in [
+        *BINARY_OPERATORS.values(),
+        *COMPARE_OPERATORS.values(),
+        *UNARY_OPERATORS.values(),
+        *FUNCTIONS.items(),
+    ]
+}
+
+
+@lru_cache(maxsize=None)
+def parse_expression(expression: str) -> tuple:
+    """Parses a fault expression into a tree of nested tuples.
+
+    Expressions use Python syntax over config keys. Names ending in _COL
+    are data columns and any other name is a config parameter. ``&``,
+    ``|`` and ``~`` combine masks, comparisons may not be chained, and the
+    functions in FUNCTIONS are available. Parsed once per expression.
+
+    Nodes are ("col", key), ("param", key), ("const", value) and
+    (symbol, *operands) for operators and functions.
+    """
+    return _to_node(ast.parse(expression, mode="eval").body, expression)
+
+
+def _to_node(node, expression):
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        symbol = BINARY_OPERATORS[type(node.op)][0]
+        return (
+            symbol,
+            _to_node(node.left, expression),
+            _to_node(node.right, expression),
+        )
+    if isinstance(node, ast.Compare) and len(node.ops) == 1:
+        if type(node.ops[0]) in COMPARE_OPERATORS:
+            symbol = COMPARE_OPERATORS[type(node.ops[0])][0]
+            return (
+                symbol,
+                _to_node(node.left, expression),
+                _to_node(node.comparators[0], expression),
+            )
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        symbol = UNARY_OPERATORS[type(node.op)][0]
+        return (symbol, _to_node(node.operand, expression))
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in FUNCTIONS
+        and not node.keywords
+    ):
+        return (node.func.id, *(_to_node(arg, expression) for arg in node.args))
+    if isinstance(node, ast.Name):
+        return ("col" if node.id.endswith("_COL") else "param", node.id)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return ("const", node.value)
+    raise ValueError(
+        f"Unsupported syntax '{ast.unparse(node)}' in fault expression: {expression}"
+    )
+
+
+def node_names(node, kind) -> list:
+    """Returns the config keys of one kind, "col" or "param", in order."""
+    if node[0] == kind:
+        return [node[1]]
+    if node[0] in ("col", "param", "const"):
+        return []
+    names = []
+    for operand in node[1:]:
+        names += [name for name in node_names(operand, kind) if name not in names]
+    return names
+
+
+def bind(node, columns: dict, params: dict):
+    """Replaces config keys with column names and parameter values, and
+    folds the parts that only involve constants.
+
+    Constants keep the type their expression gives them, a Python float
+    or a numpy scalar, so the kernel promotes dtypes exactly like the
+    fault condition classes do. Constants are keyed with their type so a
+    shared cache never mixes the two.
+    """
+    kind = node[0]
+    if kind == "col":
+        return ("col", columns[node[1]])
+    if kind == "param":
+        return ("const", type(params[node[1]]).__name__, params[node[1]])
+    if kind == "const":
+        return ("const", type(node[1]).__name__, node[1])
+
+    operands = [bind(operand, columns, params) for operand in node[1:]]
+    if all(operand[0] == "const" for operand in operands):
+        value = OPERATIONS[kind](*(operand[2] for operand in operands))
+        return ("const", type(value).__name__, value)
+    return (kind, *operands)
+
+
+def evaluate(node, df: pd.DataFrame, cache: ExpressionCache):
+    """Evaluates a bound node over the columns of ``df`` as numpy arrays.
+
+    Every operator node is looked up in ``cache`` first, so a
+    sub-expression shared by several rules in one run is computed once.
+    """
+    kind = node[0]
+    if kind == "col":
+        return df[node[1]].to_numpy()
+    if kind == "const":
+        return node[2]
+
+    def compute():
+        operands = [evaluate(operand, df, cache) for operand in node[1:]]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return OPERATIONS[kind](*operands)
+
+    return cache.lookup(("kernel", node), compute)
+
+
+class FaultSpec:
+    """Declares a fault rule for the registry.
+
+    ``expression`` is a boolean expression over config keys, see
+    ``parse_expression``, e.g.
+    "(DUCT_STATIC_COL < DUCT_STATIC_SETPOINT_COL - DUCT_STATIC_INCHES_ERR_THRES)".
+    The fault flags samples where it holds for ROLLING_WINDOW_SIZE
+    consecutive values.
+
+    ``window`` overrides the config's ROLLING_WINDOW_SIZE for this rule.
+    ``enabled_by`` lists the config keys that must be set for the rule to
+    run, by default the columns of the expression. ``analog`` lists the
+    *_COL keys of % signals that must be floats between 0.0 and 1.0.
+    ``validate`` lists the parameters checked at construction, in order;
+    parameters of the expression that it leaves out are checked after it.
+    Parameters must be floats unless listed in ``int_params``, which allows
+    ints too.
+    ``warn_zero`` lists columns that are divided by.
+    ``inputs`` describes the required columns in words for
+    ``get_required_columns``.
+
+    Rules that cannot be written as one expression, such as fault
+    condition 4 which resamples hourly, give ``fault_class`` instead; it
+    is built with the config dict like any other fault condition.
+    """
+
+    def __init__(
+        self,
+        name,
+        expression=None,
+        enabled_by=None,
+        window=None,
+        analog=(),
+        validate=(),
+        int_params=(),
+        warn_zero=(),
+        equation="",
+        description="",
+        inputs="",
+        fault_class=None,
+    ):
+        if (expression is None) == (fault_class is None):
+            raise ValueError(f"{name}: give either an expression or a fault_class")
+
+        self.name = name
+        self.flag_col = f"{name}_flag"
+        self.expression = expression
+        self.window = window
+        self.analog = list(analog)
+        self.int_params = list(int_params)
+        self.warn_zero = list(warn_zero)
+        self.equation = equation
+        self.description = description
+        self.inputs = inputs
+        self.fault_class = fault_class
+
+        if expression is not None:
+            tree = parse_expression(expression)
+            columns = node_names(tree, "col")
+            self.columns = columns + [col for col in self.analog if col not in columns]
+            self.params = node_names(tree, "param")
+        else:
+            self.columns = []
+            self.params = []
+        self.validate = list(validate) + [
+            key for key in self.params if key not in validate
+        ]
+        self.enabled_by = list(enabled_by) if enabled_by else list(self.columns)
+
+    def enabled(self, config_dict) -> bool:
+        return all(config_dict.get(key) is not None for key in self.enabled_by)
+
+    def build(self, config_dict) -> FaultCondition:
+        if self.fault_class is not None:
+            return self.fault_class(config_dict)
+        return RuleFaultCondition(self, config_dict)
+
+
+class FaultRegistry:
+    """Ordered collection of FaultSpec that ``process_all_faults`` runs.
+
+    registry = FaultRegistry(AHU_FAULTS)
+    registry.register(FaultSpec("ahu_custom", "(SAT_COL > 90.0) & (SUPPLY_VFD_SPEED_COL > 0.01)"))
+    HelperUtils().process_all_faults(df, config_dict, registry=registry)
+    """
+
+    def __init__(self, specs=()):
+        self._specs = {}
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: FaultSpec) -> FaultSpec:
+        if spec.name in self._specs:
+            raise ValueError(f"A fault named {spec.name} is already registered")
+        self._specs[spec.name] = spec
+        return spec
+
+    def __getitem__(self, name) -> FaultSpec:
+        return self._specs[name]
+
+    def __contains__(self, name) -> bool:
+        return name in self._specs
+
+    def __iter__(self):
+        return iter(self._specs.values())
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def names(self) -> list:
+        return list(self._specs)
+
+
+class RuleFaultCondition(FaultCondition):
+    """Fault condition compiled from a FaultSpec.
+
+    Parameters are validated and bound into the expression once, at
+    construction. ``evaluate`` then runs the bound kernel over the data
+    columns as numpy arrays. When the fused engine attaches a shared
+    ExpressionCache, sub-expressions repeated across rules are computed
+    once per batch.
+
+    The config key ACCELERATION_BACKEND set to "numexpr" or "numba"
+    evaluates the whole expression in one pass instead, see
+    ``acceleration.resolve_backend``.
+    """
+
+    def __init__(self, spec: FaultSpec, dict_):
+        super().__init__()
+        self.spec = spec
+        self.flag_col = spec.flag_col
+
+        params = {}
+        for key in spec.validate:
+            value = dict_.get(key, None)
+            # A numpy scalar would upcast float32 columns, see set_attributes
+            if isinstance(value, np.generic):
+                value = value.item()
+            allowed = (float, int) if key in spec.int_params else float
+            if not isinstance(value, allowed) or isinstance(value, bool):
+                raise InvalidParameterError(
+                    f"The parameter '{key.lower()}' should be a float, but got {type(value).__name__}."
+                )
+            params[key] = value
+        self.params = params
+
+        self.troubleshoot_mode = dict_.get("TROUBLESHOOT_MODE", False)
+        self.rolling_window_size = spec.window or dict_.get("ROLLING_WINDOW_SIZE", None)
+
+        self.equation_string = (
+            spec.equation
+            or f"{self.flag_col} = 1 if {spec.expression} for N consecutive values else 0 \n"
+        )
+        self.description_string = spec.description
+        self.required_column_description = (
+            f"Required inputs are {spec.inputs or ', '.join(spec.columns)} \n"
+        )
+        self.error_string = "One or more required columns are missing or None \n"
+
+        columns = {key: dict_.get(key, None) for key in spec.columns}
+        self.required_columns = list(columns.values())
+        if any(col is None for col in self.required_columns):
+            raise MissingColumnError(
+                f"{self.error_string}"
+                f"{self.equation_string}"
+                f"{self.description_string}"
+                f"{self.required_column_description}"
+                f"{self.required_columns}"
+            )
+
+        columns = {key: str(col) for key, col in columns.items()}
+        self.required_columns = list(columns.values())
+        # Config keys are also attributes, e.g. self.sat_col, like the
+        # set_attributes convention of the other fault conditions
+        for key, value in {**columns, **params}.items():
+            setattr(self, key.lower(), value)
+        self.analog_columns = [columns[key] for key in spec.analog]
+        self.warn_zero_columns = [columns[key] for key in spec.warn_zero]
+        self.kernel = bind(parse_expression(spec.expression), columns, params)
+        self.backend = resolve_backend(dict_.get("ACCELERATION_BACKEND", None))
+        self.compiled_kernel = compile_kernel(self.kernel, self.backend)
+
+        self.mapped_columns = (
+            f"Your config dictionary is mapped as: {', '.join(self.required_columns)}"
+        )
+
+    def get_required_columns(self) -> str:
+        """Returns a string representation of the required columns."""
+        return (
+            f"{self.equation_string}"
+            f"{self.description_string}"
+            f"{self.required_column_description}"
+            f"{self.mapped_columns}"
+        )
+
+    def evaluate(self, df: pd.DataFrame) -> pd.Series:
+        try:
+            # Ensure all required columns are present
+            self.check_required_columns(df)
+
+            if self.troubleshoot_mode:
+                self.troubleshoot_cols(df)
+
+            if self.warn_zero_columns and df[self.warn_zero_columns].eq(0).any().any():
+                print(
+                    f"Warning: Zero values found in columns: {self.warn_zero_columns}"
+                )
+                print("This may cause division by zero errors.")
+                sys.stdout.flush()
+
+            # Check analog outputs [data with units of %] are floats only
+            df = self.check_analog_pct(df, self.analog_columns)
+
+            if self.compiled_kernel is not None:
+                mask = self.compiled_kernel(df)
+            else:
+                cache = self.expression_cache
+                if cache is None or not cache.serves(df):
+                    cache = ExpressionCache(df)
+                mask = evaluate(self.kernel, df, cache)
+            combined_check = pd.Series(mask, index=df.index)
+
+            # Set flag to 1 if combined_check is true for N consecutive values
+            return self.consecutive_true_flag(combined_check)
+
+        except MissingColumnError as e:
+            print(f"Error: {e.message}")
+            sys.stdout.flush()
+            raise e
+        except InvalidParameterError as e:
+            print(f"Error: {e.message}")
+            sys.stdout.flush()
+            raise e
+
+
+def _fault_condition_four(config_dict):
+    from open_fdd.air_handling_unit.faults import FaultConditionFour
+
+    return FaultConditionFour(config_dict)
+
+
+# fc1 to fc15. The FaultConditionN classes in faults/__init__.py are built
+# from these specs, so each rule is only written here.
+AHU_FAULTS = [
+    FaultSpec(
+        "fc1",
+        "(DUCT_STATIC_COL < DUCT_STATIC_SETPOINT_COL - DUCT_STATIC_INCHES_ERR_THRES)"
+        " & (SUPPLY_VFD_SPEED_COL >= VFD_SPEED_PERCENT_MAX - VFD_SPEED_PERCENT_ERR_THRES)",
+        analog=["SUPPLY_VFD_SPEED_COL"],
+        validate=[
+            "VFD_SPEED_PERCENT_ERR_THRES",
+            "VFD_SPEED_PERCENT_MAX",
+            "DUCT_STATIC_INCHES_ERR_THRES",
+        ],
+        equation="fc1_flag = 1 if (DSP < DPSP - εDSP) and (VFDSPD >= VFDSPD_max - εVFDSPD) "
+        "for N consecutive values else 0 \n",
+        description="Fault Condition 1: Duct static too low at fan at full speed \n",
+        inputs=("the duct static pressure, setpoint, and supply fan VFD speed"),
+    ),
+    FaultSpec(
+        "fc2",
+        "(MAT_COL + MIX_DEGF_ERR_THRES"
+        " < minimum(RAT_COL - RETURN_DEGF_ERR_THRES, OAT_COL - OUTDOOR_DEGF_ERR_THRES))"
+        " & (SUPPLY_VFD_SPEED_COL > 0.01)",
+        enabled_by=["SUPPLY_VFD_SPEED_COL", "MAT_COL", "OAT_COL", "SAT_COL", "RAT_COL"],
+        analog=["SUPPLY_VFD_SPEED_COL"],
+        validate=[
+            "MIX_DEGF_ERR_THRES",
+            "RETURN_DEGF_ERR_THRES",
+            "OUTDOOR_DEGF_ERR_THRES",
+        ],
+        equation="fc2_flag = 1 if (MAT + εMAT < min(RAT - εRAT, OAT - εOAT)) and (VFDSPD > 0) "
+        "for N consecutive values else 0 \n",
+        description="Fault Condition 2: Mix temperature too low; should be between outside and return air \n",
+        inputs=(
+            "the mix air temperature, return air temperature, outside air "
+            "temperature, and supply fan VFD speed"
+        ),
+    ),
+    FaultSpec(
+        "fc3",
+        "(MAT_COL - MIX_DEGF_ERR_THRES"
+        " > maximum(RAT_COL + RETURN_DEGF_ERR_THRES, OAT_COL + OUTDOOR_DEGF_ERR_THRES))"
+        " & (SUPPLY_VFD_SPEED_COL > 0.01)",
+        enabled_by=["SUPPLY_VFD_SPEED_COL", "MAT_COL", "OAT_COL", "SAT_COL", "RAT_COL"],
+        analog=["SUPPLY_VFD_SPEED_COL"],
+        validate=[
+            "MIX_DEGF_ERR_THRES",
+            "RETURN_DEGF_ERR_THRES",
+            "OUTDOOR_DEGF_ERR_THRES",
+        ],
+        equation="fc3_flag = 1 if (MAT - εMAT > max(RAT + εRAT, OAT + εOAT)) and (VFDSPD > 0) "
+        "for N consecutive values else 0 \n",
+        description="Fault Condition 3: Mix temperature too high; should be between outside and return air \n",
+        inputs=(
+            "the mix air temperature, return air temperature, outside air "
+            "temperature, and supply fan VFD speed"
+        ),
+    ),
+    FaultSpec(
+        "fc4",
+        enabled_by=[
+            "SUPPLY_VFD_SPEED_COL",
+            "COOLING_SIG_COL",
+            "HEATING_SIG_COL",
+            "ECONOMIZER_SIG_COL",
+        ],
+        fault_class=_fault_condition_four,
+    ),
+    FaultSpec(
+        "fc5",
+        "(SAT_COL + SUPPLY_DEGF_ERR_THRES <= MAT_COL - MIX_DEGF_ERR_THRES + DELTA_T_SUPPLY_FAN)"
+        " & (HEATING_SIG_COL > 0.01) & (SUPPLY_VFD_SPEED_COL > 0.01)",
+        enabled_by=["SUPPLY_VFD_SPEED_COL", "HEATING_SIG_COL", "SAT_COL", "MAT_COL"],
+        analog=["SUPPLY_VFD_SPEED_COL", "HEATING_SIG_COL"],
+        validate=[
+            "MIX_DEGF_ERR_THRES",
+            "SUPPLY_DEGF_ERR_THRES",
+            "DELTA_T_SUPPLY_FAN",
+        ],
+        equation="fc5_flag = 1 if (SAT + εSAT <= MAT - εMAT + ΔT_supply_fan) and "
+        "(heating signal > 0) and (VFDSPD > 0) for N consecutive values else 0 \n",
+        description="Fault Condition 5: SAT too low; should be higher than MAT in HTG MODE, "
+        "potential broken heating valve or mechanical issue \n",
+        inputs=(
+            "the mixed air temperature, supply air temperature, heating signal, and "
+            "supply fan VFD speed"
+        ),
+    ),
+    FaultSpec(
+        "fc6",
+        "((abs(RAT_COL - OAT_COL) >= OAT_RAT_DELTA_MIN)"
+        " & (abs(maximum((MAT_COL - RAT_COL) / (OAT_COL - RAT_COL), 0)"
+        " - AHU_MIN_OA_CFM_DESIGN / SUPPLY_FAN_AIR_VOLUME_COL) > AIRFLOW_ERR_THRES))"
+        " & (((HEATING_SIG_COL > 0.0) & (SUPPLY_VFD_SPEED_COL > 0.0))"
+        " | ((HEATING_SIG_COL == 0.0) & (COOLING_SIG_COL > 0.0)"
+        " & (SUPPLY_VFD_SPEED_COL > 0.0) & (ECONOMIZER_SIG_COL == AHU_MIN_OA_DPR)))",
+        enabled_by=[
+            "SUPPLY_VFD_SPEED_COL",
+            "COOLING_SIG_COL",
+            "HEATING_SIG_COL",
+            "ECONOMIZER_SIG_COL",
+            "SUPPLY_FAN_AIR_VOLUME_COL",
+        ],
+        analog=[
+            "SUPPLY_VFD_SPEED_COL",
+            "ECONOMIZER_SIG_COL",
+            "HEATING_SIG_COL",
+            "COOLING_SIG_COL",
+        ],
+        int_params=["AHU_MIN_OA_CFM_DESIGN"],
+        warn_zero=["RAT_COL", "OAT_COL", "SUPPLY_FAN_AIR_VOLUME_COL"],
+        validate=[
+            "AHU_MIN_OA_CFM_DESIGN",
+            "AIRFLOW_ERR_THRES",
+            "OUTDOOR_DEGF_ERR_THRES",
+            "RETURN_DEGF_ERR_THRES",
+            "OAT_RAT_DELTA_MIN",
+            "AHU_MIN_OA_DPR",
+        ],
+        equation="fc6_flag = 1 if |OA_frac_calc - OA_min| > airflow_err_thres "
+        "in non-economizer modes, considering htg and mech clg OS \n",
+        description="Fault Condition 6: Issues detected with OA fraction calculation or AHU "
+        "not maintaining design air flow in non-economizer conditions \n",
+        inputs=(
+            "the supply fan air volume, mixed air temperature, outside air "
+            "temperature, return air temperature, and VFD speed. Optional inputs "
+            "include economizer signal, heating signal, and cooling signal"
+        ),
+    ),
+    FaultSpec(
+        "fc7",
+        "(SAT_COL < SAT_SETPOINT_COL - SUPPLY_DEGF_ERR_THRES)"
+        " & (HEATING_SIG_COL > 0.9) & (SUPPLY_VFD_SPEED_COL > 0)",
+        enabled_by=[
+            "SUPPLY_VFD_SPEED_COL",
+            "SAT_COL",
+            "SAT_SETPOINT_COL",
+            "HEATING_SIG_COL",
+        ],
+        analog=["SUPPLY_VFD_SPEED_COL", "HEATING_SIG_COL"],
+        validate=["SUPPLY_DEGF_ERR_THRES"],
+        equation="fc7_flag = 1 if SAT < (SATSP - εSAT) in full heating mode "
+        "and VFD speed > 0 for N consecutive values else 0 \n",
+        description="Fault Condition 7: Supply air temperature too low in full heating mode "
+        "with heating valve fully open \n",
+        inputs=(
+            "the supply air temperature, supply air temperature setpoint, heating "
+            "signal, and supply fan VFD speed"
+        ),
+    ),
+    FaultSpec(
+        "fc8",
+        "(abs(SAT_COL - DELTA_T_SUPPLY_FAN - MAT_COL)"
+        " > sqrt(SUPPLY_DEGF_ERR_THRES ** 2 + MIX_DEGF_ERR_THRES ** 2))"
+        " & (ECONOMIZER_SIG_COL > AHU_MIN_OA_DPR) & (COOLING_SIG_COL < 0.1)",
+        enabled_by=[
+            "COOLING_SIG_COL",
+            "ECONOMIZER_SIG_COL",
+            "MAT_COL",
+            "SUPPLY_VFD_SPEED_COL",
+            "SAT_COL",
+        ],
+        analog=["ECONOMIZER_SIG_COL", "COOLING_SIG_COL"],
+        validate=[
+            "DELTA_T_SUPPLY_FAN",
+            "MIX_DEGF_ERR_THRES",
+            "SUPPLY_DEGF_ERR_THRES",
+            "AHU_MIN_OA_DPR",
+        ],
+        equation="fc8_flag = 1 if |SAT - MAT - ΔT_fan| > √(εSAT² + εMAT²) "
+        "in economizer mode for N consecutive values else 0 \n",
+        description="Fault Condition 8: Supply air temperature and mixed air temperature should "
+        "be approximately equal in economizer mode \n",
+        inputs=(
+            "the mixed air temperature, supply air temperature, economizer signal, "
+            "and cooling signal"
+        ),
+    ),
+    FaultSpec(
+        "fc9",
+        "(OAT_COL - OUTDOOR_DEGF_ERR_THRES"
+        " > SAT_SETPOINT_COL - DELTA_T_SUPPLY_FAN + SUPPLY_DEGF_ERR_THRES)"
+        " & (ECONOMIZER_SIG_COL > AHU_MIN_OA_DPR) & (COOLING_SIG_COL < 0.1)",
+        enabled_by=[
+            "OAT_COL",
+            "SUPPLY_VFD_SPEED_COL",
+            "SAT_COL",
+            "SAT_SETPOINT_COL",
+            "COOLING_SIG_COL",
+            "ECONOMIZER_SIG_COL",
+        ],
+        analog=["ECONOMIZER_SIG_COL", "COOLING_SIG_COL"],
+        validate=[
+            "DELTA_T_SUPPLY_FAN",
+            "OUTDOOR_DEGF_ERR_THRES",
+            "SUPPLY_DEGF_ERR_THRES",
+            "AHU_MIN_OA_DPR",
+        ],
+        equation="fc9_flag = 1 if OAT > (SATSP - ΔT_fan + εSAT) "
+        "in free cooling mode for N consecutive values else 0 \n",
+        description="Fault Condition 9: Outside air temperature too high in free cooling mode "
+        "without additional mechanical cooling in economizer mode \n",
+        inputs=(
+            "the supply air temperature setpoint, outside air temperature, cooling "
+            "signal, and economizer signal"
+        ),
+    ),
+    FaultSpec(
+        "fc10",
+        "(abs(MAT_COL - OAT_COL) > sqrt(MIX_DEGF_ERR_THRES ** 2 + OUTDOOR_DEGF_ERR_THRES ** 2))"
+        " & (COOLING_SIG_COL > 0.01) & (ECONOMIZER_SIG_COL > 0.9)",
+        enabled_by=[
+            "MAT_COL",
+            "OAT_COL",
+            "SUPPLY_VFD_SPEED_COL",
+            "COOLING_SIG_COL",
+            "ECONOMIZER_SIG_COL",
+        ],
+        analog=["ECONOMIZER_SIG_COL", "COOLING_SIG_COL"],
+        validate=[
+            "OUTDOOR_DEGF_ERR_THRES",
+            "MIX_DEGF_ERR_THRES",
+        ],
+        equation="fc10_flag = 1 if |OAT - MAT| > √(εOAT² + εMAT²) in "
+        "economizer + mech cooling mode for N consecutive values else 0 \n",
+        description="Fault Condition 10: Outdoor air temperature and mixed air temperature "
+        "should be approximately equal in economizer plus mechanical cooling mode \n",
+        inputs=(
+            "the outside air temperature, mixed air temperature, cooling signal, and "
+            "economizer signal"
+        ),
+    ),
+    FaultSpec(
+        "fc11",
+        "(OAT_COL + OUTDOOR_DEGF_ERR_THRES"
+        " < SAT_SETPOINT_COL - DELTA_T_SUPPLY_FAN - SUPPLY_DEGF_ERR_THRES)"
+        " & (COOLING_SIG_COL > 0.01) & (ECONOMIZER_SIG_COL > 0.9)",
+        enabled_by=[
+            "OAT_COL",
+            "SUPPLY_VFD_SPEED_COL",
+            "COOLING_SIG_COL",
+            "ECONOMIZER_SIG_COL",
+            "SAT_SETPOINT_COL",
+        ],
+        analog=["ECONOMIZER_SIG_COL", "COOLING_SIG_COL"],
+        validate=[
+            "DELTA_T_SUPPLY_FAN",
+            "OUTDOOR_DEGF_ERR_THRES",
+            "SUPPLY_DEGF_ERR_THRES",
+        ],
+        equation="fc11_flag = 1 if OAT < (SATSP - ΔT_fan - εSAT) in "
+        "economizer cooling mode for N consecutive values else 0 \n",
+        description="Fault Condition 11: Outside air temperature too low for 100% outdoor air "
+        "cooling in economizer cooling mode (Economizer performance fault) \n",
+        inputs=(
+            "the supply air temperature setpoint, outside air temperature, cooling "
+            "signal, and economizer signal"
+        ),
+    ),
+    FaultSpec(
+        "fc12",
+        "(SAT_COL - SUPPLY_DEGF_ERR_THRES - DELTA_T_SUPPLY_FAN > MAT_COL + MIX_DEGF_ERR_THRES)"
+        " & (COOLING_SIG_COL > 0.01)"
+        " & ((ECONOMIZER_SIG_COL == AHU_MIN_OA_DPR) | (ECONOMIZER_SIG_COL > 0.9))",
+        enabled_by=[
+            "SUPPLY_VFD_SPEED_COL",
+            "ECONOMIZER_SIG_COL",
+            "COOLING_SIG_COL",
+            "SAT_COL",
+            "MAT_COL",
+        ],
+        analog=["ECONOMIZER_SIG_COL", "COOLING_SIG_COL"],
+        validate=[
+            "DELTA_T_SUPPLY_FAN",
+            "MIX_DEGF_ERR_THRES",
+            "SUPPLY_DEGF_ERR_THRES",
+            "AHU_MIN_OA_DPR",
+        ],
+        equation="fc12_flag = 1 if SAT >= MAT + εMAT in "
+        "economizer + mech cooling mode for N consecutive values else 0 \n",
+        description="Fault Condition 12: Supply air temperature too high; should be less than "
+        "mixed air temperature in economizer plus mechanical cooling mode \n",
+        inputs=(
+            "the supply air temperature, mixed air temperature, cooling signal, and "
+            "economizer signal"
+        ),
+    ),
+    FaultSpec(
+        "fc13",
+        "(SAT_COL > SAT_SETPOINT_COL + SUPPLY_DEGF_ERR_THRES)"
+        " & (COOLING_SIG_COL > 0.01)"
+        " & ((ECONOMIZER_SIG_COL == AHU_MIN_OA_DPR) | (ECONOMIZER_SIG_COL > 0.9))",
+        enabled_by=[
+            "SUPPLY_VFD_SPEED_COL",
+            "ECONOMIZER_SIG_COL",
+            "COOLING_SIG_COL",
+            "SAT_SETPOINT_COL",
+            "SAT_COL",
+        ],
+        analog=["ECONOMIZER_SIG_COL", "COOLING_SIG_COL"],
+        validate=[
+            "SUPPLY_DEGF_ERR_THRES",
+            "AHU_MIN_OA_DPR",
+        ],
+        equation="fc13_flag = 1 if SAT > (SATSP + εSAT) in "
+        "economizer + mech cooling mode for N consecutive values else 0 \n",
+        description="Fault Condition 13: Supply air temperature too high in full cooling "
+        "in economizer plus mechanical cooling mode \n",
+        inputs=(
+            "the supply air temperature, supply air temperature setpoint, cooling "
+            "signal, and economizer signal"
+        ),
+    ),
+    FaultSpec(
+        "fc14",
+        "(CLG_COIL_ENTER_TEMP_COL - CLG_COIL_LEAVE_TEMP_COL"
+        " >= sqrt(COIL_TEMP_ENTER_ERR_THRES ** 2 + COIL_TEMP_LEAV_ERR_THRES ** 2)"
+        " + DELTA_T_SUPPLY_FAN)"
+        " & (((ECONOMIZER_SIG_COL > AHU_MIN_OA_DPR) & (COOLING_SIG_COL < 0.1))"
+        " | ((HEATING_SIG_COL > 0.0) & (SUPPLY_VFD_SPEED_COL > 0.0)))",
+        enabled_by=["COOLING_SIG_COL", "CLG_COIL_LEAVE_TEMP_COL"],
+        analog=[
+            "ECONOMIZER_SIG_COL",
+            "COOLING_SIG_COL",
+            "HEATING_SIG_COL",
+            "SUPPLY_VFD_SPEED_COL",
+        ],
+        validate=[
+            "DELTA_T_SUPPLY_FAN",
+            "COIL_TEMP_ENTER_ERR_THRES",
+            "COIL_TEMP_LEAV_ERR_THRES",
+            "AHU_MIN_OA_DPR",
+        ],
+        int_params=["AHU_MIN_OA_DPR"],
+        equation="fc14_flag = 1 if ΔT_coil >= √(εcoil_enter² + εcoil_leave²) + ΔT_fan "
+        "in inactive cooling coil mode for N consecutive values else 0 \n",
+        description="Fault Condition 14: Temperature drop across inactive cooling coil "
+        "detected, requiring coil leaving temperature sensor \n",
+        inputs=(
+            "the cooling coil entering temperature, cooling coil leaving temperature,"
+            " cooling signal, heating signal, economizer signal, and supply fan VFD "
+            "speed"
+        ),
+    ),
+    FaultSpec(
+        "fc15",
+        "(HTG_COIL_LEAVE_TEMP_COL - HTG_COIL_ENTER_TEMP_COL"
+        " >= sqrt(COIL_TEMP_ENTER_ERR_THRES ** 2 + COIL_TEMP_LEAV_ERR_THRES ** 2)"
+        " + DELTA_SUPPLY_FAN)"
+        " & (((ECONOMIZER_SIG_COL > AHU_MIN_OA_DPR) & (COOLING_SIG_COL < 0.1))"
+        " | ((COOLING_SIG_COL > 0.01) & (ECONOMIZER_SIG_COL == AHU_MIN_OA_DPR))"
+        " | ((COOLING_SIG_COL > 0.01) & (ECONOMIZER_SIG_COL > 0.9)))",
+        enabled_by=["HTG_COIL_ENTER_TEMP_COL", "HTG_COIL_LEAVE_TEMP_COL"],
+        analog=[
+            "ECONOMIZER_SIG_COL",
+            "COOLING_SIG_COL",
+            "HEATING_SIG_COL",
+            "SUPPLY_VFD_SPEED_COL",
+        ],
+        validate=[
+            "DELTA_SUPPLY_FAN",
+            "COIL_TEMP_ENTER_ERR_THRES",
+            "COIL_TEMP_LEAV_ERR_THRES",
+            "AHU_MIN_OA_DPR",
+        ],
+        int_params=["AHU_MIN_OA_DPR"],
+        equation="fc15_flag = 1 if ΔT_coil >= √(εcoil_enter² + εcoil_leave²) + ΔT_fan "
+        "in inactive heating coil mode for N consecutive values else 0 \n",
+        description="Fault Condition 15: Temperature rise across inactive heating coil "
+        "detected, requiring coil leaving temperature sensor \n",
+        inputs=(
+            "the heating coil entering temperature, heating coil leaving temperature,"
+            " cooling signal, heating signal, economizer signal, and supply fan VFD "
+            "speed"
+        ),
+    ),
+]
+
+FAULT_REGISTRY = FaultRegistry(AHU_FAULTS)
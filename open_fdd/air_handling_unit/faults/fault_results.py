@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+from open_fdd.air_handling_unit.faults.fault_episodes import (
+    EPISODE_COLUMNS,
+    extract_episodes,
+)
+
+NATIVE = "native"
+HOURLY = "hourly"
+
+
+class FaultResults:
+    """Holds the flags of every fault at both of their resolutions.
+
+    ``process_all_faults`` returns the per-sample flags in ``df_combined``
+    and the hourly FC4 flags in a separate ``df_fc4``. FaultResults keeps
+    both frames as they are and maps between them with one integer array,
+    the position of the FC4 bucket each sample falls in, found once with
+    ``searchsorted``. Any flag can then be read at either resolution
+    without reindexing or joining the frames.
+
+    df_combined, df_fc4, fault_counts_df = HelperUtils().process_all_faults(df, config_dict)
+    results = FaultResults(df_combined, df_fc4)
+    fc4_per_sample = results.flag("fc4_flag", "native")
+    fc1_per_hour = results.flag("fc1_flag", "hourly")
+    """
+
+    def __init__(self, df_combined: pd.DataFrame, df_fc4=None, freq=None):
+        self.native = df_combined
+        self.hourly = df_fc4 if df_fc4 is not None else pd.DataFrame()
+        if freq is None:
+            freq = getattr(self.hourly.index, "freq", None) or "60min"
+        self.freq = pd.tseries.frequencies.to_offset(freq)
+        self._positions = None
+
+    @property
+    def native_faults(self) -> list:
+        return [col for col in self.native.columns if str(col).endswith("_flag")]
+
+    @property
+    def hourly_faults(self) -> list:
+        return [col for col in self.hourly.columns if str(col).endswith("_flag")]
+
+    @property
+    def faults(self) -> list:
+        return self.native_faults + [
+            col for col in self.hourly_faults if col not in self.native_faults
+        ]
+
+    def resolution_of(self, flag_col) -> str:
+        if flag_col in self.native_faults:
+            return NATIVE
+        if flag_col in self.hourly_faults:
+            return HOURLY
+        raise KeyError(f"No fault flags named {flag_col}, have {self.faults}")
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Position of the hourly bucket holding each sample, -1 if none.
+
+        Bucket labels are their start times, so a sample belongs to the
+        last label at or before it, as long as it is before that bucket ends.
+        """
+        if self._positions is None:
+            if self.hourly.empty:
+                self._positions = np.full(len(self.native), -1, dtype=np.intp)
+            else:
+                # Both indexes are sorted, so the pad indexer is one merge pass
+                starts = self.hourly.index
+                positions = starts.get_indexer(self.native.index, method="pad")
+                times = self.native.index.asi8
+                ends = (starts + self.freq).as_unit(self.native.index.unit).asi8
+                inside = positions >= 0
+                inside &= times < ends[positions.clip(min=0)]
+                self._positions = np.where(inside, positions, -1)
+        return self._positions
+
+    def flag(self, flag_col, resolution=NATIVE, agg="max") -> pd.Series:
+        """Returns one fault's flags at ``resolution``, "native" or "hourly".
+
+        Hourly flags read at native resolution are forward filled over
+        their hour, samples outside every hour get 0. Native flags read
+        hourly are reduced with ``agg``, "max" flags any hour the fault was
+        active and "sum" counts the flagged samples.
+        """
+        if resolution not in (NATIVE, HOURLY):
+            raise ValueError(f"resolution must be '{NATIVE}' or '{HOURLY}'")
+
+        source = self.resolution_of(flag_col)
+        if source == resolution:
+            return self.native[flag_col] if source == NATIVE else self.hourly[flag_col]
+
+        if source == HOURLY:
+            values = self.hourly[flag_col].to_numpy()
+            positions = self.positions
+            mapped = np.where(positions >= 0, values[positions.clip(min=0)], 0)
+            return pd.Series(
+                mapped.astype(values.dtype), index=self.native.index, name=flag_col
+            )
+
+        flags = self.native[flag_col]
+        if self.hourly.empty:
+            return flags.resample(self.freq).agg(agg)
+        inside = self.positions >= 0
+        reduced = flags[inside].groupby(self.positions[inside]).agg(agg)
+        reduced = reduced.reindex(range(len(self.hourly)), fill_value=0)
+        return pd.Series(
+            reduced.to_numpy(dtype=flags.dtype),
+            index=self.hourly.index,
+            name=flag_col,
+        )
+
+    def flags(self, resolution=NATIVE, agg="max") -> pd.DataFrame:
+        """Returns every fault's flags at ``resolution`` in one frame."""
+        return pd.DataFrame(
+            {col: self.flag(col, resolution, agg) for col in self.faults}
+        )
+
+    def episodes(self, metrics=None, stats=("max", "mean")) -> pd.DataFrame:
+        """Returns the episodes of every fault at its own resolution, see
+        ``extract_episodes``. Metrics missing from a frame are left NaN."""
+        metrics = list(metrics or [])
+        hourly_only = [col for col in self.hourly_faults if col not in self.native]
+        frames = [
+            extract_episodes(
+                frame, flag_cols, frame.columns.intersection(metrics), stats
+            )
+            for frame, flag_cols in [
+                (self.native, self.native_faults),
+                (self.hourly, hourly_only),
+            ]
+            if flag_cols or frame is self.native
+        ]
+        columns = EPISODE_COLUMNS[2:] + [
+            f"{col}_{stat}" for col in metrics for stat in stats
+        ]
+        return pd.concat(frames).reindex(columns=columns)
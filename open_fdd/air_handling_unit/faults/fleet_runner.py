@@ -0,0 +1,188 @@
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.faults.metrics import MetricsRecorder
+
+
+def load_unit_data(source) -> pd.DataFrame:
+    """Returns the AHU data for one unit.
+
+    ``source`` can be a DataFrame, a path to a CSV file with a
+    ``timestamp`` column like the ones in ``examples/csv_data_source``,
+    or a callable that takes no arguments and returns a DataFrame.
+    Callables must be picklable (module level functions or
+    ``functools.partial``) to be sent to the worker processes.
+    """
+    if isinstance(source, pd.DataFrame):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        df = pd.read_csv(source)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        df.set_index("timestamp", inplace=True)
+        return df
+    if callable(source):
+        return source()
+    raise TypeError(f"Unsupported data source type: {type(source).__name__}")
+
+
+def failed_record(unit_id, error) -> dict:
+    """Returns the result record of a unit whose chunk failed in the pool."""
+    return {
+        "unit_id": unit_id,
+        "rows": 0,
+        "counts": None,
+        "error": f"{type(error).__name__}: {error}",
+        "metrics": [],
+        "seconds": 0.0,
+    }
+
+
+def run_unit(unit_id, source, config_dict, fused=True, verbose=False) -> dict:
+    """Runs process_all_faults for one AHU and returns its result record.
+
+    Errors are caught and returned in the record so one bad unit never
+    stops the rest of the fleet. ``record["metrics"]`` holds the
+    FaultMetrics of the faults that ran.
+    """
+    start = time.perf_counter()
+    recorder = MetricsRecorder(unit=unit_id)
+    record = {
+        "unit_id": unit_id,
+        "rows": 0,
+        "counts": None,
+        "error": None,
+        "metrics": recorder.records,
+    }
+    try:
+        df = load_unit_data(source)
+        record["rows"] = len(df)
+        # process_all_faults prints a lot per unit, keep workers quiet
+        stdout = sys.stdout if verbose else io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            _, _, fault_counts_df = HelperUtils().process_all_faults(
+                df, config_dict, fused=fused, metrics=recorder
+            )
+        record["counts"] = dict(
+            zip(fault_counts_df["Fault Condition"], fault_counts_df["Count"])
+        )
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {getattr(e, 'message', e)}"
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def run_units(units, fused=True, verbose=False) -> list:
+    """Runs a chunk of ``(unit_id, source, config_dict)`` in one worker."""
+    return [
+        run_unit(unit_id, source, config_dict, fused, verbose)
+        for unit_id, source, config_dict in units
+    ]
+
+
+class FleetRunner:
+    """Runs the AHU fault conditions on many units across a process pool.
+
+    ``units`` maps an AHU id to a ``(data source, config dict)`` pair, see
+    ``load_unit_data`` for the supported data sources. Units are sent to
+    the workers in chunks of ``chunksize`` and the fault counts of each
+    unit are merged into one fleet summary as the chunks complete.
+
+    runner = FleetRunner(units, max_workers=8, chunksize=4)
+    summary = runner.run()
+    """
+
+    def __init__(self, units, max_workers=None, chunksize=1, fused=True, verbose=False):
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise ValueError("chunksize must be an integer 1 or greater")
+
+        self.units = units
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self.fused = fused
+        self.verbose = verbose
+        self.errors = {}
+        self.records = []
+
+    def chunks(self) -> list:
+        """Splits the units into the work items sent to each worker."""
+        items = [
+            (unit_id, source, config_dict)
+            for unit_id, (source, config_dict) in self.units.items()
+        ]
+        return [
+            items[i : i + self.chunksize] for i in range(0, len(items), self.chunksize)
+        ]
+
+    def run(self) -> pd.DataFrame:
+        """Runs every unit and returns the fleet summary.
+
+        The summary has one row per AHU id and one column per fault sum.
+        Units that failed are left out of the summary and their error
+        message is kept in ``self.errors``. That includes every unit of a
+        chunk the pool could not run, for example after a worker crash.
+        """
+        self.errors = {}
+        self.records = []
+        total = len(self.units)
+        rows = 0
+        start = time.perf_counter()
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(run_units, chunk, self.fused, self.verbose): chunk
+                for chunk in self.chunks()
+            }
+            for future in as_completed(futures):
+                try:
+                    records = future.result()
+                except Exception as e:
+                    # The chunk never ran, e.g. a source that can't be
+                    # pickled or a worker that died and broke the pool
+                    records = [
+                        failed_record(unit_id, e) for unit_id, _, _ in futures[future]
+                    ]
+
+                for record in records:
+                    self.records.append(record)
+                    rows += record["rows"]
+                    if record["error"] is not None:
+                        self.errors[record["unit_id"]] = record["error"]
+                        print(f"Error in unit {record['unit_id']}: {record['error']}")
+
+                elapsed = time.perf_counter() - start
+                print(
+                    f"Fleet progress: {len(self.records)}/{total} units, "
+                    f"{len(self.records) / elapsed:.2f} units/s, "
+                    f"{rows / elapsed:,.0f} rows/s"
+                )
+                sys.stdout.flush()
+
+        return self.summary()
+
+    def summary(self) -> pd.DataFrame:
+        """Merges the fault counts of the completed units, sorted by AHU id."""
+        counts = {
+            record["unit_id"]: record["counts"]
+            for record in self.records
+            if record["error"] is None
+        }
+        summary = pd.DataFrame.from_dict(counts, orient="index")
+        summary.index.name = "unit_id"
+        if summary.empty:
+            return summary
+        return summary.fillna(0).astype(int).sort_index()
+
+    def metrics(self) -> MetricsRecorder:
+        """Returns a MetricsRecorder with the per fault metrics of every
+        unit that ran, e.g. ``runner.metrics().to_openmetrics()``."""
+        recorder = MetricsRecorder()
+        for record in self.records:
+            recorder.extend(record.get("metrics") or [])
+        return recorder
@@ -1,6 +1,10 @@
+import contextlib
 import sys
 from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+from open_fdd.air_handling_unit.faults.expression_cache import ExpressionCache
+from open_fdd.air_handling_unit.faults.metrics import FaultMetrics
 import pandas as pd
+import numpy as np
 
 
 class HelperUtils:
@@ -14,6 +18,12 @@ class HelperUtils:
     def clean_nan_values(self, df):
         return SharedUtils.clean_nan_values(df)
 
+    def fill_gaps(self, df, strategy=None, max_gap=None, default="drop"):
+        return SharedUtils.fill_gaps(df, strategy, max_gap, default)
+
+    def gap_report(self, df):
+        return SharedUtils.gap_report(df)
+
     def float_int_check_err(self, col):
         return SharedUtils.float_int_check_err(col)
 
@@ -29,366 +39,236 @@ class HelperUtils:
     def convert_to_float(self, df, col):
         return SharedUtils.convert_to_float(df, col)
 
-    def apply_rolling_average_if_needed(self, df, freq="1min", rolling_window="5min"):
-        return SharedUtils.apply_rolling_average_if_needed(df, freq, rolling_window)
+    def compact_dtypes(self, df):
+        return SharedUtils.compact_dtypes(df)
 
-    def validate_config(self, required_columns):
-        """
-        Check if all required columns are present and not None in the config dictionary.
-        """
-        if not self.config_dict:
-            raise ValueError("Config dictionary is not set.")
-        return all(self.config_dict.get(col) is not None for col in required_columns)
+    def pack_flags(self, flags):
+        return SharedUtils.pack_flags(flags)
 
-    def process_all_faults(self, df, config_dict):
-        # Set the config dictionary
-        self.set_config_dict(config_dict)
+    def unpack_flags(self, packed, length):
+        return SharedUtils.unpack_flags(packed, length)
 
-        from open_fdd.air_handling_unit.faults import (
-            FaultConditionOne,
-            FaultConditionTwo,
-            FaultConditionThree,
-            FaultConditionFour,
-            FaultConditionFive,
-            FaultConditionSix,
-            FaultConditionSeven,
-            FaultConditionEight,
-            FaultConditionNine,
-            FaultConditionTen,
-            FaultConditionEleven,
-            FaultConditionTwelve,
-            FaultConditionThirteen,
-            FaultConditionFourteen,
-            FaultConditionFifteen,
-        )
+    def run_lengths(self, mask):
+        return SharedUtils.run_lengths(mask)
 
-        fault_counts = {}
+    def flag_edges(self, flags):
+        return SharedUtils.flag_edges(flags)
 
-        # Apply rolling average if needed
-        df = self.apply_rolling_average_if_needed(df)
-
-        # Initialize Fault Condition Classes with necessary checks
-        fc1 = None
-        if self.validate_config(
-            ["DUCT_STATIC_COL", "DUCT_STATIC_SETPOINT_COL", "SUPPLY_VFD_SPEED_COL"]
-        ):
-            print("Info: Running fc1")
-            fc1 = FaultConditionOne(config_dict)
-        else:
-            print("Info: Skipping fc1")
+    def consecutive_true_flags(self, mask, window):
+        return SharedUtils.consecutive_true_flags(mask, window)
 
-        sys.stdout.flush()
+    def count_rising_edges(self, df, freq="60min", origin="start_day"):
+        return SharedUtils.count_rising_edges(df, freq, origin)
 
-        fc2 = None
-        if self.validate_config(
-            ["SUPPLY_VFD_SPEED_COL", "MAT_COL", "OAT_COL", "SAT_COL", "RAT_COL"]
-        ):
-            print("Info: Running fc2 Go!")
-            fc2 = FaultConditionTwo(config_dict)
-        else:
-            print("Info: Skipping fc2")
-
-        sys.stdout.flush()
+    def config_columns(self, config_dict):
+        return SharedUtils.config_columns(config_dict)
 
-        fc3 = None
-        if self.validate_config(
-            ["SUPPLY_VFD_SPEED_COL", "MAT_COL", "OAT_COL", "SAT_COL", "RAT_COL"]
-        ):
-            print("Info: Running fc3 Go!")
-            fc3 = FaultConditionThree(config_dict)
-        else:
-            print("Info: Skipping fc3")
-
-        sys.stdout.flush()
-
-        fc4 = None
-        if self.validate_config(
-            [
-                "SUPPLY_VFD_SPEED_COL",
-                "COOLING_SIG_COL",
-                "HEATING_SIG_COL",
-                "ECONOMIZER_SIG_COL",
-            ]
-        ):
-            print("Info: Running fc4 Go!")
-            fc4 = FaultConditionFour(config_dict)
-        else:
-            print("Info: Skipping fc4")
+    def sample_period(self, df):
+        return SharedUtils.sample_period(df)
 
-        sys.stdout.flush()
-
-        fc5 = None
-        if self.validate_config(
-            ["SUPPLY_VFD_SPEED_COL", "HEATING_SIG_COL", "SAT_COL", "MAT_COL"]
-        ):
-            print("Info: Running fc5 Go!")
-            fc5 = FaultConditionFive(config_dict)
-        else:
-            print("Info: Skipping fc5")
-
-        sys.stdout.flush()
-
-        fc6 = None
-        if self.validate_config(
-            [
-                "SUPPLY_VFD_SPEED_COL",
-                "COOLING_SIG_COL",
-                "HEATING_SIG_COL",
-                "ECONOMIZER_SIG_COL",
-                "SUPPLY_FAN_AIR_VOLUME_COL",
-            ]
-        ):
-            print("Info: Running fc6 Go!")
-            fc6 = FaultConditionSix(config_dict)
-        else:
-            print("Info: Skipping fc6")
-
-        sys.stdout.flush()
-
-        fc7 = None
-        if self.validate_config(
-            ["SUPPLY_VFD_SPEED_COL", "SAT_COL", "SAT_SETPOINT_COL", "HEATING_SIG_COL"]
-        ):
-            print("Info: Running fc7 Go!")
-            fc7 = FaultConditionSeven(config_dict)
-        else:
-            print("Info: Skipping fc7")
-
-        sys.stdout.flush()
-
-        fc8 = None
-        if self.validate_config(
-            [
-                "COOLING_SIG_COL",
-                "ECONOMIZER_SIG_COL",
-                "MAT_COL",
-                "SUPPLY_VFD_SPEED_COL",
-                "SAT_COL",
-            ]
-        ):
-            print("Info: Running fc8 Go!")
-            fc8 = FaultConditionEight(config_dict)
-        else:
-            print("Info: Skipping fc8")
-
-        sys.stdout.flush()
-
-        fc9 = None
-        if self.validate_config(
-            [
-                "OAT_COL",
-                "SUPPLY_VFD_SPEED_COL",
-                "SAT_COL",
-                "SAT_SETPOINT_COL",
-                "COOLING_SIG_COL",
-                "ECONOMIZER_SIG_COL",
-            ]
-        ):
-            print("Info: Running fc9 Go!")
-            fc9 = FaultConditionNine(config_dict)
-        else:
-            print("Info: Skipping fc9")
-
-        sys.stdout.flush()
-
-        fc10 = None
-        if self.validate_config(
-            [
-                "MAT_COL",
-                "OAT_COL",
-                "SUPPLY_VFD_SPEED_COL",
-                "COOLING_SIG_COL",
-                "ECONOMIZER_SIG_COL",
-            ]
-        ):
-            print("Info: Running fc10 Go!")
-            fc10 = FaultConditionTen(config_dict)
-        else:
-            print("Info: Skipping fc10")
-
-        sys.stdout.flush()
-
-        fc11 = None
-        if self.validate_config(
-            [
-                "OAT_COL",
-                "SUPPLY_VFD_SPEED_COL",
-                "COOLING_SIG_COL",
-                "ECONOMIZER_SIG_COL",
-                "SAT_SETPOINT_COL",
-            ]
-        ):
-            print("Info: Running fc11 Go!")
-            fc11 = FaultConditionEleven(config_dict)
-        else:
-            print("Info: Skipping fc11")
-
-        sys.stdout.flush()
-
-        fc12 = None
-        if self.validate_config(
-            [
-                "SUPPLY_VFD_SPEED_COL",
-                "ECONOMIZER_SIG_COL",
-                "COOLING_SIG_COL",
-                "SAT_COL",
-                "MAT_COL",
-            ]
-        ):
-            print("Info: Running fc12 Go!")
-            fc12 = FaultConditionTwelve(config_dict)
-        else:
-            print("Info: Skipping fc12")
-
-        sys.stdout.flush()
-
-        fc13 = None
-        if self.validate_config(
-            [
-                "SUPPLY_VFD_SPEED_COL",
-                "ECONOMIZER_SIG_COL",
-                "COOLING_SIG_COL",
-                "SAT_SETPOINT_COL",
-                "SAT_COL",
-            ]
-        ):
-            print("Info: Running fc13 Go!")
-            fc13 = FaultConditionThirteen(config_dict)
-        else:
-            print("Info: Skipping fc13")
-
-        sys.stdout.flush()
-
-        fc14 = None
-        if (
-            config_dict.get("COOLING_SIG_COL") is not None
-            and config_dict.get("CLG_COIL_LEAVE_TEMP_COL") is not None
-        ):
-            print("Info: Running fc14 Go!")
-            fc14 = FaultConditionFourteen(config_dict)
-        else:
-            print("Info: Skipping fc14")
-
-        sys.stdout.flush()
-
-        fc15 = None
-        if (
-            config_dict.get("HTG_COIL_ENTER_TEMP_COL") is not None
-            and config_dict.get("HTG_COIL_LEAVE_TEMP_COL") is not None
-        ):
-            print("Info: Running fc15 Go!")
-            fc15 = FaultConditionFifteen(config_dict)
-        else:
-            print("Info: Skipping fc15")
-
-        sys.stdout.flush()
-
-        # Apply fault conditions and calculate fault counts
-        df_fc1 = fc1.apply(df.copy()) if fc1 is not None else None
-        if df_fc1 is not None:
-            fault_counts["fc1_fault_sum"] = df_fc1["fc1_flag"].sum()
-
-        df_fc2 = fc2.apply(df.copy()) if fc2 is not None else None
-        if df_fc2 is not None:
-            fault_counts["fc2_fault_sum"] = df_fc2["fc2_flag"].sum()
-
-        df_fc3 = fc3.apply(df.copy()) if fc3 is not None else None
-        if df_fc3 is not None:
-            fault_counts["fc3_fault_sum"] = df_fc3["fc3_flag"].sum()
-
-        df_fc4 = fc4.apply(df.copy()) if fc4 is not None else pd.DataFrame()
-        if not df_fc4.empty:
-            fault_counts["fc4_fault_sum"] = df_fc4["fc4_flag"].sum()
-
-        df_fc5 = fc5.apply(df.copy()) if fc5 is not None else None
-        if df_fc5 is not None:
-            fault_counts["fc5_fault_sum"] = df_fc5["fc5_flag"].sum()
-
-        df_fc6 = fc6.apply(df.copy()) if fc6 is not None else None
-        if df_fc6 is not None:
-            fault_counts["fc6_fault_sum"] = df_fc6["fc6_flag"].sum()
-
-        df_fc7 = fc7.apply(df.copy()) if fc7 is not None else None
-        if df_fc7 is not None:
-            fault_counts["fc7_fault_sum"] = df_fc7["fc7_flag"].sum()
-
-        df_fc8 = fc8.apply(df.copy()) if fc8 is not None else None
-        if df_fc8 is not None:
-            fault_counts["fc8_fault_sum"] = df_fc8["fc8_flag"].sum()
-
-        df_fc9 = fc9.apply(df.copy()) if fc9 is not None else None
-        if df_fc9 is not None:
-            fault_counts["fc9_fault_sum"] = df_fc9["fc9_flag"].sum()
-
-        df_fc10 = fc10.apply(df.copy()) if fc10 is not None else None
-        if df_fc10 is not None:
-            fault_counts["fc10_fault_sum"] = df_fc10["fc10_flag"].sum()
-
-        df_fc11 = fc11.apply(df.copy()) if fc11 is not None else None
-        if df_fc11 is not None:
-            fault_counts["fc11_fault_sum"] = df_fc11["fc11_flag"].sum()
+    def apply_rolling_average_if_needed(
+        self,
+        df,
+        freq="1min",
+        rolling_window="5min",
+        columns=None,
+        logger=None,
+        sampling=None,
+    ):
+        return SharedUtils.apply_rolling_average_if_needed(
+            df, freq, rolling_window, columns, logger, sampling
+        )
 
-        df_fc12 = fc12.apply(df.copy()) if fc12 is not None else None
-        if df_fc12 is not None:
-            fault_counts["fc12_fault_sum"] = df_fc12["fc12_flag"].sum()
+    def validate_config(self, required_columns):
+        """
+        Check if all required columns are present and not None in the config dictionary.
+        """
+        if not self.config_dict:
+            raise ValueError("Config dictionary is not set.")
+        return all(self.config_dict.get(col) is not None for col in required_columns)
 
-        df_fc13 = fc13.apply(df.copy()) if fc13 is not None else None
-        if df_fc13 is not None:
-            fault_counts["fc13_fault_sum"] = df_fc13["fc13_flag"].sum()
+    def build_fault_conditions(self, config_dict, registry=None):
+        """Initialize the fault conditions enabled by ``config_dict``.
 
-        df_fc14 = fc14.apply(df.copy()) if fc14 is not None else None
-        if df_fc14 is not None:
-            fault_counts["fc14_fault_sum"] = df_fc14["fc14_flag"].sum()
+        Iterates ``registry``, by default the fc1 to fc15 rules in
+        ``fault_registry.FAULT_REGISTRY``, and returns a list of
+        ``(name, fault_condition)`` pairs where the fault condition is None
+        when its columns are not configured.
+        """
+        # Set the config dictionary
+        self.set_config_dict(config_dict)
 
-        df_fc15 = fc15.apply(df.copy()) if fc15 is not None else None
-        if df_fc15 is not None:
-            fault_counts["fc15_fault_sum"] = df_fc15["fc15_flag"].sum()
+        from open_fdd.air_handling_unit.faults.fault_registry import FAULT_REGISTRY
 
-        # Combine fault condition results
-        df_combined = df_fc1.copy() if df_fc1 is not None else df.copy()
+        if registry is None:
+            registry = FAULT_REGISTRY
 
-        if df_fc2 is not None:
-            df_combined["fc2_flag"] = df_fc2["fc2_flag"]
+        fault_conditions = []
+        for spec in registry:
+            fc = None
+            if self.validate_config(spec.enabled_by):
+                print(f"Info: Running {spec.name} Go!")
+                fc = spec.build(config_dict)
+            else:
+                print(f"Info: Skipping {spec.name}")
 
-        if df_fc3 is not None:
-            df_combined["fc3_flag"] = df_fc3["fc3_flag"]
+            sys.stdout.flush()
+            fault_conditions.append((spec.name, fc))
 
-        # Skip combining df_fc4 since it is resampled
+        return fault_conditions
 
-        if df_fc5 is not None:
-            df_combined["fc5_flag"] = df_fc5["fc5_flag"]
+    def process_all_faults(
+        self, df, config_dict, fused=False, compact=False, registry=None, metrics=None
+    ):
+        """Run every fault condition enabled by ``config_dict`` on ``df``.
 
-        if df_fc6 is not None:
-            df_combined["fc6_flag"] = df_fc6["fc6_flag"]
+        With ``fused=True`` the faults are evaluated by the single-pass
+        engine in ``run_fused_engine`` instead of one ``df.copy()`` per
+        fault; the returned flags are identical either way.
 
-        if df_fc7 is not None:
-            df_combined["fc7_flag"] = df_fc7["fc7_flag"]
+        With ``compact=True`` the sensor columns are downcast to float32
+        first and the flag columns are returned as uint8.
 
-        if df_fc8 is not None:
-            df_combined["fc8_flag"] = df_fc8["fc8_flag"]
+        ``registry`` is a ``FaultRegistry`` of the rules to run, by default
+        fc1 to fc15.
 
-        if df_fc9 is not None:
-            df_combined["fc9_flag"] = df_fc9["fc9_flag"]
+        ``metrics`` is an optional ``MetricsRecorder`` that gets one record
+        per fault and one for the whole run, whose fault is "all". The
+        flags of the run are the flagged samples of every fault but FC4,
+        which counts hours and has its own record.
+        """
+        if metrics is None:
+            run = contextlib.nullcontext(FaultMetrics("all", "process_all_faults", 0))
+        else:
+            run = metrics.measure("all", len(df), "process_all_faults")
+
+        with run as run_metrics:
+            result = self._process_all_faults(
+                df, config_dict, fused, compact, registry, metrics
+            )
+            fault_counts_df = result[2]
+            run_metrics.flags = int(
+                fault_counts_df.loc[
+                    fault_counts_df["Fault Condition"] != "fc4_fault_sum", "Count"
+                ].sum()
+            )
+        return result
+
+    def _process_all_faults(self, df, config_dict, fused, compact, registry, metrics):
+        if compact:
+            df = self.compact_dtypes(df)
+
+        fault_conditions = self.build_fault_conditions(config_dict, registry)
 
-        if df_fc10 is not None:
-            df_combined["fc10_flag"] = df_fc10["fc10_flag"]
+        fault_counts = {}
 
-        if df_fc11 is not None:
-            df_combined["fc11_flag"] = df_fc11["fc11_flag"]
+        # Apply rolling average if needed
+        df = self.apply_rolling_average_if_needed(
+            df,
+            columns=[
+                col for col in self.config_columns(config_dict) if col in df.columns
+            ],
+        )
 
-        if df_fc12 is not None:
-            df_combined["fc12_flag"] = df_fc12["fc12_flag"]
+        if fused:
+            return self.run_fused_engine(
+                df,
+                [(name, fc) for name, fc in fault_conditions if fc is not None],
+                flag_dtype=np.uint8 if compact else int,
+                metrics=metrics,
+            )
+
+        # Apply fault conditions and calculate fault counts. evaluate() only
+        # reads df, so the faults share it instead of each taking a copy.
+        df_combined = df.copy()
+        df_fc4 = pd.DataFrame()
+        for name, fc in fault_conditions:
+            if fc is None:
+                continue
+            flag_col = f"{name}_flag"
+            fc.metrics = metrics
+            try:
+                # Skip combining df_fc4 since it is resampled
+                if name == "fc4":
+                    df_fc4 = fc.apply(df.copy(deep=False))
+                else:
+                    with fc.measure(df) as fault_metrics:
+                        df_combined[flag_col] = fault_metrics.flags = fc.evaluate(df)
+            finally:
+                fc.metrics = None
+
+            if name == "fc4":
+                if not df_fc4.empty:
+                    fault_counts[f"{name}_fault_sum"] = df_fc4[flag_col].sum()
+                continue
+
+            fault_counts[f"{name}_fault_sum"] = df_combined[flag_col].sum()
+
+        if compact:
+            df_combined = self.compact_dtypes(df_combined)
 
-        if df_fc13 is not None:
-            df_combined["fc13_flag"] = df_fc13["fc13_flag"]
+        # Save fault counts to CSV
+        fault_counts_df = pd.DataFrame(
+            list(fault_counts.items()), columns=["Fault Condition", "Count"]
+        )
 
-        if df_fc14 is not None:
-            df_combined["fc14_flag"] = df_fc14["fc14_flag"]
+        return df_combined, df_fc4, fault_counts_df
 
-        if df_fc15 is not None:
-            df_combined["fc15_flag"] = df_fc15["fc15_flag"]
+    def run_fused_engine(self, df, fault_conditions, flag_dtype=int, metrics=None):
+        """Evaluate all fault conditions against one shared view of ``df``.
+
+        Each fault reads ``df`` through ``evaluate``, which returns its flag
+        Series without writing to the frame, so the input is never copied
+        per fault. Only the ``fcN_flag`` results are kept and they are
+        written into one preallocated block that becomes the flag columns of
+        the combined frame. Masks shared between faults are computed once
+        through an ``ExpressionCache`` attached for the duration of the run.
+
+        ``fault_conditions`` is a list of ``(name, fault_condition)`` pairs.
+        ``flag_dtype`` is the dtype of the flag block, e.g. np.uint8.
+        ``metrics`` is an optional ``MetricsRecorder`` attached to every
+        fault for the run.
+        Returns the same ``(df_combined, df_fc4, fault_counts_df)`` tuple as
+        ``process_all_faults``.
+        """
+        fault_counts = {}
+        df_fc4 = pd.DataFrame()
+
+        # FC4 is resampled hourly so it is kept out of the combined frame
+        flag_names = [f"{name}_flag" for name, _ in fault_conditions if name != "fc4"]
+        flags = np.zeros((len(df), len(flag_names)), dtype=flag_dtype)
+
+        expression_cache = ExpressionCache(df)
+
+        position = 0
+        for name, fc in fault_conditions:
+            flag_col = f"{name}_flag"
+            fc.expression_cache = expression_cache
+            fc.metrics = metrics
+            try:
+                if name == "fc4":
+                    df_fc4 = fc.apply(df.copy(deep=False))
+                else:
+                    with fc.measure(df) as fault_metrics:
+                        result = fault_metrics.flags = fc.evaluate(df)
+            finally:
+                fc.expression_cache = None
+                fc.metrics = None
+
+            if name == "fc4":
+                if not df_fc4.empty:
+                    fault_counts[f"{name}_fault_sum"] = df_fc4[flag_col].sum()
+                continue
+
+            # A registry rule may flag fewer rows, e.g. after dropping some;
+            # align it to df like the column assignment of the copy path
+            flags[:, position] = result.reindex(df.index).fillna(0).to_numpy()
+            fault_counts[f"{name}_fault_sum"] = int(flags[:, position].sum())
+            position += 1
+
+        df_flags = pd.DataFrame(flags, index=df.index, columns=flag_names)
+        df_combined = pd.concat([df, df_flags], axis=1)
 
-        # Save fault counts to CSV
         fault_counts_df = pd.DataFrame(
             list(fault_counts.items()), columns=["Fault Condition", "Count"]
         )
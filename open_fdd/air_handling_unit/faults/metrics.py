@@ -0,0 +1,194 @@
+import contextlib
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+
+class FaultMetrics:
+    """Measurements of one run of one fault condition.
+
+    ``stage`` says what was measured: "evaluate", "apply", "update" or
+    "process_all_faults" for a whole run, whose ``fault`` is "all".
+    ``peak_bytes`` is the peak memory allocated above what was in use
+    when the run started, or None when memory is not tracked.
+    """
+
+    FIELDS = ["unit", "fault", "stage", "rows", "seconds", "flags", "peak_bytes"]
+
+    def __init__(self, fault, stage, rows, unit=None):
+        self.unit = unit
+        self.fault = fault
+        self.stage = stage
+        self.rows = rows
+        self.seconds = None
+        self.flags = None
+        self.peak_bytes = None
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        values = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"FaultMetrics({values})"
+
+
+class MetricsRecorder:
+    """Collects wall time, rows, flag counts and optionally peak memory per
+    fault per run.
+
+    Attach a recorder to a fault condition with ``fc.metrics = recorder``
+    or pass it to ``process_all_faults(..., metrics=recorder)``, which
+    attaches it to every fault of the run.
+
+    recorder = MetricsRecorder(unit="AHU1", track_memory=True)
+    HelperUtils().process_all_faults(df, config_dict, metrics=recorder)
+    recorder.to_frame()
+    recorder.to_openmetrics()
+
+    ``track_memory`` uses tracemalloc, which slows allocation heavy code
+    down, so it is off by default.
+    """
+
+    def __init__(self, unit=None, track_memory=False):
+        self.unit = unit
+        self.track_memory = track_memory
+        self.records = []
+        # Peak bytes seen by the measurements still open, outermost first
+        self._open_peaks = []
+
+    @contextlib.contextmanager
+    def measure(self, fault, rows, stage="evaluate"):
+        """Times the block and appends its FaultMetrics to ``records``.
+
+        The block sets ``metrics.flags`` on the yielded object to the flag
+        Series (or flag count) it produced. Measurements can be nested, a
+        whole run around each of its faults.
+        """
+        metrics = FaultMetrics(fault, stage, rows, self.unit)
+        tracing = self.track_memory and self._start_tracing()
+        start = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            metrics.seconds = time.perf_counter() - start
+            if tracing:
+                metrics.peak_bytes = self._stop_tracing()
+            metrics.flags = self.count_flags(metrics.flags)
+            self.records.append(metrics)
+
+    def _start_tracing(self) -> bool:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        elif not self._open_peaks:
+            self._started_tracing = False
+
+        current, peak = tracemalloc.get_traced_memory()
+        if self._open_peaks:
+            # reset_peak is global, keep what the outer measurement saw
+            self._open_peaks[-1][1] = max(self._open_peaks[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._open_peaks.append([current, current])
+        return True
+
+    def _stop_tracing(self) -> int:
+        _, peak = tracemalloc.get_traced_memory()
+        start, seen = self._open_peaks.pop()
+        peak = max(peak, seen)
+        if self._open_peaks:
+            self._open_peaks[-1][1] = max(self._open_peaks[-1][1], peak)
+        elif self._started_tracing:
+            tracemalloc.stop()
+        return peak - start
+
+    @staticmethod
+    def count_flags(flags):
+        """Number of flagged samples in a flag Series or array."""
+        if flags is None or isinstance(flags, (int, np.integer)):
+            return None if flags is None else int(flags)
+        return int(np.count_nonzero(np.asarray(flags) == 1))
+
+    def extend(self, records):
+        """Adds records measured elsewhere, e.g. in a worker process."""
+        self.records.extend(records)
+
+    def clear(self):
+        self.records = []
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per measurement, in the order they finished."""
+        return pd.DataFrame(
+            [metrics.to_dict() for metrics in self.records],
+            columns=FaultMetrics.FIELDS,
+        )
+
+    def to_openmetrics(self, prefix="open_fdd") -> str:
+        """Returns the records as OpenMetrics text, the format Prometheus
+        scrapes.
+
+        Runs of the same unit, fault and stage are added up into the
+        counters ``<prefix>_fault_runs``, ``<prefix>_fault_seconds``,
+        ``<prefix>_fault_rows`` and ``<prefix>_fault_flags``. The gauge
+        ``<prefix>_fault_peak_bytes`` holds the largest peak of those runs
+        when memory is tracked.
+        """
+        totals = {}
+        for metrics in self.records:
+            labels = (metrics.unit, metrics.fault, metrics.stage)
+            total = totals.setdefault(
+                labels, {"runs": 0, "seconds": 0.0, "rows": 0, "flags": 0}
+            )
+            total["runs"] += 1
+            total["seconds"] += metrics.seconds
+            total["rows"] += metrics.rows
+            total["flags"] += metrics.flags or 0
+            if metrics.peak_bytes is not None:
+                total["peak_bytes"] = max(
+                    total.get("peak_bytes", 0), metrics.peak_bytes
+                )
+
+        families = [
+            ("runs", "counter", None, "Runs of the fault condition."),
+            (
+                "seconds",
+                "counter",
+                "seconds",
+                "Wall time spent in the fault condition.",
+            ),
+            ("rows", "counter", None, "Samples evaluated by the fault condition."),
+            ("flags", "counter", None, "Samples flagged by the fault condition."),
+            ("peak_bytes", "gauge", "bytes", "Peak memory allocated by a run."),
+        ]
+
+        lines = []
+        for key, kind, unit, description in families:
+            name = f"{prefix}_fault_{key}"
+            samples = [
+                (labels, total[key]) for labels, total in totals.items() if key in total
+            ]
+            if not samples:
+                continue
+            lines.append(f"# TYPE {name} {kind}")
+            if unit is not None:
+                lines.append(f"# UNIT {name} {unit}")
+            lines.append(f"# HELP {name} {description}")
+            suffix = "_total" if kind == "counter" else ""
+            for (ahu, fault, stage), value in samples:
+                label_text = ",".join(
+                    f'{label}="{self.escape(label_value)}"'
+                    for label, label_value in [
+                        ("unit", ahu),
+                        ("fault", fault),
+                        ("stage", stage),
+                    ]
+                    if label_value is not None
+                )
+                lines.append(f"{name}{suffix}{{{label_text}}} {value}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
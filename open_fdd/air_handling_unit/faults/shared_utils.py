@@ -1,6 +1,15 @@
 import pandas as pd
 import pandas.api.types as pdtypes
+import numpy as np
+import logging
 import sys
+import weakref
+
+LOGGER = logging.getLogger(__name__)
+
+# id() of each index whose sample period is cached, mapped to a weak
+# reference so a recycled id is never mistaken for the measured index
+_MEASURED_INDEXES = {}
 
 
 class SharedUtils:
@@ -42,49 +51,374 @@ class SharedUtils:
         return df
 
     @staticmethod
-    def apply_rolling_average_if_needed(df, freq="1min", rolling_window="5min"):
-        """Apply rolling average if time difference between consecutive
-        timestamps is not greater than the specified frequency.
+    def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """Returns a copy of ``df`` with float64 sensor columns as float32.
+
+        Thresholds from the config are Python floats, which numpy compares
+        at the column's precision, so ``df[col] == 0.2`` still holds for a
+        float32 column. ``*_flag`` columns are stored as uint8.
         """
+        dtypes = {}
+        for col in df.columns:
+            if str(col).endswith("_flag"):
+                dtypes[col] = np.uint8
+            elif df[col].dtype == np.float64:
+                dtypes[col] = np.float32
+        return df.astype(dtypes)
 
-        print(
-            "Warning: If data has a one minute or less sampling \n"
-            "frequency a rolling average will be automatically applied"
+    @staticmethod
+    def pack_flags(flags) -> np.ndarray:
+        """Bit-packs a 0/1 flag column, eight samples per byte."""
+        return np.packbits(np.asarray(flags, dtype=bool))
+
+    @staticmethod
+    def unpack_flags(packed, length) -> np.ndarray:
+        """Reverses pack_flags, returning ``length`` uint8 flags."""
+        return np.unpackbits(packed, count=length)
+
+    @staticmethod
+    def run_lengths(mask, initial=0) -> np.ndarray:
+        """Length of the run of consecutive trues ending at each sample.
+
+        Computed in O(n) with a cumulative max over the positions of the
+        last false value. NaN and missing values count as false, which is
+        how a rolling sum over the mask treats them. ``initial`` is the
+        length of the run still open at the end of the previous chunk.
+        """
+        mask = pd.Series(mask) if not isinstance(mask, pd.Series) else mask
+        if pdtypes.is_bool_dtype(mask):
+            values = mask.to_numpy(dtype=bool, na_value=False)
+        else:
+            values = mask.eq(1).to_numpy(dtype=bool, na_value=False)
+
+        # int32 halves the memory traffic whenever the row count allows it
+        dtype = np.int32 if values.size < np.iinfo(np.int32).max else np.int64
+        positions = np.arange(1, values.size + 1, dtype=dtype)
+        last_false = np.where(values, 0, positions)
+        np.maximum.accumulate(last_false, out=last_false)
+        runs = np.subtract(positions, last_false, out=positions)
+        if initial:
+            # Leading trues extend the run carried over from the last chunk
+            runs[last_false == 0] += initial
+        return runs
+
+    @staticmethod
+    def flag_edges(flags):
+        """Returns ``(starts, stops)``, the positions where each run of 1s
+        in ``flags`` begins and the positions just past where it ends.
+
+        The edges come from one diff over the padded 0/1 array. NaN and
+        missing values count as 0.
+        """
+        flags = pd.Series(flags) if not isinstance(flags, pd.Series) else flags
+        values = flags.eq(1).to_numpy(dtype=np.int8, na_value=0)
+        edges = np.diff(values, prepend=np.int8(0), append=np.int8(0))
+        return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+    @staticmethod
+    def check_window(window):
+        if isinstance(window, bool) or not isinstance(window, (int, np.integer)):
+            raise ValueError("window must be an integer 0 or greater")
+        if window < 0:
+            raise ValueError("window must be an integer 0 or greater")
+
+    @staticmethod
+    def consecutive_true_flags(mask, window) -> pd.Series:
+        """Flag (1/0) samples that close a run of ``window`` consecutive
+        trues. Gives the same result as
+        ``(mask.rolling(window).sum() == window).astype(int)``.
+        """
+        SharedUtils.check_window(window)
+
+        index = mask.index if isinstance(mask, pd.Series) else None
+        flags = SharedUtils.run_lengths(mask) >= window
+        return pd.Series(flags.astype(int), index=index)
+
+    @staticmethod
+    def count_rising_edges(
+        df: pd.DataFrame, freq="60min", origin="start_day"
+    ) -> pd.DataFrame:
+        """Count the 0 to 1 transitions of every column in each ``freq``
+        bucket. Gives the same result as
+        ``df.resample(freq).apply(lambda x: (x.eq(1) & x.shift().ne(1)).sum())``
+        where the first sample of a bucket counts if it is 1.
+
+        The edges are found once over the whole array and summed with a
+        single resample instead of calling a lambda per bucket and column.
+        ``origin`` is passed to the resample to pin the bucket edges.
+        """
+        # Calendar offsets like "1D" always start their buckets on the calendar
+        if not isinstance(pd.tseries.frequencies.to_offset(freq), pd.offsets.Tick):
+            origin = "start_day"
+
+        is_one = df.to_numpy() == 1
+
+        # A sample starts a new bucket when its bucket differs from the last one
+        bucket = df.groupby(pd.Grouper(freq=freq, origin=origin)).ngroup().to_numpy()
+        bucket_start = np.ones(len(df), dtype=bool)
+        bucket_start[1:] = bucket[1:] != bucket[:-1]
+
+        prev_is_one = np.zeros_like(is_one)
+        prev_is_one[1:] = is_one[:-1]
+        rising = is_one & (bucket_start[:, None] | ~prev_is_one)
+
+        return (
+            pd.DataFrame(rising, index=df.index, columns=df.columns)
+            .resample(freq, origin=origin)
+            .sum()
         )
 
-        sys.stdout.flush()
+    @staticmethod
+    def config_columns(config_dict) -> list:
+        """Returns the data columns a config dict maps, from its *_COL keys."""
+        columns = []
+        for key, value in config_dict.items():
+            if key.endswith("_COL") and isinstance(value, str) and value not in columns:
+                columns.append(value)
+        return columns
 
-        time_diff = df.index.to_series().diff().iloc[1:]
+    @staticmethod
+    def sample_period(df: pd.DataFrame) -> dict:
+        """Returns ``{"period": median step, "regular": evenly spaced}`` for
+        the DatetimeIndex of ``df``.
 
-        # Calculate median time difference to avoid being affected by outliers
-        median_diff = time_diff.median()
+        The measurement is cached in ``df.attrs["sample_period"]`` with the
+        ``id`` of the index object it was taken on, so later calls on the
+        same frame skip the diff. The cache is trusted only while that exact
+        index object is alive; frames that inherit the attrs, e.g. through
+        ``iloc`` or ``set_axis``, hold a new index and are measured again.
+        The cache holds only ints and bools so the attrs still serialize,
+        e.g. to Parquet.
+        """
+        index = df.index
+        key = id(index)
+        measured = _MEASURED_INDEXES.get(key)
 
-        print(
-            f"Warning: Median time difference between consecutive timestamps is {median_diff}."
+        cached = df.attrs.get("sample_period")
+        if (
+            cached is None
+            or cached["key"] != key
+            or measured is None
+            or measured() is not index
+        ):
+            times = index.asi8
+            if len(times) < 2:
+                period_ns, regular = None, True
+            else:
+                steps = np.diff(times)
+                period_ns = int(
+                    pd.Timedelta(int(np.median(steps)), unit=index.unit).value
+                )
+                regular = bool((steps == steps[0]).all())
+            cached = {"key": key, "period_ns": period_ns, "regular": regular}
+            df.attrs["sample_period"] = cached
+            _MEASURED_INDEXES[key] = weakref.ref(
+                index, lambda ref, key=key: _MEASURED_INDEXES.pop(key, None)
+            )
+
+        period = (
+            pd.NaT if cached["period_ns"] is None else pd.Timedelta(cached["period_ns"])
         )
-        sys.stdout.flush()
+        return {"period": period, "regular": cached["regular"]}
+
+    @staticmethod
+    def apply_rolling_average_if_needed(
+        df, freq="1min", rolling_window="5min", columns=None, logger=None, sampling=None
+    ):
+        """Apply rolling average if time difference between consecutive
+        timestamps is not greater than the specified frequency.
 
-        if median_diff > pd.Timedelta(freq):
-            print(f"Warning: Skipping any rolling averaging...")
-            sys.stdout.flush()
+        Only ``columns`` are smoothed, by default every numeric column that
+        is not a ``*_flag``. The mean is ``df[columns].rolling(rolling_window).mean()``;
+        on a regular grid the same window is taken as a fixed number of
+        samples, which gives identical values, including exact constants
+        over a held signal. The sample period is cached on the frame, see
+        ``sample_period``. When ``df`` is one piece of a longer series,
+        pass the ``sampling`` of the whole series so every piece is smoothed
+        the same way. Messages go to ``logger``, a ``logging.Logger``, which
+        defaults to this module's logger.
+        """
+        logger = logger or LOGGER
 
+        if columns is None:
+            columns = [
+                col
+                for col in df.columns
+                if pdtypes.is_numeric_dtype(df[col])
+                and not pdtypes.is_bool_dtype(df[col])
+                and not str(col).endswith("_flag")
+            ]
         else:
-            df = df.rolling(rolling_window).mean()
-            print(
-                f"Warning: A {rolling_window} rolling average has been applied to the data."
+            columns = list(columns)
+
+        if sampling is None:
+            sampling = SharedUtils.sample_period(df)
+        period = sampling["period"]
+        if not columns or pd.isna(period) or period > pd.Timedelta(freq):
+            logger.info(
+                "Median sample period is %s, skipping any rolling averaging", period
             )
-            sys.stdout.flush()
+            return df
+
+        if sampling["regular"]:
+            # A time window (t - rolling_window, t] holds this many samples.
+            # The fixed window runs the same kernel without the time lookups.
+            window = -(-pd.Timedelta(rolling_window) // period)
+            rolled = df[columns].rolling(window, min_periods=1).mean()
+        else:
+            rolled = df[columns].rolling(rolling_window).mean()
+        smoothed = {col: rolled[col].to_numpy() for col in columns}
+
+        df = df.copy(deep=False)
+        for col in columns:
+            # float32 columns stay float32, anything else becomes float64
+            dtype = df[col].dtype if pdtypes.is_float_dtype(df[col]) else float
+            df[col] = smoothed[col].astype(dtype)
+
+        logger.info(
+            "Median sample period is %s, applied a %s rolling average to %d columns",
+            period,
+            rolling_window,
+            len(columns),
+        )
         return df
 
     @staticmethod
     def clean_nan_values(df: pd.DataFrame) -> pd.DataFrame:
-        for col in df.columns:
-            if df[col].isnull().any():
-                print(f"NaN values found in column: {col}")
-
-                # Remove rows with any NaN values, then forward and backfill
-                df = df.dropna().ffill().bfill()
-                print("DataFrame has been cleaned for NaNs")
-                print("and has also been forward and backfilled.")
-                sys.stdout.flush()
+        """Drops every row that has a NaN in any column.
+
+        The NaN mask is computed once for the whole frame; rows are only
+        dropped, the forward and backfill that used to follow found
+        nothing left to fill.
+        """
+        missing = df.isna().to_numpy()
+        dirty_rows = missing.any(axis=1)
+        if not dirty_rows.any():
+            return df
+
+        col = df.columns[missing.any(axis=0).argmax()]
+        print(f"NaN values found in column: {col}")
+        df = df[~dirty_rows]
+        print(
+            f"DataFrame has been cleaned for NaNs, {int(dirty_rows.sum())} rows dropped."
+        )
+        print("Use fill_gaps to fill short gaps instead of dropping them.")
+        sys.stdout.flush()
         return df
+
+    @staticmethod
+    def gap_lengths(missing: np.ndarray) -> np.ndarray:
+        """Length of the NaN gap each missing sample belongs to, 0 where a
+        sample is present, for a 2D (samples, columns) NaN mask."""
+        positions = np.arange(len(missing), dtype=np.int32)[:, None]
+        last_present = np.maximum.accumulate(np.where(missing, -1, positions), axis=0)
+        next_present = np.minimum.accumulate(
+            np.where(missing, len(missing), positions)[::-1], axis=0
+        )[::-1]
+        return np.where(missing, next_present - last_present - 1, 0)
+
+    @staticmethod
+    def fill_gaps(df: pd.DataFrame, strategy=None, max_gap=None, default="drop"):
+        """Fills NaN gaps column by column and drops the rows left with NaN.
+
+        ``strategy`` maps a column to "ffill", "interpolate" (linear in
+        time, inside gaps only) or "drop"; other columns use ``default``.
+        ``max_gap`` is the longest gap, in samples, that gets filled, as an
+        int for every column or a dict per column; longer gaps are left
+        missing and their rows dropped. None fills gaps of any length.
+
+        The NaN mask and gap lengths are computed once for the whole frame
+        and every column with the same strategy is filled in one call. A
+        gap report is kept in ``df.attrs["gap_report"]`` of the returned
+        frame, see ``gap_report`` and ``gaps_filled``.
+        """
+        strategy = dict(strategy or {})
+        strategies = {col: strategy.get(col, default) for col in df.columns}
+        unknown = set(strategies.values()) - {"ffill", "interpolate", "drop"}
+        if unknown:
+            raise ValueError(
+                f"Unknown gap strategy {sorted(unknown)}, use 'ffill', 'interpolate' or 'drop'"
+            )
+
+        missing = df.isna().to_numpy()
+        dirty = np.flatnonzero(missing.any(axis=0))
+        lengths = SharedUtils.gap_lengths(missing[:, dirty])
+        gap_starts = missing[:, dirty].copy()
+        gap_starts[1:] &= ~missing[:-1, dirty]
+
+        limits = np.array(
+            [
+                (max_gap.get(df.columns[i]) if isinstance(max_gap, dict) else max_gap)
+                for i in dirty
+            ],
+            dtype=float,
+        )
+        limits = np.where(np.isnan(limits), np.inf, limits)
+        fillable = missing[:, dirty] & (lengths <= limits)
+
+        filled = df.copy(deep=False)
+        remaining = missing.copy()
+        for method in ("ffill", "interpolate"):
+            positions = [
+                position
+                for position, i in enumerate(dirty)
+                if strategies[df.columns[i]] == method
+            ]
+            if not positions:
+                continue
+            cols = list(df.columns[dirty[positions]])
+            if method == "ffill":
+                values = df[cols].ffill()
+            else:
+                values = df[cols].interpolate(method="time", limit_area="inside")
+
+            # Leading gaps have nothing before them to fill from
+            fill = fillable[:, positions] & values.notna().to_numpy()
+            filled[cols] = values.where(fill, df[cols])
+            remaining[:, dirty[positions]] &= ~fill
+
+        keep = ~remaining.any(axis=1)
+        if not keep.all():
+            filled = filled[keep]
+
+        report = {
+            str(col): {"missing": 0, "gaps": 0, "longest_gap": 0, "filled": 0}
+            for col in df.columns
+        }
+        for position, i in enumerate(dirty):
+            report[str(df.columns[i])] = {
+                "missing": int(missing[:, i].sum()),
+                "gaps": int(gap_starts[:, position].sum()),
+                "longest_gap": int(lengths[:, position].max()),
+                "filled": int((missing[:, i] & ~remaining[:, i]).sum()),
+            }
+
+        times = filled.index.asi8
+        filled.attrs["gap_report"] = {
+            "key": [len(times), int(times[0]), int(times[-1])] if len(times) else [0],
+            "rows_dropped": int((~keep).sum()),
+            "columns": report,
+        }
+        return filled
+
+    @staticmethod
+    def gap_report(df: pd.DataFrame) -> pd.DataFrame:
+        """Returns the gap report left by ``fill_gaps`` as a frame with one
+        row per column: missing samples, gaps, longest gap and filled."""
+        report = df.attrs.get("gap_report")
+        if report is None:
+            return pd.DataFrame(columns=["missing", "gaps", "longest_gap", "filled"])
+        return pd.DataFrame.from_dict(report["columns"], orient="index")
+
+    @staticmethod
+    def gaps_filled(df: pd.DataFrame, columns) -> bool:
+        """True if ``fill_gaps`` produced ``df`` and covered ``columns``, so
+        there are no NaN values left to clean in them."""
+        report = df.attrs.get("gap_report")
+        if report is None:
+            return False
+        times = df.index.asi8
+        key = [len(times), int(times[0]), int(times[-1])] if len(times) else [0]
+        return report["key"] == key and all(
+            str(col) in report["columns"] for col in columns
+        )
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 from open_fdd.air_handling_unit.reports.fault_report import BaseFaultReport
 from open_fdd.air_handling_unit.faults import FaultConditionSixteen
 import pandas as pd
@@ -7,6 +6,11 @@ import sys
 
 
 class FaultCodeOneReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_duct_static": "duct_static_col",
+        "flag_true_duct_static_spt": "duct_static_setpoint_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc1_flag")
         self.vfd_speed_percent_err_thres = config["VFD_SPEED_PERCENT_ERR_THRES"]
@@ -14,22 +18,19 @@ class FaultCodeOneReport(BaseFaultReport):
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
         self.duct_static_setpoint_col = config["DUCT_STATIC_SETPOINT_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3 = self.plot_axes(fig, 3)
         fig.suptitle("Fault Conditions 1 Plot")
-        ax1.plot(df.index, df[self.duct_static_col], label="STATIC")
+        self.plot_line(ax1, df[self.duct_static_col], label="STATIC")
         ax1.legend(loc="best")
         ax1.set_ylabel("Inch WC")
-        ax2.plot(df.index, df[self.supply_vfd_speed_col], color="g", label="FAN")
+        self.plot_line(ax2, df[self.supply_vfd_speed_col], color="g", label="FAN")
         ax2.legend(loc="best")
         ax2.set_ylabel("%")
-        ax3.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax3, df[self.fault_col], label="Fault", color="k")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("Fault Flags")
         ax3.legend(loc="best")
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
 
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
@@ -58,6 +59,12 @@ class FaultCodeOneReport(BaseFaultReport):
 
 
 class FaultCodeTwoReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_mat": "mat_col",
+        "flag_true_oat": "oat_col",
+        "flag_true_rat": "rat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc2_flag")
         self.mix_degf_err_thres = config["MIX_DEGF_ERR_THRES"]
@@ -68,25 +75,21 @@ class FaultCodeTwoReport(BaseFaultReport):
         self.oat_col = config["OAT_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2 = self.plot_axes(fig, 2)
         fig.suptitle("Fault Conditions 2 Plot")
 
-        ax1.plot(df.index, df[self.mat_col], color="r", label="Mix Temp")
-        ax1.plot(df.index, df[self.rat_col], color="b", label="Return Temp")
-        ax1.plot(df.index, df[self.oat_col], color="g", label="Out Temp")
+        self.plot_line(ax1, df[self.mat_col], color="r", label="Mix Temp")
+        self.plot_line(ax1, df[self.rat_col], color="b", label="Return Temp")
+        self.plot_line(ax1, df[self.oat_col], color="g", label="Out Temp")
         ax1.legend(loc="best")
         ax1.set_ylabel("°F")
 
-        ax2.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax2, df[self.fault_col], label="Fault", color="k")
         ax2.set_xlabel("Date")
         ax2.set_ylabel("Fault Flags")
         ax2.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -116,6 +119,12 @@ class FaultCodeTwoReport(BaseFaultReport):
 
 
 class FaultCodeThreeReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_mat": "mat_col",
+        "flag_true_oat": "oat_col",
+        "flag_true_rat": "rat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc3_flag")
         self.mix_degf_err_thres = config["MIX_DEGF_ERR_THRES"]
@@ -126,25 +135,21 @@ class FaultCodeThreeReport(BaseFaultReport):
         self.oat_col = config["OAT_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2 = self.plot_axes(fig, 2)
         fig.suptitle("Fault Conditions 3 Plot")
 
-        ax1.plot(df.index, df[self.mat_col], color="r", label="Mix Temp")
-        ax1.plot(df.index, df[self.rat_col], color="b", label="Return Temp")
-        ax1.plot(df.index, df[self.oat_col], color="g", label="Out Temp")
+        self.plot_line(ax1, df[self.mat_col], color="r", label="Mix Temp")
+        self.plot_line(ax1, df[self.rat_col], color="b", label="Return Temp")
+        self.plot_line(ax1, df[self.oat_col], color="g", label="Out Temp")
         ax1.legend(loc="best")
         ax1.set_ylabel("°F")
 
-        ax2.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax2, df[self.fault_col], label="Fault", color="k")
         ax2.set_xlabel("Date")
         ax2.set_ylabel("Fault Flags")
         ax2.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -174,6 +179,30 @@ class FaultCodeThreeReport(BaseFaultReport):
 
 
 class FaultCodeFourReport(BaseFaultReport):
+    layout_rect = None
+    summary_modes = [
+        (
+            "percent_of_time_AHU_in_mech_clg_mode",
+            "total_hours_mech_clg_mode",
+            "mech_cooling_only_mode_calc_col",
+        ),
+        (
+            "percent_of_time_AHU_in_econ_plus_mech_clg_mode",
+            "total_hours_econ_mech_clg_mode",
+            "econ_plus_mech_cooling_mode_calc_col",
+        ),
+        (
+            "percent_of_time_AHU_in_econ_free_clg_mode",
+            "total_hours_econ_mode",
+            "econ_only_cooling_mode_calc_col",
+        ),
+        (
+            "percent_of_time_AHU_in_heating_mode",
+            "total_hours_heating_mode",
+            "heating_mode_calc_col",
+        ),
+    ]
+
     def __init__(self, config):
         super().__init__(config, "fc4_flag")
         self.delta_os_max = config["DELTA_OS_MAX"]
@@ -182,25 +211,27 @@ class FaultCodeFourReport(BaseFaultReport):
         self.econ_plus_mech_cooling_mode_calc_col = "econ_plus_mech_cooling_mode"
         self.mech_cooling_only_mode_calc_col = "mech_cooling_only_mode"
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2 = self.plot_axes(fig, 2)
         fig.suptitle("Fault Condition 4 Plots")
 
-        ax1.plot(df.index, df[self.heating_mode_calc_col], label="Heat", color="orange")
-        ax1.plot(
-            df.index,
+        self.plot_line(
+            ax1, df[self.heating_mode_calc_col], label="Heat", color="orange"
+        )
+        self.plot_line(
+            ax1,
             df[self.econ_only_cooling_mode_calc_col],
             label="Econ Clg",
             color="olive",
         )
-        ax1.plot(
-            df.index,
+        self.plot_line(
+            ax1,
             df[self.econ_plus_mech_cooling_mode_calc_col],
             label="Econ + Mech Clg",
             color="c",
         )
-        ax1.plot(
-            df.index,
+        self.plot_line(
+            ax1,
             df[self.mech_cooling_only_mode_calc_col],
             label="Mech Clg",
             color="m",
@@ -209,15 +240,11 @@ class FaultCodeFourReport(BaseFaultReport):
         ax1.set_ylabel("Calculated AHU Operating States")
         ax1.legend(loc="best")
 
-        ax2.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax2, df[self.fault_col], label="Fault", color="k")
         ax2.set_xlabel("Date")
         ax2.set_ylabel("Fault Flags")
         ax2.legend(loc="best")
 
-        plt.tight_layout()
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -264,6 +291,11 @@ class FaultCodeFourReport(BaseFaultReport):
 
 
 class FaultCodeFiveReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_mat": "mat_col",
+        "flag_true_sat": "sat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc5_flag")
         self.mix_degf_err_thres = config["MIX_DEGF_ERR_THRES"]
@@ -274,29 +306,25 @@ class FaultCodeFiveReport(BaseFaultReport):
         self.heating_sig_col = config["HEATING_SIG_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3 = self.plot_axes(fig, 3)
         fig.suptitle("Fault Conditions 5 Plot")
 
-        ax1.plot(df.index, df[self.mat_col], color="g", label="Mix Temp")
-        ax1.plot(df.index, df[self.sat_col], color="b", label="Supply Temp")
+        self.plot_line(ax1, df[self.mat_col], color="g", label="Mix Temp")
+        self.plot_line(ax1, df[self.sat_col], color="b", label="Supply Temp")
         ax1.legend(loc="best")
         ax1.set_ylabel("°F")
 
-        ax2.plot(df.index, df[self.heating_sig_col], label="Htg Valve", color="r")
+        self.plot_line(ax2, df[self.heating_sig_col], label="Htg Valve", color="r")
         ax2.set_xlabel("Date")
         ax2.set_ylabel("%")
         ax2.legend(loc="best")
 
-        ax3.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax3, df[self.fault_col], label="Fault", color="k")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("Fault Flags")
         ax3.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -323,6 +351,12 @@ class FaultCodeFiveReport(BaseFaultReport):
 
 
 class FaultCodeSixReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_mat": "mat_col",
+        "flag_true_rat": "rat_col",
+        "flag_true_oat": "oat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc6_flag")
         self.supply_fan_air_volume_col = config["SUPPLY_FAN_AIR_VOLUME_COL"]
@@ -331,16 +365,16 @@ class FaultCodeSixReport(BaseFaultReport):
         self.rat_col = config["RAT_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(5, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3, ax4, ax5 = self.plot_axes(fig, 5)
         fig.suptitle("Fault Conditions 6 Plot")
 
-        ax1.plot(df.index, df["rat_minus_oat"], label="Rat Minus Oat")
+        self.plot_line(ax1, df["rat_minus_oat"], label="Rat Minus Oat")
         ax1.legend(loc="best")
         ax1.set_ylabel("°F")
 
-        ax2.plot(
-            df.index,
+        self.plot_line(
+            ax2,
             df[self.supply_fan_air_volume_col],
             label="Total Air Flow",
             color="r",
@@ -349,14 +383,14 @@ class FaultCodeSixReport(BaseFaultReport):
         ax2.set_ylabel("CFM")
         ax2.legend(loc="best")
 
-        ax3.plot(df.index, df["percent_oa_calc"], label="OA Frac Calc", color="m")
-        ax3.plot(df.index, df["perc_OAmin"], label="OA Perc Min Calc", color="y")
+        self.plot_line(ax3, df["percent_oa_calc"], label="OA Frac Calc", color="m")
+        self.plot_line(ax3, df["perc_OAmin"], label="OA Perc Min Calc", color="y")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("%")
         ax3.legend(loc="best")
 
-        ax4.plot(
-            df.index,
+        self.plot_line(
+            ax4,
             df["percent_oa_calc_minus_perc_OAmin"],
             label="OA Error Frac Vs Perc Min Calc",
             color="g",
@@ -365,15 +399,11 @@ class FaultCodeSixReport(BaseFaultReport):
         ax4.set_ylabel("%")
         ax4.legend(loc="best")
 
-        ax5.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax5, df[self.fault_col], label="Fault", color="k")
         ax5.set_xlabel("Date")
         ax5.set_ylabel("Fault Flags")
         ax5.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -403,6 +433,11 @@ class FaultCodeSixReport(BaseFaultReport):
 
 
 class FaultCodeSevenReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_satsp": "sat_setpoint_col",
+        "flag_true_sat": "sat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc7_flag")
         self.sat_col = config["SAT_COL"]
@@ -410,28 +445,24 @@ class FaultCodeSevenReport(BaseFaultReport):
         self.heating_sig_col = config["HEATING_SIG_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3 = self.plot_axes(fig, 3)
         fig.suptitle("Fault Conditions 7 Plot")
 
-        ax1.plot(df.index, df[self.sat_col], label="SAT")
-        ax1.plot(df.index, df[self.sat_setpoint_col], label="SATsp")
+        self.plot_line(ax1, df[self.sat_col], label="SAT")
+        self.plot_line(ax1, df[self.sat_setpoint_col], label="SATsp")
         ax1.legend(loc="best")
         ax1.set_ylabel("AHU Supply Temps °F")
 
-        ax2.plot(df.index, df[self.heating_sig_col], color="r", label="AHU Heat Vlv")
+        self.plot_line(ax2, df[self.heating_sig_col], color="r", label="AHU Heat Vlv")
         ax2.legend(loc="best")
         ax2.set_ylabel("%")
 
-        ax3.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax3, df[self.fault_col], label="Fault", color="k")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("Fault Flags")
         ax3.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -458,6 +489,11 @@ class FaultCodeSevenReport(BaseFaultReport):
 
 
 class FaultCodeEightReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_mat": "mat_col",
+        "flag_true_sat": "sat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc8_flag")
         self.sat_col = config["SAT_COL"]
@@ -465,24 +501,20 @@ class FaultCodeEightReport(BaseFaultReport):
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
         self.economizer_sig_col = config["ECONOMIZER_SIG_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2 = self.plot_axes(fig, 2)
         fig.suptitle("Fault Conditions 8 Plot")
 
-        ax1.plot(df.index, df[self.sat_col], label="SAT")
-        ax1.plot(df.index, df[self.mat_col], label="MAT")
+        self.plot_line(ax1, df[self.sat_col], label="SAT")
+        self.plot_line(ax1, df[self.mat_col], label="MAT")
         ax1.legend(loc="best")
         ax1.set_ylabel("AHU Temps °F")
 
-        ax2.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax2, df[self.fault_col], label="Fault", color="k")
         ax2.set_xlabel("Date")
         ax2.set_ylabel("Fault Flags")
         ax2.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -509,6 +541,11 @@ class FaultCodeEightReport(BaseFaultReport):
 
 
 class FaultCodeNineReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_oat": "oat_col",
+        "flag_true_satsp": "sat_setpoint_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc9_flag")
         self.sat_setpoint_col = config["SAT_SETPOINT_COL"]
@@ -516,24 +553,20 @@ class FaultCodeNineReport(BaseFaultReport):
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
         self.economizer_sig_col = config["ECONOMIZER_SIG_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2 = self.plot_axes(fig, 2)
         fig.suptitle("Fault Conditions 9 Plot")
 
-        ax1.plot(df.index, df[self.sat_setpoint_col], label="SATSP")
-        ax1.plot(df.index, df[self.oat_col], label="OAT")
+        self.plot_line(ax1, df[self.sat_setpoint_col], label="SATSP")
+        self.plot_line(ax1, df[self.oat_col], label="OAT")
         ax1.legend(loc="best")
         ax1.set_ylabel("AHU Temps °F")
 
-        ax2.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax2, df[self.fault_col], label="Fault", color="k")
         ax2.set_xlabel("Date")
         ax2.set_ylabel("Fault Flags")
         ax2.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -560,6 +593,11 @@ class FaultCodeNineReport(BaseFaultReport):
 
 
 class FaultCodeTenReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_oat": "oat_col",
+        "flag_true_mat": "mat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc10_flag")
         self.oat_col = config["OAT_COL"]
@@ -568,29 +606,25 @@ class FaultCodeTenReport(BaseFaultReport):
         self.economizer_sig_col = config["ECONOMIZER_SIG_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3 = self.plot_axes(fig, 3)
         fig.suptitle("Fault Conditions 10 Plot")
 
-        ax1.plot(df.index, df[self.mat_col], label="MAT")
-        ax1.plot(df.index, df[self.oat_col], label="OAT")
+        self.plot_line(ax1, df[self.mat_col], label="MAT")
+        self.plot_line(ax1, df[self.oat_col], label="OAT")
         ax1.legend(loc="best")
         ax1.set_ylabel("AHU Temps °F")
 
-        ax2.plot(df.index, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
-        ax2.plot(df.index, df[self.economizer_sig_col], label="AHU Dpr Cmd", color="g")
+        self.plot_line(ax2, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
+        self.plot_line(ax2, df[self.economizer_sig_col], label="AHU Dpr Cmd", color="g")
         ax2.legend(loc="best")
         ax2.set_ylabel("%")
 
-        ax3.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax3, df[self.fault_col], label="Fault", color="k")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("Fault Flags")
         ax3.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -617,6 +651,11 @@ class FaultCodeTenReport(BaseFaultReport):
 
 
 class FaultCodeElevenReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_oat": "oat_col",
+        "flag_true_sat_sp": "sat_setpoint_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc11_flag")
         self.sat_setpoint_col = config["SAT_SETPOINT_COL"]
@@ -625,29 +664,25 @@ class FaultCodeElevenReport(BaseFaultReport):
         self.economizer_sig_col = config["ECONOMIZER_SIG_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3 = self.plot_axes(fig, 3)
         fig.suptitle("Fault Conditions 11 Plot")
 
-        ax1.plot(df.index, df[self.sat_setpoint_col], label="SATSP")
-        ax1.plot(df.index, df[self.oat_col], label="OAT")
+        self.plot_line(ax1, df[self.sat_setpoint_col], label="SATSP")
+        self.plot_line(ax1, df[self.oat_col], label="OAT")
         ax1.legend(loc="best")
         ax1.set_ylabel("AHU Temps °F")
 
-        ax2.plot(df.index, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
-        ax2.plot(df.index, df[self.economizer_sig_col], label="AHU Dpr Cmd", color="g")
+        self.plot_line(ax2, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
+        self.plot_line(ax2, df[self.economizer_sig_col], label="AHU Dpr Cmd", color="g")
         ax2.legend(loc="best")
         ax2.set_ylabel("%")
 
-        ax3.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax3, df[self.fault_col], label="Fault", color="k")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("Fault Flags")
         ax3.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -674,6 +709,11 @@ class FaultCodeElevenReport(BaseFaultReport):
 
 
 class FaultCodeTwelveReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_mat": "mat_col",
+        "flag_true_sat": "sat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc12_flag")
         self.sat_col = config["SAT_COL"]
@@ -682,29 +722,25 @@ class FaultCodeTwelveReport(BaseFaultReport):
         self.economizer_sig_col = config["ECONOMIZER_SIG_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3 = self.plot_axes(fig, 3)
         fig.suptitle("Fault Conditions 12 Plot")
 
-        ax1.plot(df.index, df[self.sat_col], label="SAT")
-        ax1.plot(df.index, df[self.mat_col], label="MAT")
+        self.plot_line(ax1, df[self.sat_col], label="SAT")
+        self.plot_line(ax1, df[self.mat_col], label="MAT")
         ax1.legend(loc="best")
         ax1.set_ylabel("AHU Temps °F")
 
-        ax2.plot(df.index, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
-        ax2.plot(df.index, df[self.economizer_sig_col], label="AHU Dpr Cmd", color="g")
+        self.plot_line(ax2, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
+        self.plot_line(ax2, df[self.economizer_sig_col], label="AHU Dpr Cmd", color="g")
         ax2.legend(loc="best")
         ax2.set_ylabel("%")
 
-        ax3.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax3, df[self.fault_col], label="Fault", color="k")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("Fault Flags")
         ax3.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -731,6 +767,11 @@ class FaultCodeTwelveReport(BaseFaultReport):
 
 
 class FaultCodeThirteenReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_mat": "mat_col",
+        "flag_true_sat": "sat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc13_flag")
         self.sat_col = config["SAT_COL"]
@@ -739,29 +780,25 @@ class FaultCodeThirteenReport(BaseFaultReport):
         self.economizer_sig_col = config["ECONOMIZER_SIG_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3 = self.plot_axes(fig, 3)
         fig.suptitle("Fault Conditions 13 Plot")
 
-        ax1.plot(df.index, df[self.sat_col], label="SAT")
-        ax1.plot(df.index, df[self.mat_col], label="MAT")
+        self.plot_line(ax1, df[self.sat_col], label="SAT")
+        self.plot_line(ax1, df[self.mat_col], label="MAT")
         ax1.legend(loc="best")
         ax1.set_ylabel("AHU Temps °F")
 
-        ax2.plot(df.index, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
-        ax2.plot(df.index, df[self.economizer_sig_col], label="AHU Dpr Cmd", color="g")
+        self.plot_line(ax2, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
+        self.plot_line(ax2, df[self.economizer_sig_col], label="AHU Dpr Cmd", color="g")
         ax2.legend(loc="best")
         ax2.set_ylabel("%")
 
-        ax3.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax3, df[self.fault_col], label="Fault", color="k")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("Fault Flags")
         ax3.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -788,6 +825,11 @@ class FaultCodeThirteenReport(BaseFaultReport):
 
 
 class FaultCodeFourteenReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_clt": "clt_col",
+        "flag_true_sat": "sat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc14_flag")
         self.sat_col = config["SAT_COL"]
@@ -795,28 +837,24 @@ class FaultCodeFourteenReport(BaseFaultReport):
         self.cooling_sig_col = config["COOLING_SIG_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3 = self.plot_axes(fig, 3)
         fig.suptitle("Fault Conditions 14 Plot")
 
-        ax1.plot(df.index, df[self.sat_col], label="SAT")
-        ax1.plot(df.index, df[self.clt_col], label="CLT")
+        self.plot_line(ax1, df[self.sat_col], label="SAT")
+        self.plot_line(ax1, df[self.clt_col], label="CLT")
         ax1.legend(loc="best")
         ax1.set_ylabel("AHU Temps °F")
 
-        ax2.plot(df.index, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
+        self.plot_line(ax2, df[self.cooling_sig_col], label="AHU Cool Vlv", color="r")
         ax2.legend(loc="best")
         ax2.set_ylabel("%")
 
-        ax3.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax3, df[self.fault_col], label="Fault", color="k")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("Fault Flags")
         ax3.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -843,6 +881,11 @@ class FaultCodeFourteenReport(BaseFaultReport):
 
 
 class FaultCodeFifteenReport(BaseFaultReport):
+    summary_columns = {
+        "flag_true_hlt": "hlt_col",
+        "flag_true_sat": "sat_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc15_flag")
         self.sat_col = config["SAT_COL"]
@@ -850,28 +893,24 @@ class FaultCodeFifteenReport(BaseFaultReport):
         self.heating_sig_col = config["HEATING_SIG_COL"]
         self.supply_vfd_speed_col = config["SUPPLY_VFD_SPEED_COL"]
 
-    def create_plot(self, df: pd.DataFrame):
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(25, 8))
+    def draw_plot(self, fig, df: pd.DataFrame):
+        ax1, ax2, ax3 = self.plot_axes(fig, 3)
         fig.suptitle("Fault Conditions 15 Plot")
 
-        ax1.plot(df.index, df[self.sat_col], label="SAT")
-        ax1.plot(df.index, df[self.hlt_col], label="HLT")
+        self.plot_line(ax1, df[self.sat_col], label="SAT")
+        self.plot_line(ax1, df[self.hlt_col], label="HLT")
         ax1.legend(loc="best")
         ax1.set_ylabel("AHU Temps °F")
 
-        ax2.plot(df.index, df[self.heating_sig_col], label="AHU Heat Vlv", color="r")
+        self.plot_line(ax2, df[self.heating_sig_col], label="AHU Heat Vlv", color="r")
         ax2.legend(loc="best")
         ax2.set_ylabel("%")
 
-        ax3.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax3, df[self.fault_col], label="Fault", color="k")
         ax3.set_xlabel("Date")
         ax3.set_ylabel("Fault Flags")
         ax3.legend(loc="best")
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -898,6 +937,14 @@ class FaultCodeFifteenReport(BaseFaultReport):
 
 
 class FaultCodeSixteenReport(BaseFaultReport):
+    figsize = (25, 14)
+    summary_columns = {
+        "flag_true_erv_oat_enter_temp": "erv_oat_enter_col",
+        "flag_true_erv_oat_leave_temp": "erv_oat_leaving_col",
+        "flag_true_erv_eat_enter_temp": "erv_eat_enter_col",
+        "flag_true_erv_eat_leave_temp": "erv_eat_leaving_col",
+    }
+
     def __init__(self, config):
         super().__init__(config, "fc16_flag")
 
@@ -910,37 +957,39 @@ class FaultCodeSixteenReport(BaseFaultReport):
         # Instantiate FaultConditionSixteen to access its methods
         self.fc16 = FaultConditionSixteen(config)
 
-    def create_plot(self, df: pd.DataFrame):
+    def draw_plot(self, fig, df: pd.DataFrame):
         # Calculate the efficiency before plotting using FaultConditionSixteen method
         df = self.fc16.calculate_erv_efficiency(df)
 
         # Create the plot with five subplots
-        fig, (ax1, ax2, ax3, ax4, ax5) = plt.subplots(5, 1, figsize=(25, 14))
+        ax1, ax2, ax3, ax4, ax5 = self.plot_axes(fig, 5)
         fig.suptitle("Fault Conditions 16 Plot")
 
         # Plot ERV Outdoor Air Side Temps
-        ax1.plot(df.index, df[self.erv_oat_enter_col], label="Enter", color="blue")
-        ax1.plot(df.index, df[self.erv_oat_leaving_col], label="Leaving", color="green")
+        self.plot_line(ax1, df[self.erv_oat_enter_col], label="Enter", color="blue")
+        self.plot_line(
+            ax1, df[self.erv_oat_leaving_col], label="Leaving", color="green"
+        )
         ax1.legend(loc="best")
         ax1.set_ylabel("ERV Outdoor Air Side Temps °F")
 
         # Plot ERV Exhaust Air Side Temps
-        ax2.plot(df.index, df[self.erv_eat_enter_col], label="Enter", color="red")
-        ax2.plot(
-            df.index, df[self.erv_eat_leaving_col], label="Leaving", color="purple"
+        self.plot_line(ax2, df[self.erv_eat_enter_col], label="Enter", color="red")
+        self.plot_line(
+            ax2, df[self.erv_eat_leaving_col], label="Leaving", color="purple"
         )
         ax2.legend(loc="best")
         ax2.set_ylabel("ERV Exhaust Air Side Temps °F")
 
         # Plot ERV Efficiency
-        ax3.plot(
-            df.index, df["erv_efficiency_oa"], label="ERV Efficiency OA", color="b"
+        self.plot_line(
+            ax3, df["erv_efficiency_oa"], label="ERV Efficiency OA", color="b"
         )
         ax3.legend(loc="best")
         ax3.set_ylabel("ERV Efficiency OA")
 
         # Plot Fault Flags
-        ax4.plot(df.index, df[self.fault_col], label="Fault", color="k")
+        self.plot_line(ax4, df[self.fault_col], label="Fault", color="k")
         ax4.set_xlabel("Date")
         ax4.set_ylabel("Fault Flags")
         ax4.legend(loc="best")
@@ -966,10 +1015,6 @@ class FaultCodeSixteenReport(BaseFaultReport):
         ax5.set_title("Comparison of OAT Distribution")
         ax5.grid(True)
 
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
-        plt.close()
-
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         delta = df.index.to_series().diff()
         summary = {
@@ -999,3 +1044,23 @@ class FaultCodeSixteenReport(BaseFaultReport):
             ),
         }
         return summary
+
+
+REPORT_CLASSES = {
+    "fc1": FaultCodeOneReport,
+    "fc2": FaultCodeTwoReport,
+    "fc3": FaultCodeThreeReport,
+    "fc4": FaultCodeFourReport,
+    "fc5": FaultCodeFiveReport,
+    "fc6": FaultCodeSixReport,
+    "fc7": FaultCodeSevenReport,
+    "fc8": FaultCodeEightReport,
+    "fc9": FaultCodeNineReport,
+    "fc10": FaultCodeTenReport,
+    "fc11": FaultCodeElevenReport,
+    "fc12": FaultCodeTwelveReport,
+    "fc13": FaultCodeThirteenReport,
+    "fc14": FaultCodeFourteenReport,
+    "fc15": FaultCodeFifteenReport,
+    "fc16": FaultCodeSixteenReport,
+}
@@ -5,27 +5,114 @@ import sys
 
 
 class BaseFaultReport:
+    # Size in inches of the report figures and the tight_layout rect that
+    # leaves room for the suptitle
+    figsize = (25, 8)
+    layout_rect = [0, 0.03, 1, 0.95]
+    # Most points drawn per line, about 4 per pixel of a 25 inch figure at
+    # 100 dpi. None draws every sample.
+    max_points = 10_000
+    # Read by FaultSummaryEngine: summary key -> attribute holding the
+    # column averaged while the flag is true, and for FC4 the
+    # (percent key, hours key, attribute) of each operating mode
+    summary_columns = {}
+    summary_modes = []
+
     def __init__(self, config, fault_col):
         self.config = config
         self.fault_col = fault_col
 
-    def create_plot(self, df: pd.DataFrame):
+    def draw_plot(self, fig, df: pd.DataFrame):
         raise NotImplementedError
 
     def summarize_fault_times(self, df: pd.DataFrame) -> dict:
         raise NotImplementedError
 
-    def create_hist_plot(self, df: pd.DataFrame):
-        df[f"hour_of_the_day_{self.fault_col}"] = df.index.hour.where(
-            df[self.fault_col] == 1
-        )
-        fig, ax = plt.subplots(tight_layout=True, figsize=(25, 8))
-        ax.hist(df[f"hour_of_the_day_{self.fault_col}"].dropna())
+    @staticmethod
+    def plot_axes(fig, nrows):
+        """Returns ``nrows`` stacked axes on ``fig``. Axes already on the
+        figure are cleared and reused when there are ``nrows`` of them."""
+        axes = fig.axes
+        if len(axes) == nrows:
+            for ax in axes:
+                ax.clear()
+            fig.suptitle("")
+            return axes
+        fig.clear()
+        return list(np.atleast_1d(fig.subplots(nrows, 1)))
+
+    def plot_line(self, ax, series: pd.Series, **kwargs):
+        """Plots ``series`` against its index on ``ax``, downsampled to
+        ``max_points``."""
+        series = self.downsample(series, self.max_points)
+        return ax.plot(series.index, series.to_numpy(), **kwargs)
+
+    @staticmethod
+    def downsample(series: pd.Series, max_points) -> pd.Series:
+        """Returns at most ``max_points`` samples of ``series`` that draw
+        the same line.
+
+        The samples are split into ``max_points // 4`` buckets of
+        consecutive rows, about one per pixel column, and the first, last,
+        lowest and highest sample of each bucket are kept. The envelope of
+        the line is unchanged, and every fault flag run stays visible
+        because a bucket holding both 0 and 1 keeps both. The number of
+        points drawn no longer depends on the length of the data.
+        """
+        rows = len(series)
+        if max_points is None or rows <= max_points:
+            return series
+
+        buckets = max(max_points // 4, 1)
+        starts = np.linspace(0, rows, buckets + 1).astype(np.int64)[:-1]
+        sizes = np.diff(np.append(starts, rows))
+        bucket = np.repeat(np.arange(buckets), sizes)
+
+        values = series.to_numpy(dtype=float)
+        missing = np.isnan(values)
+        positions = [starts, starts + sizes - 1]
+        for fill, reduce in [(np.inf, np.minimum), (-np.inf, np.maximum)]:
+            # NaN never wins, an all NaN bucket keeps its first sample
+            filled = np.where(missing, fill, values)
+            extreme = reduce.reduceat(filled, starts)
+            hits = np.flatnonzero(filled == extreme[bucket])
+            _, first = np.unique(bucket[hits], return_index=True)
+            positions.append(hits[first])
+
+        return series.iloc[np.unique(np.concatenate(positions))]
+
+    def create_plot(self, df: pd.DataFrame, fig=None):
+        """Draws the fault plot.
+
+        Without ``fig`` the plot is shown in a new pyplot figure, for
+        notebooks. A figure passed in, e.g. by ``ReportRenderer``, is drawn
+        on and returned without being shown so it can be saved and reused.
+        """
+        return self._render(self.draw_plot, df, fig, self.figsize, self.layout_rect)
+
+    def draw_hist_plot(self, fig, df: pd.DataFrame):
+        (ax,) = self.plot_axes(fig, 1)
+        hours = pd.Series(df.index.hour, index=df.index).where(df[self.fault_col] == 1)
+        ax.hist(hours.dropna())
         ax.set_xlabel("Hour of the Day")
         ax.set_ylabel("Frequency")
         ax.set_title(f"Hour-Of-Day When Fault Flag {self.fault_col} is TRUE")
-        plt.show()
-        plt.close()
+
+    def create_hist_plot(self, df: pd.DataFrame, fig=None):
+        return self._render(self.draw_hist_plot, df, fig, (25, 8), None)
+
+    def _render(self, draw, df, fig, figsize, rect):
+        show = fig is None
+        if show:
+            fig = plt.figure(figsize=figsize)
+        else:
+            fig.set_size_inches(figsize)
+        draw(fig, df)
+        fig.tight_layout(rect=rect)
+        if show:
+            plt.show()
+            plt.close(fig)
+        return fig
 
     def display_report_in_ipython(self, df: pd.DataFrame):
         summary = self.summarize_fault_times(df)
@@ -0,0 +1,216 @@
+import contextlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from open_fdd.air_handling_unit.faults.fleet_runner import load_unit_data
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.reports import REPORT_CLASSES
+
+FORMATS = ("png", "svg", "pdf")
+
+
+class ReportRenderer:
+    """Saves the fault report plots to files without a display.
+
+    The plots are drawn on one matplotlib ``Figure`` with an Agg canvas
+    that never goes through pyplot, so nothing is shown and no backend has
+    to be configured. The figure and its axes are reused from plot to plot
+    and from unit to unit instead of opening a new 25x8 inch figure for
+    each one.
+
+    renderer = ReportRenderer(config_dict, "reports", formats=("png", "pdf"))
+    df_combined, df_fc4, _ = HelperUtils().process_all_faults(df, config_dict)
+    renderer.render(df_combined, df_fc4, unit_id="AHU1")
+
+    Files are written to ``<output_dir>/<unit_id>/fcN.<format>`` and
+    ``fcN_hist.<format>``. Reports whose config keys are missing are not
+    rendered, and ``skip_empty`` skips faults that never flagged, like
+    ``display_report_in_ipython`` does. ``faults`` limits the reports to
+    names like "fc1".
+    """
+
+    def __init__(
+        self,
+        config_dict,
+        output_dir,
+        formats=("png",),
+        dpi=100,
+        histogram=True,
+        skip_empty=True,
+        faults=None,
+    ):
+        unknown = [fmt for fmt in formats if fmt not in FORMATS]
+        if unknown:
+            raise ValueError(
+                f"Unsupported report format(s) {unknown}, choose from {FORMATS}"
+            )
+
+        self.output_dir = output_dir
+        self.formats = tuple(formats)
+        self.dpi = dpi
+        self.histogram = histogram
+        self.skip_empty = skip_empty
+
+        self.reports = {}
+        for name, cls in REPORT_CLASSES.items():
+            if faults is not None and name not in faults:
+                continue
+            try:
+                self.reports[name] = cls(config_dict)
+            except KeyError as e:
+                print(f"Info: Skipping {name} report, config is missing {e}")
+                sys.stdout.flush()
+
+        self.figure = Figure()
+        FigureCanvasAgg(self.figure)
+
+    def render(self, df_combined, df_fc4=None, unit_id=None) -> list:
+        """Saves the plots of every report for one unit and returns the
+        paths written.
+
+        ``df_combined`` and ``df_fc4`` are the frames returned by
+        ``process_all_faults``; the FC4 report reads ``df_fc4``.
+        """
+        directory = self.output_dir
+        if unit_id is not None:
+            directory = os.path.join(directory, str(unit_id))
+        os.makedirs(directory, exist_ok=True)
+
+        paths = []
+        for name, report in self.reports.items():
+            df = df_fc4 if name == "fc4" else df_combined
+            if df is None or df.empty or report.fault_col not in df.columns:
+                continue
+            if self.skip_empty and df[report.fault_col].max() == 0:
+                continue
+
+            try:
+                report.create_plot(df, self.figure)
+                paths += self.save(directory, name)
+                if self.histogram:
+                    report.create_hist_plot(df, self.figure)
+                    paths += self.save(directory, f"{name}_hist")
+            except KeyError as e:
+                # e.g. the FC6 plot needs the TROUBLESHOOT_MODE columns
+                print(f"Warning: Skipping {name} plot, missing column {e}")
+                sys.stdout.flush()
+                self.figure.clear()
+        return paths
+
+    def save(self, directory, name) -> list:
+        paths = []
+        for fmt in self.formats:
+            path = os.path.join(directory, f"{name}.{fmt}")
+            self.figure.savefig(path, format=fmt, dpi=self.dpi)
+            paths.append(path)
+        return paths
+
+
+def render_unit(renderer, unit_id, source, config_dict, fused=True) -> dict:
+    """Runs process_all_faults for one AHU and saves its report plots.
+
+    Errors are caught and returned in the record so one bad unit never
+    stops the rest of the fleet.
+    """
+    start = time.perf_counter()
+    record = {"unit_id": unit_id, "paths": [], "error": None}
+    try:
+        df = load_unit_data(source)
+        # process_all_faults prints a lot per unit, keep workers quiet
+        with contextlib.redirect_stdout(io.StringIO()):
+            df_combined, df_fc4, _ = HelperUtils().process_all_faults(
+                df, config_dict, fused=fused
+            )
+            record["paths"] = renderer.render(df_combined, df_fc4, unit_id)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {getattr(e, 'message', e)}"
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def render_units(
+    units, output_dir, formats=("png",), dpi=100, faults=None, fused=True
+) -> list:
+    """Renders a chunk of ``(unit_id, source, config_dict)`` in one worker.
+
+    Units sharing a config dict share one renderer and so one figure.
+    """
+    renderers = {}
+    records = []
+    for unit_id, source, config_dict in units:
+        key = id(config_dict)
+        if key not in renderers:
+            with contextlib.redirect_stdout(io.StringIO()):
+                renderers[key] = ReportRenderer(
+                    config_dict, output_dir, formats, dpi, faults=faults
+                )
+        records.append(render_unit(renderers[key], unit_id, source, config_dict, fused))
+    return records
+
+
+def render_fleet(
+    units,
+    output_dir,
+    formats=("png",),
+    dpi=100,
+    faults=None,
+    max_workers=None,
+    chunksize=1,
+) -> list:
+    """Renders the reports of many AHUs across a process pool.
+
+    ``units`` maps an AHU id to a ``(data source, config dict)`` pair like
+    ``FleetRunner``. ``faults`` limits the reports to names like "fc1", as
+    in ``ReportRenderer``. Returns one record per unit with the paths written,
+    or the error that stopped it. When the pool cannot run a chunk, for
+    example after a worker crash, each unit of the chunk gets that error.
+    """
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError("chunksize must be an integer 1 or greater")
+
+    items = [
+        (unit_id, source, config_dict)
+        for unit_id, (source, config_dict) in units.items()
+    ]
+    chunks = [items[i : i + chunksize] for i in range(0, len(items), chunksize)]
+
+    records = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                render_units, chunk, output_dir, formats, dpi, faults
+            ): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            try:
+                chunk_records = future.result()
+            except Exception as e:
+                # The chunk never ran, e.g. a source that can't be pickled
+                # or a worker that died and broke the pool
+                error = f"{type(e).__name__}: {e}"
+                chunk_records = [
+                    {"unit_id": unit_id, "paths": [], "error": error, "seconds": 0.0}
+                    for unit_id, _, _ in futures[future]
+                ]
+
+            for record in chunk_records:
+                records.append(record)
+                if record["error"] is not None:
+                    print(f"Error in unit {record['unit_id']}: {record['error']}")
+
+            elapsed = time.perf_counter() - start
+            print(
+                f"Report progress: {len(records)}/{len(items)} units, "
+                f"{len(records) / elapsed:.2f} units/s"
+            )
+            sys.stdout.flush()
+
+    return sorted(records, key=lambda record: str(record["unit_id"]))
@@ -0,0 +1,127 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+from open_fdd.air_handling_unit.reports import REPORT_CLASSES
+
+SECONDS_PER_HOUR = 3600.0
+SECONDS_PER_DAY = 86400.0
+
+
+class FaultSummaryEngine:
+    """Computes the ``summarize_fault_times`` statistics of every fault
+    report of an AHU in one pass.
+
+    Each report recomputes the time deltas, the fan runtime and its own
+    flagged means. The engine computes the time deltas and each fan-on mask
+    once per frame. It then gets the flagged hours, percent true and every
+    flag-true mean of all faults from one matrix product of the flag columns
+    with the deltas and with the sensor columns.
+
+    engine = FaultSummaryEngine(config_dict)
+    df_combined, df_fc4, _ = HelperUtils().process_all_faults(df, config_dict)
+    summary = engine.summarize(df_combined, df_fc4)
+    summary.pivot(index="metric", columns="fault", values="value")
+
+    The result is a tidy table with one row per fault and statistic, holding
+    the same values as each report's ``summarize_fault_times``. Faults whose
+    flag column is not in the frames are left out.
+    """
+
+    COLUMNS = ["fault", "metric", "value"]
+
+    def __init__(self, config_dict, faults=None):
+        self.reports = {}
+        for name, cls in REPORT_CLASSES.items():
+            if faults is not None and name not in faults:
+                continue
+            try:
+                self.reports[name] = cls(config_dict)
+            except KeyError as e:
+                print(f"Info: Skipping {name} summary, config is missing {e}")
+                sys.stdout.flush()
+
+    def summarize(self, df_combined, df_fc4=None) -> pd.DataFrame:
+        """Returns the tidy summary of ``df_combined`` and, for FC4, of
+        ``df_fc4``, the frames returned by ``process_all_faults``."""
+        rows = []
+        for df, hourly in [(df_combined, False), (df_fc4, True)]:
+            if df is None or df.empty:
+                continue
+            reports = [
+                (name, report)
+                for name, report in self.reports.items()
+                if (name == "fc4") == hourly and report.fault_col in df.columns
+            ]
+            if reports:
+                rows += self.summarize_frame(df, reports)
+        return pd.DataFrame(rows, columns=self.COLUMNS)
+
+    @staticmethod
+    def summarize_frame(df, reports) -> list:
+        """Returns the ``(fault, metric, value)`` rows of ``reports``, a
+        list of ``(name, report)`` pairs whose flags are all in ``df``."""
+        # The first sample has no delta, like the NaT of index.diff()
+        times = df.index.to_numpy()
+        seconds = np.diff(times, prepend=times[:1]) / np.timedelta64(1, "s")
+        total = seconds.sum()
+
+        flags = df[[report.fault_col for _, report in reports]].to_numpy(dtype=float)
+        flagged = (flags == 1).astype(float)
+        missing = np.isnan(flags)
+        filled = np.where(missing, 0.0, flags)
+        flag_hours = seconds @ filled / SECONDS_PER_HOUR
+        percent_true = filled.sum(axis=0) / (~missing).sum(axis=0) * 100
+
+        # Sensor columns averaged while a flag is true, as one product of
+        # the valid sensor values with the flag matrix
+        value_cols = list(
+            dict.fromkeys(
+                getattr(report, attr)
+                for _, report in reports
+                for attr in report.summary_columns.values()
+            )
+        )
+        values = df[value_cols].to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            flag_true_means = (np.where(valid, values, 0.0).T @ flagged) / (
+                valid.astype(float).T @ flagged
+            )
+        value_position = {col: i for i, col in enumerate(value_cols)}
+
+        runtime_hours = {}
+        rows = []
+        for position, (name, report) in enumerate(reports):
+            stats = [
+                ("total_days", round(total / SECONDS_PER_DAY, 2)),
+                ("total_hours", round(total / SECONDS_PER_HOUR)),
+                (f"hours_{name}_mode", round(flag_hours[position])),
+                ("percent_true", round(percent_true[position], 2)),
+                ("percent_false", round(100 - percent_true[position], 2)),
+            ]
+            for key, attr in report.summary_columns.items():
+                mean = flag_true_means[value_position[getattr(report, attr)], position]
+                stats.append((key, round(mean, 2)))
+
+            modes = report.summary_modes
+            for percent_key, _, attr in modes:
+                stats.append(
+                    (percent_key, round(df[getattr(report, attr)].mean() * 100, 2))
+                )
+            for _, hours_key, attr in modes:
+                mode = df[getattr(report, attr)].to_numpy(dtype=float)
+                mode = np.where(np.isnan(mode), 0.0, mode)
+                stats.append((hours_key, round(seconds @ mode / SECONDS_PER_HOUR, 2)))
+
+            fan_col = getattr(report, "supply_vfd_speed_col", None)
+            if fan_col is not None:
+                # The fan-on mask and its runtime are shared by every report
+                if fan_col not in runtime_hours:
+                    fan_on = df[fan_col].to_numpy(dtype=float) > 0.01
+                    runtime_hours[fan_col] = seconds @ fan_on / SECONDS_PER_HOUR
+                stats.append(("hours_motor_runtime", round(runtime_hours[fan_col], 2)))
+
+            rows += [(name, key, value) for key, value in stats]
+        return rows
@@ -119,11 +119,8 @@ class FaultConditionOne(FaultCondition):
             # Combined condition check
             combined_check = pressure_check & pump_check
 
-            # Rolling sum to count consecutive trues
-            rolling_sum = combined_check.rolling(window=self.rolling_window_size).sum()
-
-            # Set flag to 1 if rolling sum equals the window size
-            df["fc_pump_flag"] = (rolling_sum == self.rolling_window_size).astype(int)
+            # Set flag to 1 if combined_check is true for N consecutive values
+            df["fc_pump_flag"] = self.consecutive_true_flag(combined_check)
 
             return df
 
@@ -230,11 +227,8 @@ class FaultConditionTwo(FaultCondition):
             # Combined condition check
             combined_check = flow_check & pump_check
 
-            # Rolling sum to count consecutive trues
-            rolling_sum = combined_check.rolling(window=self.rolling_window_size).sum()
-
-            # Set flag to 1 if rolling sum equals the window size
-            df["fc2_flag"] = (rolling_sum == self.rolling_window_size).astype(int)
+            # Set flag to 1 if combined_check is true for N consecutive values
+            df["fc2_flag"] = self.consecutive_true_flag(combined_check)
 
             return df
 
@@ -0,0 +1 @@
+"""Readers and writers that feed trend data to the fault condition classes."""
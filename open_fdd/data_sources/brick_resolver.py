@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import sys
+
+# Brick point classes and the process_all_faults config key they fill
+BRICK_CLASS_TO_CONFIG_KEY = {
+    "Supply_Air_Static_Pressure_Sensor": "DUCT_STATIC_COL",
+    "Supply_Air_Static_Pressure_Setpoint": "DUCT_STATIC_SETPOINT_COL",
+    "Supply_Fan_VFD_Speed_Sensor": "SUPPLY_VFD_SPEED_COL",
+    "Mixed_Air_Temperature_Sensor": "MAT_COL",
+    "Outside_Air_Temperature_Sensor": "OAT_COL",
+    "Supply_Air_Temperature_Sensor": "SAT_COL",
+    "Discharge_Air_Temperature_Sensor": "SAT_COL",
+    "Return_Air_Temperature_Sensor": "RAT_COL",
+    "Supply_Air_Temperature_Setpoint": "SAT_SETPOINT_COL",
+    "Discharge_Air_Temperature_Setpoint": "SAT_SETPOINT_COL",
+    "Supply_Air_Flow_Sensor": "SUPPLY_FAN_AIR_VOLUME_COL",
+    "Heating_Valve_Command": "HEATING_SIG_COL",
+    "Cooling_Valve_Command": "COOLING_SIG_COL",
+    "Outside_Air_Damper_Position_Command": "ECONOMIZER_SIG_COL",
+}
+
+AHU_CLASSES = ["Air_Handling_Unit", "AHU"]
+
+QUERY = """
+PREFIX brick: <https://brickschema.org/schema/Brick#>
+PREFIX ref: <https://brickschema.org/schema/Reference#>
+
+SELECT ?ahu ?sensorType ?sensor ?timeseriesId WHERE {{
+    VALUES ?ahuType {{ {ahu_types} }}
+    VALUES ?sensorType {{ {sensor_types} }}
+    ?ahu a ?ahuType ;
+        brick:hasPoint ?sensor .
+    ?sensor a ?sensorType .
+    OPTIONAL {{
+        ?sensor ref:hasExternalReference ?timeseriesRef .
+        ?timeseriesRef ref:hasTimeseriesId ?timeseriesId .
+    }}
+}}
+"""
+
+
+def local_name(uri) -> str:
+    """Returns the last part of a URI, e.g. AHU1 for http://example.org/AHU1."""
+    return str(uri).rstrip("/").split("/")[-1].split("#")[-1]
+
+
+class BrickResolver:
+    """Builds fault config dicts for every AHU in a Brick Turtle model.
+
+    Each point of an AHU whose Brick class is in ``class_map`` fills the
+    matching config key with the point's timeseries id, which is the
+    ``sensor_name`` used in the SQLite store, or with the point's name
+    when it has no timeseries reference.
+
+    SPARQL only runs when the model changes. The resolved mapping is saved
+    as JSON to ``cache_path``, keyed by the sha256 of the Turtle file and
+    the class map, and later runs read it without parsing the graph.
+
+    resolver = BrickResolver("brick_model_with_timeseries.ttl")
+    config_dicts = resolver.config_dicts(config_dict_template)
+    """
+
+    def __init__(self, ttl_path, cache_path=None, class_map=None):
+        self.ttl_path = str(ttl_path)
+        self.cache_path = (
+            str(cache_path) if cache_path else self.ttl_path + ".mapping.json"
+        )
+        self.class_map = dict(class_map or BRICK_CLASS_TO_CONFIG_KEY)
+
+    def cache_key(self) -> str:
+        digest = hashlib.sha256()
+        with open(self.ttl_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(json.dumps(self.class_map, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def resolve(self) -> dict:
+        """Returns ``{ahu_name: {config_key: column_name}}`` for the model."""
+        key = self.cache_key()
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                return cached["mapping"]
+
+        mapping = self.run_query()
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "mapping": mapping}, f, indent=2, sort_keys=True)
+        return mapping
+
+    def run_query(self) -> dict:
+        """Parses the Turtle model and resolves the mapping with SPARQL."""
+        try:
+            from rdflib import Graph
+        except ImportError as e:
+            raise ImportError(
+                "Resolving a Brick model requires rdflib, install it with: pip install rdflib"
+            ) from e
+
+        print(f"Info: resolving Brick points in {self.ttl_path}")
+        sys.stdout.flush()
+
+        graph = Graph()
+        graph.parse(self.ttl_path, format="turtle")
+        query = QUERY.format(
+            ahu_types=" ".join(f"brick:{name}" for name in AHU_CLASSES),
+            sensor_types=" ".join(f"brick:{name}" for name in self.class_map),
+        )
+
+        mapping = {}
+        rows = sorted(
+            graph.query(query), key=lambda row: (str(row.ahu), str(row.sensor))
+        )
+        for row in rows:
+            ahu = local_name(row.ahu)
+            config_key = self.class_map[local_name(row.sensorType)]
+            column = (
+                str(row.timeseriesId)
+                if row.timeseriesId is not None
+                else local_name(row.sensor)
+            )
+            ahu_config = mapping.setdefault(ahu, {})
+            if config_key in ahu_config and ahu_config[config_key] != column:
+                print(
+                    f"Warning: {ahu} has more than one point for {config_key}, "
+                    f"keeping {ahu_config[config_key]} and skipping {column}"
+                )
+                continue
+            ahu_config[config_key] = column
+        return mapping
+
+    def config_dicts(self, config_dict_template) -> dict:
+        """Returns a config dict per AHU, the template's thresholds plus the
+        AHU's resolved column names."""
+        return {
+            ahu: {**config_dict_template, **columns}
+            for ahu, columns in self.resolve().items()
+        }
@@ -0,0 +1,192 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+
+
+def iter_csv_chunks(path, chunksize=100_000, timestamp_col="timestamp", usecols=None):
+    """Yields the rows of a trend CSV as DataFrames of at most ``chunksize``
+    rows with a DatetimeIndex, so only one chunk is held in memory.
+
+    The rows must already be in time order, as BAS trend exports are; a
+    ValueError is raised as soon as a timestamp goes backwards.
+    """
+    if usecols is not None and timestamp_col not in usecols:
+        usecols = [timestamp_col, *usecols]
+
+    last_timestamp = None
+    for chunk in pd.read_csv(path, chunksize=chunksize, usecols=usecols):
+        chunk[timestamp_col] = pd.to_datetime(chunk[timestamp_col])
+        chunk.set_index(timestamp_col, inplace=True)
+        if not len(chunk):
+            continue
+
+        if not chunk.index.is_monotonic_increasing or (
+            last_timestamp is not None and chunk.index[0] < last_timestamp
+        ):
+            raise ValueError(
+                f"Rows in {path} must be sorted by {timestamp_col} to be processed in chunks"
+            )
+        last_timestamp = chunk.index[-1]
+        yield chunk
+
+
+def csv_sample_period(path, chunksize=100_000, timestamp_col="timestamp"):
+    """Returns ``SharedUtils.sample_period`` of a whole trend CSV, reading
+    only its timestamp column one chunk at a time.
+
+    Only a count of each distinct time step is kept, which for BAS trends
+    is a handful of values, so the median step is found without holding
+    the timestamps of the file.
+    """
+    step_counts = {}
+    unit = None
+    last_time = None
+    for chunk in iter_csv_chunks(path, chunksize, timestamp_col, usecols=[]):
+        index = chunk.index if unit is None else chunk.index.as_unit(unit)
+        unit = index.unit
+        times = index.asi8
+        if last_time is not None:
+            times = np.concatenate([[last_time], times])
+        last_time = times[-1]
+        steps, counts = np.unique(np.diff(times), return_counts=True)
+        for step, count in zip(steps.tolist(), counts.tolist()):
+            step_counts[step] = step_counts.get(step, 0) + count
+
+    if not step_counts:
+        return {"period": pd.NaT, "regular": True}
+
+    steps = sorted(step_counts)
+    ends = np.cumsum([step_counts[step] for step in steps])
+    total = int(ends[-1])
+
+    def nth_step(i):
+        return steps[int(np.searchsorted(ends, i, side="right"))]
+
+    # np.median averages the two middle steps of an even count
+    median = int((nth_step((total - 1) // 2) + nth_step(total // 2)) / 2)
+    return {
+        "period": pd.Timedelta(median, unit=unit),
+        "regular": len(steps) == 1,
+    }
+
+
+class ChunkedCsvRunner:
+    """Runs the AHU fault conditions over a CSV too large to load at once.
+
+    The file is read in time ordered chunks and every fault enabled by
+    ``config_dict`` is fed through its streaming ``update`` method, which
+    carries the open rolling window run from one chunk into the next. The
+    flags of each chunk are appended to ``output_path`` as they are
+    computed, so peak memory follows ``chunksize`` and not the file size.
+
+    Data sampled slower than ``freq`` is not smoothed, and its flags match
+    ``HelperUtils().process_all_faults`` on the whole file exactly. Faster
+    data gets the same ``rolling_window`` average of the config columns,
+    taken over the same samples: the raw rows of the last window are
+    carried into the next chunk. The running sum of each chunk starts at
+    the carried rows, so an average can differ from the whole file run in
+    its last bit, and a sample whose average lands exactly on a threshold
+    can flag differently.
+
+    runner = ChunkedCsvRunner("ahu_5_years.csv", config_dict, "ahu_flags.csv")
+    fault_counts_df, fc4_flags = runner.run()
+    """
+
+    def __init__(
+        self,
+        path,
+        config_dict,
+        output_path=None,
+        chunksize=100_000,
+        timestamp_col="timestamp",
+        usecols=None,
+        freq="1min",
+        rolling_window="5min",
+    ):
+        self.path = path
+        self.config_dict = config_dict
+        self.output_path = output_path
+        self.chunksize = chunksize
+        self.timestamp_col = timestamp_col
+        self.usecols = usecols
+        self.freq = freq
+        self.rolling_window = rolling_window
+
+    def run(self):
+        """Processes the file and returns ``(fault_counts_df, fc4_flags)``.
+
+        ``fault_counts_df`` has the same layout as the one returned by
+        ``process_all_faults``. FC4 flags one value per hour so they are
+        returned as a Series instead of being written with the row flags.
+        """
+        fault_conditions = [
+            (name, fc)
+            for name, fc in HelperUtils().build_fault_conditions(self.config_dict)
+            if fc is not None
+        ]
+        for _, fc in fault_conditions:
+            fc.reset_stream()
+
+        helper = HelperUtils()
+        config_columns = helper.config_columns(self.config_dict)
+        sampling = csv_sample_period(self.path, self.chunksize, self.timestamp_col)
+        window = pd.Timedelta(self.rolling_window)
+        carried = None
+
+        fault_counts = {f"{name}_fault_sum": 0 for name, _ in fault_conditions}
+        fc4_parts = []
+        rows = 0
+        write_header = True
+
+        for chunk in iter_csv_chunks(
+            self.path, self.chunksize, self.timestamp_col, self.usecols
+        ):
+            new_rows = len(chunk)
+            if carried is not None:
+                chunk = pd.concat([carried, chunk])
+            # raw rows still inside the rolling window of the next chunk
+            carried = chunk[chunk.index > chunk.index[-1] - window]
+            chunk = helper.apply_rolling_average_if_needed(
+                chunk,
+                self.freq,
+                self.rolling_window,
+                [col for col in config_columns if col in chunk.columns],
+                sampling=sampling,
+            ).iloc[-new_rows:]
+
+            flags = {}
+            for name, fc in fault_conditions:
+                result = fc.update(chunk)
+                fault_counts[f"{name}_fault_sum"] += int(result.sum())
+                if name == "fc4":
+                    fc4_parts.append(result)
+                else:
+                    flags[fc.flag_col] = result
+
+            if self.output_path is not None and flags:
+                pd.DataFrame(flags).to_csv(
+                    self.output_path,
+                    mode="w" if write_header else "a",
+                    header=write_header,
+                    index_label=self.timestamp_col,
+                )
+                write_header = False
+
+            rows += len(chunk)
+            print(f"Info: processed {rows} rows up to {chunk.index[-1]}")
+            sys.stdout.flush()
+
+        for name, fc in fault_conditions:
+            if name == "fc4":
+                result = fc.flush()
+                fault_counts["fc4_fault_sum"] += int(result.sum())
+                fc4_parts.append(result)
+
+        fault_counts_df = pd.DataFrame(
+            list(fault_counts.items()), columns=["Fault Condition", "Count"]
+        )
+        fc4_flags = pd.concat(fc4_parts) if fc4_parts else pd.Series(dtype=int)
+        return fault_counts_df, fc4_flags
@@ -0,0 +1,116 @@
+import pandas as pd
+
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+from open_fdd.data_sources.chunked_csv import iter_csv_chunks
+
+
+def import_pyarrow():
+    """Returns pyarrow and pyarrow.parquet, which are optional dependencies."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet support requires pyarrow, install it with: pip install pyarrow"
+        ) from e
+    return pa, pq
+
+
+def config_columns(config_dict) -> list:
+    """Returns the data columns a config dict maps, from its *_COL keys."""
+    return SharedUtils.config_columns(config_dict)
+
+
+def read_parquet(
+    path,
+    config_dict=None,
+    columns=None,
+    start=None,
+    end=None,
+    timestamp_col="timestamp",
+) -> pd.DataFrame:
+    """Reads trend data from a Parquet file or directory of files.
+
+    Only ``columns`` are read, or the columns mapped by ``config_dict``
+    when ``columns`` is not given. ``start`` and ``end`` are pushed down
+    to the reader as filters on ``timestamp_col`` so row groups outside
+    the range are skipped; ``end`` is inclusive. Returns a frame with a
+    DatetimeIndex, ready for the fault condition classes.
+    """
+    _, pq = import_pyarrow()
+
+    if columns is None and config_dict is not None:
+        columns = config_columns(config_dict)
+
+    schema_names = pq.read_schema(path).names
+    if columns is not None:
+        missing = [col for col in columns if col not in schema_names]
+        if missing:
+            raise KeyError(f"Columns not found in {path}: {missing}")
+        if timestamp_col in schema_names and timestamp_col not in columns:
+            # the index is stored as a column, pandas metadata restores it
+            columns = [timestamp_col, *columns]
+
+    filters = []
+    if start is not None:
+        filters.append((timestamp_col, ">=", pd.Timestamp(start)))
+    if end is not None:
+        filters.append((timestamp_col, "<=", pd.Timestamp(end)))
+
+    df = pd.read_parquet(
+        path, engine="pyarrow", columns=columns, filters=filters or None
+    )
+    if timestamp_col in df.columns:
+        df = df.set_index(timestamp_col)
+    return df
+
+
+def write_parquet(df: pd.DataFrame, path, compression="zstd", row_group_size=None):
+    """Writes a frame such as the combined flags from ``process_all_faults``.
+
+    ``*_flag`` columns hold 0 or 1 so they are stored as int8.
+    """
+    flag_cols = [col for col in df.columns if str(col).endswith("_flag")]
+    df = df.astype({col: "int8" for col in flag_cols})
+    df.to_parquet(
+        path,
+        engine="pyarrow",
+        compression=compression,
+        row_group_size=row_group_size,
+    )
+
+
+def csv_to_parquet(
+    csv_path, parquet_path, chunksize=500_000, timestamp_col="timestamp"
+) -> int:
+    """Converts a time ordered trend CSV to Parquet without loading it whole.
+
+    Each chunk becomes one row group, so a time range read only touches
+    the row groups that overlap it. Integer columns are written as float64,
+    since a sensor that reads whole numbers in the first chunk can read a
+    fraction in a later one. Returns the number of rows written.
+    """
+    pa, pq = import_pyarrow()
+
+    rows = 0
+    writer = None
+    try:
+        for chunk in iter_csv_chunks(csv_path, chunksize, timestamp_col):
+            chunk = chunk.astype(
+                {
+                    col: "float64"
+                    for col in chunk.columns
+                    if pd.api.types.is_integer_dtype(chunk[col])
+                }
+            )
+            table = pa.Table.from_pandas(chunk, preserve_index=True)
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    parquet_path, table.schema, compression="zstd"
+                )
+            writer.write_table(table.cast(writer.schema))
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
@@ -0,0 +1,352 @@
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+STORAGE_LABEL = "SQLite Timeseries Storage"
+
+# Tuned for bulk loading; WAL keeps readers unblocked while a load runs
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -200_000,  # KiB, about 200 MB
+    "mmap_size": 1 << 30,
+}
+
+# Column types of TimeseriesData as reported by PRAGMA table_info
+TIMESERIES_COLUMNS = {
+    "id": "INTEGER",
+    "sensor_name": "TEXT",
+    "timestamp": "INTEGER",
+    "value": "REAL",
+}
+
+
+def to_epoch_seconds(index) -> np.ndarray:
+    """Returns integer epoch seconds for a DatetimeIndex. Timezone aware
+    timestamps are converted to UTC, naive ones are stored as is."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("s").asi8
+
+
+def to_epoch_bound(value):
+    """Returns epoch seconds for a query bound, None means unbounded."""
+    if value is None:
+        return None
+    return int(to_epoch_seconds([pd.Timestamp(value)])[0])
+
+
+class TimeseriesStore:
+    """Reads and writes the Brick example's SQLite timeseries schema.
+
+    TimeseriesData holds one row per reading with ``timestamp`` stored as
+    integer epoch seconds and a ``(sensor_name, timestamp)`` index for
+    range queries. TimeseriesReference lists the sensors, and
+    DatabaseStorage says where they are stored, as in
+    ``examples/brick_model_and_sqlite``.
+
+    store = TimeseriesStore("brick_timeseries.db")
+    store.load_dataframe(df)
+    df = store.query(["AHU1_SaStatic_value"], start="2024-07-01")
+
+    Query results are cached in memory, and on disk under ``cache_dir``
+    when it is given, so repeated runs skip the database. Cached results
+    are dropped when any connection writes to the database, and each query
+    keeps one file in ``cache_dir`` that is replaced when it is read again.
+    """
+
+    def __init__(self, db_path, storage_label=STORAGE_LABEL, cache_dir=None):
+        self.db_path = str(db_path)
+        self.storage_label = storage_label
+        self.cache_dir = cache_dir
+        self._query_cache = {}
+        self.conn = sqlite3.connect(self.db_path)
+        for pragma, value in PRAGMAS.items():
+            self.conn.execute(f"PRAGMA {pragma}={value}")
+        self.create_schema()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def create_schema(self):
+        self.check_data_table()
+        with self.conn:
+            self.create_data_table()
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS TimeseriesReference (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timeseries_id TEXT NOT NULL,
+                    stored_at TEXT NOT NULL
+                )
+                """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS DatabaseStorage (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    label TEXT NOT NULL,
+                    connstring TEXT NOT NULL
+                )
+                """)
+            if not self.conn.execute(
+                "SELECT 1 FROM DatabaseStorage WHERE label = ?", (self.storage_label,)
+            ).fetchone():
+                self.conn.execute(
+                    "INSERT INTO DatabaseStorage (label, connstring) VALUES (?, ?)",
+                    (self.storage_label, f"sqlite:///{self.db_path}"),
+                )
+
+    def create_data_table(self):
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS TimeseriesData (
+                id INTEGER PRIMARY KEY,
+                sensor_name TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                value REAL NOT NULL
+            )
+            """)
+
+    def check_data_table(self):
+        """Checks the column types of an existing TimeseriesData table.
+
+        A table written by the original example, with ``timestamp`` stored
+        as "YYYY-MM-DD HH:MM:SS" text, is converted to epoch seconds. Any
+        other layout raises a ValueError instead of being read as is.
+        """
+        columns = {
+            name: type_.upper()
+            for _, name, type_, *_ in self.conn.execute(
+                "PRAGMA table_info(TimeseriesData)"
+            )
+        }
+        if not columns or columns == TIMESERIES_COLUMNS:
+            return
+        if columns == {**TIMESERIES_COLUMNS, "timestamp": "TEXT"}:
+            self.migrate_text_timestamps()
+            return
+        raise ValueError(
+            f"TimeseriesData in {self.db_path} has columns {columns}, "
+            f"expected {TIMESERIES_COLUMNS}"
+        )
+
+    def migrate_text_timestamps(self):
+        """Rewrites TimeseriesData with text timestamps as epoch seconds, in
+        one transaction so a failed conversion leaves the table as it was."""
+        print(f"Info: converting text timestamps in {self.db_path} to epoch seconds")
+        sys.stdout.flush()
+        try:
+            with self.conn:
+                self.conn.execute("BEGIN")
+                self.conn.execute(
+                    "ALTER TABLE TimeseriesData RENAME TO TimeseriesData_text"
+                )
+                self.create_data_table()
+                # strftime reads the text as UTC, naive times stay as written
+                self.conn.execute("""
+                    INSERT INTO TimeseriesData (id, sensor_name, timestamp, value)
+                    SELECT id, sensor_name, CAST(strftime('%s', timestamp) AS INTEGER), value
+                    FROM TimeseriesData_text
+                    """)
+                self.conn.execute("DROP TABLE TimeseriesData_text")
+        except sqlite3.IntegrityError as e:
+            raise ValueError(
+                f"TimeseriesData in {self.db_path} has timestamps that are not "
+                "dates, the table was left unchanged"
+            ) from e
+        self.create_index()
+
+    def create_index(self):
+        """Creates the (sensor_name, timestamp) index. Building it once after
+        a bulk load is faster than updating it on every insert. ``value`` is
+        included so range queries are answered from the index alone."""
+        with self.conn:
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_timeseries_sensor_time
+                ON TimeseriesData (sensor_name, timestamp, value)
+                """)
+
+    def sensor_names(self) -> list:
+        rows = self.conn.execute("SELECT timeseries_id FROM TimeseriesReference")
+        return [row[0] for row in rows]
+
+    def add_references(self, sensor_names):
+        """Adds a TimeseriesReference row for each sensor not listed yet."""
+        existing = set(self.sensor_names())
+        new = [
+            (name, self.storage_label) for name in sensor_names if name not in existing
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO TimeseriesReference (timeseries_id, stored_at) VALUES (?, ?)",
+                new,
+            )
+
+    def load_dataframe(
+        self,
+        df: pd.DataFrame,
+        columns=None,
+        batch_size=100_000,
+        timestamp_col="timestamp",
+    ) -> int:
+        """Bulk loads a wide trend frame, one sensor per column.
+
+        ``df`` is indexed by time or has a ``timestamp_col`` column.
+        ``columns`` limits the sensors loaded, all columns by default.
+        Missing values are skipped since ``value`` is NOT NULL. Rows are
+        inserted with ``executemany`` in transactions of ``batch_size``.
+        Returns the number of readings inserted.
+        """
+        if timestamp_col in df.columns:
+            df = df.set_index(timestamp_col)
+        columns = list(df.columns) if columns is None else list(columns)
+        timestamps = to_epoch_seconds(df.index)
+
+        sql = "INSERT INTO TimeseriesData (sensor_name, timestamp, value) VALUES (?, ?, ?)"
+        inserted = 0
+        start = time.perf_counter()
+
+        for column in columns:
+            values = df[column].to_numpy(dtype=float, na_value=np.nan)
+            present = ~np.isnan(values)
+            column_times = timestamps[present].tolist()
+            column_values = values[present].tolist()
+            sensor_name = str(column).strip()
+
+            for i in range(0, len(column_values), batch_size):
+                rows = zip(
+                    repeat(sensor_name),
+                    column_times[i : i + batch_size],
+                    column_values[i : i + batch_size],
+                )
+                with self.conn:
+                    self.conn.executemany(sql, rows)
+            inserted += len(column_values)
+
+        self.add_references([str(col).strip() for col in columns])
+        self.create_index()
+        self._query_cache.clear()
+
+        elapsed = time.perf_counter() - start
+        rate = inserted / elapsed if elapsed > 0 else float("inf")
+        print(
+            f"Inserted {inserted} readings for {len(columns)} sensors "
+            f"in {elapsed:.2f}s ({rate:,.0f} rows/s)"
+        )
+        sys.stdout.flush()
+        return inserted
+
+    def db_version(self) -> tuple:
+        """Changes whenever readings are written, by any connection.
+
+        Writes by other connections land in the ``-wal`` file first, so its
+        mtime and size are included with those of the database file. An
+        empty ``-wal`` file is recreated on every connect and holds no
+        writes, so it counts as missing. The newest row id is kept for file
+        systems with coarse mtimes.
+        """
+        files = []
+        for path in (self.db_path, self.db_path + "-wal"):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                stat = None
+            if stat is None or not stat.st_size:
+                files.append(None)
+            else:
+                files.append((stat.st_mtime_ns, stat.st_size))
+        (max_id,) = self.conn.execute("SELECT max(id) FROM TimeseriesData").fetchone()
+        return (*files, max_id)
+
+    def query(self, points, start=None, end=None) -> pd.DataFrame:
+        """Returns a wide frame of the readings for ``points`` between
+        ``start`` and ``end`` (both inclusive), indexed by a DatetimeIndex.
+
+        ``points`` is a list of sensor names, or a dict of column name to
+        sensor name to name the columns after Brick classes or config
+        columns, e.g. {"Supply_Air_Static_Pressure_Sensor": "AHU1_SaStatic_value"}.
+        Timestamps where a sensor has no reading are NaN in its column.
+        """
+        if not isinstance(points, dict):
+            points = {name: name for name in points}
+        if not points:
+            raise ValueError("points must name at least one sensor")
+        start, end = to_epoch_bound(start), to_epoch_bound(end)
+
+        key = (tuple(points.items()), start, end)
+        version = self.db_version()
+        # data_version changes on every commit by another connection, it is
+        # only comparable within this connection so it stays off the disk
+        (data_version,) = self.conn.execute("PRAGMA data_version").fetchone()
+        cached = self._query_cache.get(key)
+        if cached is not None and cached[0] == (data_version, version):
+            return cached[1].copy()
+
+        cache_path = self.cache_path(key)
+        df = None
+        if cache_path is not None and os.path.exists(cache_path):
+            cached = pd.read_pickle(cache_path)
+            if cached["version"] == version:
+                df = cached["df"]
+        if df is None:
+            df = self.read_wide(points, start, end)
+            if cache_path is not None:
+                # One file per query, overwritten when the database changes
+                os.makedirs(self.cache_dir, exist_ok=True)
+                pd.to_pickle({"version": version, "df": df}, cache_path + ".tmp")
+                os.replace(cache_path + ".tmp", cache_path)
+
+        self._query_cache[key] = ((data_version, version), df)
+        return df.copy()
+
+    def cache_path(self, key):
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha256(
+            repr((os.path.abspath(self.db_path), key)).encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"query_{digest[:32]}.pkl")
+
+    def read_wide(self, points, start, end) -> pd.DataFrame:
+        """Runs one indexed query for all points and pivots it to wide."""
+        sensor_names = list(dict.fromkeys(points.values()))
+        placeholders = ", ".join("?" * len(sensor_names))
+
+        # Return each sensor as its column number so rows stay all numeric
+        sensor_code = " ".join(f"WHEN ? THEN {i}" for i in range(len(sensor_names)))
+        sql = (
+            f"SELECT CASE sensor_name {sensor_code} END, timestamp, value "
+            f"FROM TimeseriesData WHERE sensor_name IN ({placeholders})"
+        )
+        params = sensor_names + sensor_names
+        if start is not None:
+            sql += " AND timestamp >= ?"
+            params.append(start)
+        if end is not None:
+            sql += " AND timestamp <= ?"
+            params.append(end)
+
+        rows = np.fromiter(
+            self.conn.execute(sql, params),
+            dtype=[("sensor", np.int64), ("timestamp", np.int64), ("value", float)],
+        )
+
+        # Pivot long to wide by scattering values into a (time, sensor) array
+        times, time_codes = np.unique(rows["timestamp"], return_inverse=True)
+        wide = np.full((len(times), len(sensor_names)), np.nan)
+        wide[time_codes, rows["sensor"]] = rows["value"]
+
+        index = pd.DatetimeIndex(pd.to_datetime(times, unit="s"), name="timestamp")
+        df = pd.DataFrame(wide, index=index, columns=sensor_names)
+        return df[list(points.values())].set_axis(list(points.keys()), axis=1)
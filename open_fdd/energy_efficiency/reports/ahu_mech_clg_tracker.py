@@ -1,10 +1,13 @@
 import os
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import sys
 
 
 class MechanicalCoolingTracker:
+    MODES = ["Not_Mechanical", "Economizer_plus_Mech", "Economizer", "Mechanical"]
+
     def __init__(self, config):
         self.static_min = config["STATIC_MIN"]
         self.static_col = config["STATIC_COL"]
@@ -29,7 +32,7 @@ class MechanicalCoolingTracker:
 
         # Generate mode percentage plots
         filtered_df = df[df[self.static_col] >= self.static_min].copy()
-        filtered_df["Mode"] = filtered_df.apply(self._identify_mode, axis=1)
+        filtered_df["Mode"] = self.identify_modes(filtered_df)
         mode_percentages = self._calculate_mode_percentages(filtered_df)
 
         print("Mode Percentages:")
@@ -44,19 +47,11 @@ class MechanicalCoolingTracker:
         filtered_df = df[df[self.static_col] >= self.static_min].copy()
 
         daily_stats = filtered_df[self.static_col].resample("D").agg(["mean", "std"])
-        filtered_df["time_delta"] = (
-            filtered_df.index.to_series().diff().dt.total_seconds().fillna(0)
-        )
-        filtered_df = filtered_df[filtered_df["time_delta"] > 0]
-
-        expected_interval = filtered_df["time_delta"].mode()[0]
-        filtered_df["time_delta"] = filtered_df["time_delta"].apply(
-            lambda x: expected_interval if x > expected_interval * 2 else x
-        )
+        time_delta = self._run_time_deltas(filtered_df.index)
 
-        motor_run_time_per_day_seconds = filtered_df.groupby(filtered_df.index.date)[
-            "time_delta"
-        ].sum()
+        motor_run_time_per_day_seconds = time_delta.groupby(
+            time_delta.index.normalize()
+        ).sum()
         motor_run_time_per_day_hours = motor_run_time_per_day_seconds / 3600
 
         self._display_plot(
@@ -88,27 +83,50 @@ class MechanicalCoolingTracker:
 
         return summary
 
-    def _identify_mode(self, row):
-        if row[self.oat_col] > 40:
-            if (
-                row[self.ma_dampers_col] > self.economizer_damper_position
-                and row[self.cw_valve_col] > self.mechanical_valve_position
-            ):
-                return "Economizer_plus_Mech"
-            elif (
-                row[self.ma_dampers_col] > self.economizer_min_oa_pos
-                and row[self.cw_valve_col] < self.mechanical_valve_position
-            ):
-                return "Economizer"
-            elif (
-                row[self.ma_dampers_col] <= self.economizer_min_oa_pos
-                and row[self.cw_valve_col] > self.mechanical_valve_position
-            ):
-                return "Mechanical"
-        return "Not_Mechanical"
+    def identify_modes(self, df: pd.DataFrame) -> pd.Series:
+        """Returns the operating mode of every row as a categorical Series
+        of ``MODES``. Rows with OAT above 40 are classified by the mixing
+        damper and cooling valve positions, all conditions at once with
+        ``np.select``. Missing values match no mode and are Not_Mechanical.
+        """
+        oat = df[self.oat_col].to_numpy(dtype=float)
+        dampers = df[self.ma_dampers_col].to_numpy(dtype=float)
+        valve = df[self.cw_valve_col].to_numpy(dtype=float)
+
+        warm = oat > 40
+        mech_valve = valve > self.mechanical_valve_position
+        conditions = [
+            warm & (dampers > self.economizer_damper_position) & mech_valve,
+            warm
+            & (dampers > self.economizer_min_oa_pos)
+            & (valve < self.mechanical_valve_position),
+            warm & (dampers <= self.economizer_min_oa_pos) & mech_valve,
+        ]
+        # The first matching condition wins, like the if/elif it replaces
+        codes = np.select(conditions, [1, 2, 3], default=0)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=self.MODES),
+            index=df.index,
+            name="Mode",
+        )
+
+    @staticmethod
+    def _run_time_deltas(index: pd.DatetimeIndex) -> pd.Series:
+        """Returns the seconds since the previous sample, dropping the first
+        sample and repeated timestamps. A gap longer than twice the usual
+        interval counts as one usual interval."""
+        time_delta = index.to_series().diff().dt.total_seconds().fillna(0)
+        time_delta = time_delta[time_delta > 0]
+        expected_interval = time_delta.mode()[0]
+        return time_delta.where(time_delta <= expected_interval * 2, expected_interval)
 
     def _calculate_mode_percentages(self, df: pd.DataFrame) -> pd.DataFrame:
-        mode_counts = df.groupby([df.index.date, "Mode"]).size().unstack(fill_value=0)
+        modes = df["Mode"] if "Mode" in df.columns else self.identify_modes(df)
+        mode_counts = (
+            modes.groupby([df.index.normalize(), modes], observed=False)
+            .size()
+            .unstack(fill_value=0)
+        )
         mode_percentages = mode_counts.div(mode_counts.sum(axis=1), axis=0) * 100
         return mode_percentages
 
@@ -137,7 +155,7 @@ class MechanicalCoolingTracker:
 
         ax2.plot(
             combined_df.index,
-            combined_df["OaTemp"],
+            combined_df[self.oat_col],
             color="red",
             linestyle="-",
             marker="o",
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+import pytest
+import open_fdd.air_handling_unit.faults.acceleration as acceleration
+from open_fdd.air_handling_unit.faults.expression_cache import ExpressionCache
+from open_fdd.air_handling_unit.faults.fault_registry import FAULT_REGISTRY, evaluate
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_acceleration.py -rP -s
+
+The numexpr and numba kernels compute the same masks as the numpy kernel,
+also on compact float32 data.
+"""
+
+RULES = [spec.name for spec in FAULT_REGISTRY if spec.expression is not None]
+
+
+def make_data(rows=400, compact=False) -> pd.DataFrame:
+    df = generate_data(rows=rows)
+    # NaN and zero samples exercise minimum/maximum and the fc6 division
+    df.iloc[::13, :] = np.nan
+    df.iloc[5::17, df.columns.get_loc("oat")] = df["rat"].iloc[5::17]
+    df.iloc[7::19, df.columns.get_loc("supply_cfm")] = 0.0
+    if compact:
+        df = HelperUtils().compact_dtypes(df)
+    return df
+
+
+def typed_constants(rule, df) -> dict:
+    """The kernel's constant variables at the dtypes numpy uses for df."""
+    constants = acceleration.constant_names(rule.kernel)
+    dtypes = {col: df[col].dtype for col in acceleration.column_names(rule.kernel)}
+    values = acceleration.typed_constants(rule.kernel, dtypes)
+    return {constants[path]: value for path, value in values.items()}
+
+
+def numpy_mask(rule, df):
+    return evaluate(rule.kernel, df, ExpressionCache(df))
+
+
+class TestBackendSelection:
+
+    def test_default_is_numpy(self):
+        rule = FAULT_REGISTRY["fc1"].build(config_dict)
+        assert rule.backend == "numpy"
+        assert rule.compiled_kernel is None
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            FAULT_REGISTRY["fc1"].build({**config_dict, "ACCELERATION_BACKEND": "gpu"})
+
+    def test_missing_backend_falls_back(self, monkeypatch, capsys):
+        monkeypatch.setattr(acceleration, "backend_available", lambda backend: False)
+        acceleration.warn_fallback.cache_clear()
+        for _ in range(2):
+            rule = FAULT_REGISTRY["fc8"].build(
+                {**config_dict, "ACCELERATION_BACKEND": "numba"}
+            )
+        assert rule.backend == "numpy"
+        assert capsys.readouterr().out.count("numba is not installed") == 1
+
+        df = make_data()
+        expected = FAULT_REGISTRY["fc8"].build(config_dict).evaluate(df)
+        pd.testing.assert_series_equal(rule.evaluate(df), expected)
+
+
+class TestGeneratedKernels:
+
+    @pytest.mark.parametrize("compact", [False, True])
+    @pytest.mark.parametrize("name", RULES)
+    def test_numexpr_source(self, name, compact):
+        # numexpr syntax is also valid numpy, so the translation can be
+        # checked without numexpr installed. The constants are numpy
+        # scalars, which numpy does not treat as weak, so a float64
+        # constant would promote a float32 column like numexpr does.
+        rule = FAULT_REGISTRY[name].build(config_dict)
+        df = make_data(compact=compact)
+        names = acceleration.column_names(rule.kernel)
+        constants = acceleration.constant_names(rule.kernel)
+        namespace = {col: df[column].to_numpy() for column, col in names.items()}
+        namespace.update(typed_constants(rule, df))
+        namespace.update(where=np.where, sqrt=np.sqrt, abs=np.abs)
+        source = acceleration.numexpr_source(rule.kernel, names, constants)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mask = eval(source, namespace)
+        np.testing.assert_array_equal(mask, numpy_mask(rule, df))
+
+    @pytest.mark.parametrize("compact", [False, True])
+    @pytest.mark.parametrize("name", RULES)
+    def test_loop_source(self, name, compact):
+        rule = FAULT_REGISTRY[name].build(config_dict)
+        df = make_data(compact=compact)
+        kernel, columns, constants = acceleration.compile_loop(rule.kernel, jit=False)
+        values = typed_constants(rule, df)
+        out = np.empty(len(df), dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kernel(
+                *(df[col].to_numpy() for col in columns),
+                *(values[name] for name in constants.values()),
+                out,
+            )
+        np.testing.assert_array_equal(out, numpy_mask(rule, df))
+
+    def test_constants_follow_column_dtype(self):
+        rule = FAULT_REGISTRY["fc13"].build(config_dict)
+        compact = typed_constants(rule, make_data(compact=True))
+        assert {value.dtype for value in compact.values()} == {np.dtype(np.float32)}
+        full = typed_constants(rule, make_data())
+        assert {value.dtype for value in full.values()} == {np.dtype(np.float64)}
+
+
+class TestInstalledBackends:
+
+    @pytest.mark.parametrize("compact", [False, True])
+    @pytest.mark.parametrize("backend", ["numexpr", "numba"])
+    @pytest.mark.parametrize("name", RULES)
+    def test_matches_numpy(self, backend, name, compact):
+        pytest.importorskip(backend)
+        df = make_data(rows=3000, compact=compact)
+        rule = FAULT_REGISTRY[name].build(
+            {**config_dict, "ACCELERATION_BACKEND": backend}
+        )
+        assert rule.backend == backend
+        expected = FAULT_REGISTRY[name].build(config_dict).evaluate(df)
+        pd.testing.assert_series_equal(rule.evaluate(df), expected)
+
+    @pytest.mark.parametrize("backend", ["numexpr", "numba"])
+    def test_process_all_faults_compact(self, backend):
+        pytest.importorskip(backend)
+        df = generate_data(rows=3000)
+        helper = HelperUtils()
+        _, _, expected = helper.process_all_faults(df, config_dict, compact=True)
+        _, _, actual = helper.process_all_faults(
+            df, {**config_dict, "ACCELERATION_BACKEND": backend}, compact=True
+        )
+        pd.testing.assert_frame_equal(actual, expected)
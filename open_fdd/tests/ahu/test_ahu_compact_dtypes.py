@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+from open_fdd.data_sources.parquet import config_columns
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_compact_dtypes.py -rP -s
+
+float32 sensors and uint8 flags must give the same flags as float64.
+"""
+
+
+def flag_columns(df) -> list:
+    return [col for col in df.columns if col.endswith("_flag")]
+
+
+class TestCompactDtypes:
+
+    @pytest.mark.parametrize("fused", [False, True])
+    def test_flags_match_float64(self, fused):
+        df = generate_data(rows=2000)
+        expected, expected_fc4, expected_counts = HelperUtils().process_all_faults(
+            df.copy(), config_dict, fused=fused
+        )
+        # numpy scalar thresholds must not upcast the float32 comparisons
+        numpy_config = {
+            key: np.float64(value) if isinstance(value, float) else value
+            for key, value in config_dict.items()
+        }
+        actual, actual_fc4, actual_counts = HelperUtils().process_all_faults(
+            df.copy(), numpy_config, fused=fused, compact=True
+        )
+
+        flags = flag_columns(expected)
+        assert (actual[flags].dtypes == np.uint8).all()
+        assert (actual[config_columns(config_dict)].dtypes == np.float32).all()
+        pd.testing.assert_frame_equal(actual[flags], expected[flags], check_dtype=False)
+        pd.testing.assert_frame_equal(actual_fc4, expected_fc4)
+        pd.testing.assert_frame_equal(actual_counts, expected_counts)
+
+    def test_pack_flags(self):
+        flags = pd.Series(np.random.default_rng(0).integers(0, 2, 1001))
+        packed = SharedUtils.pack_flags(flags)
+        assert packed.nbytes == 126
+        unpacked = SharedUtils.unpack_flags(packed, len(flags))
+        assert unpacked.tolist() == flags.tolist()
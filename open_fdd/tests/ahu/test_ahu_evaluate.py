@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_evaluate.py -rP -s
+
+evaluate() returns the flag Series without writing to the input frame.
+"""
+
+FAULT_CONDITIONS = [
+    (name, fc)
+    for name, fc in HelperUtils().build_fault_conditions(config_dict)
+    if fc is not None and name != "fc4"
+]
+
+
+class TestEvaluate:
+
+    @pytest.mark.parametrize(
+        "name,fc", FAULT_CONDITIONS, ids=[name for name, _ in FAULT_CONDITIONS]
+    )
+    def test_input_not_modified(self, name, fc):
+        df = generate_data(rows=500)
+        expected = df.copy()
+        fc.evaluate(df)
+        pd.testing.assert_frame_equal(df, expected)
+
+    @pytest.mark.parametrize(
+        "name,fc", FAULT_CONDITIONS, ids=[name for name, _ in FAULT_CONDITIONS]
+    )
+    def test_matches_apply(self, name, fc):
+        df = generate_data(rows=500)
+        flags = fc.evaluate(df)
+        expected = fc.apply(df.copy())[fc.flag_col]
+        assert flags.name == fc.flag_col
+        pd.testing.assert_series_equal(flags, expected)
+
+    def test_int_analog_columns_not_converted(self):
+        df = generate_data(rows=500)
+        df["supply_vfd_speed"] = (df["supply_vfd_speed"] > 0.5).astype(int)
+        expected = df.copy()
+        for _, fc in FAULT_CONDITIONS:
+            fc.evaluate(df)
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_fc15_apply_adds_only_flag(self):
+        df = generate_data(rows=500)
+        fc15 = dict(FAULT_CONDITIONS)["fc15"]
+        result = fc15.apply(df.copy())
+        assert list(result.columns) == list(df.columns) + ["fc15_flag"]
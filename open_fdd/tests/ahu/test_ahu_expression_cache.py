@@ -0,0 +1,73 @@
+import pandas as pd
+from open_fdd.air_handling_unit.faults import (
+    FaultConditionTwo,
+    FaultConditionThree,
+)
+from open_fdd.air_handling_unit.faults.expression_cache import ExpressionCache
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_expression_cache.py -rP -s
+
+Faults sharing an ExpressionCache must flag exactly as they do without one.
+"""
+
+# Constants
+TEST_MIX_TEMP_COL = "mix_air_temp"
+TEST_RETURN_TEMP_COL = "return_air_temp"
+TEST_OUT_TEMP_COL = "out_air_temp"
+TEST_SUPPLY_VFD_SPEED_COL = "supply_vfd_speed"
+
+fault_condition_params = {
+    "MIX_DEGF_ERR_THRES": 2.0,
+    "RETURN_DEGF_ERR_THRES": 2.0,
+    "OUTDOOR_DEGF_ERR_THRES": 5.0,
+    "MAT_COL": TEST_MIX_TEMP_COL,
+    "RAT_COL": TEST_RETURN_TEMP_COL,
+    "OAT_COL": TEST_OUT_TEMP_COL,
+    "SUPPLY_VFD_SPEED_COL": TEST_SUPPLY_VFD_SPEED_COL,
+    "TROUBLESHOOT_MODE": False,
+    "ROLLING_WINDOW_SIZE": 2,
+}
+
+
+def make_df() -> pd.DataFrame:
+    data = {
+        TEST_MIX_TEMP_COL: [40.0, 40.0, 40.0, 90.0, 90.0, 90.0, 60.0],
+        TEST_RETURN_TEMP_COL: [70.0] * 7,
+        TEST_OUT_TEMP_COL: [55.0] * 7,
+        TEST_SUPPLY_VFD_SPEED_COL: [0.8, 0.8, 0.8, 0.8, 0.8, 0.0, 0.8],
+    }
+    return pd.DataFrame(data)
+
+
+class TestExpressionCache:
+
+    def test_cached_flags_match(self):
+        expected_fc2 = FaultConditionTwo(fault_condition_params).apply(make_df())
+        expected_fc3 = FaultConditionThree(fault_condition_params).apply(make_df())
+
+        df = make_df()
+        cache = ExpressionCache(df)
+        fc2 = FaultConditionTwo(fault_condition_params)
+        fc3 = FaultConditionThree(fault_condition_params)
+        fc2.expression_cache = cache
+        fc3.expression_cache = cache
+        actual_fc2 = fc2.apply(df.copy(deep=False))
+        actual_fc3 = fc3.apply(df.copy(deep=False))
+
+        pd.testing.assert_series_equal(actual_fc2["fc2_flag"], expected_fc2["fc2_flag"])
+        pd.testing.assert_series_equal(actual_fc3["fc3_flag"], expected_fc3["fc3_flag"])
+        assert actual_fc2["fc2_flag"].sum() == 2
+        assert actual_fc3["fc3_flag"].sum() == 1
+
+        # the fan running mask is computed by fc2 and reused by fc3
+        assert cache.hits == 1
+
+    def test_cache_ignores_other_batches(self):
+        cache = ExpressionCache(make_df())
+        fc2 = FaultConditionTwo(fault_condition_params)
+        fc2.expression_cache = cache
+        fc2.apply(make_df())
+        assert cache.hits == 0
+        assert cache.misses == 0
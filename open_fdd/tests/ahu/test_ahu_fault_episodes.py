@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.fault_episodes import (
+    episodes_to_flags,
+    extract_episodes,
+)
+from open_fdd.air_handling_unit.faults.fault_results import FaultResults
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+from open_fdd.air_handling_unit.reports.summary_engine import FaultSummaryEngine
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_fault_episodes.py -rP -s
+
+Fault flags convert to episodes and back without loss, and the episode
+durations add up to the hours in fault of the reports.
+"""
+
+
+def frame(flags, sat):
+    index = pd.date_range("2024-01-01", periods=len(flags), freq="1min")
+    return pd.DataFrame({"fc1_flag": flags, "sat": sat}, index=index)
+
+
+@pytest.fixture(scope="module")
+def fault_frames():
+    df = generate_data(rows=3000)
+    df_combined, df_fc4, _ = HelperUtils().process_all_faults(df, config_dict)
+    return df_combined, df_fc4
+
+
+class TestFlagEdges:
+
+    def test_edges(self):
+        starts, stops = SharedUtils.flag_edges(pd.Series([1, 1, 0, 1, 0, 0, 1]))
+        assert starts.tolist() == [0, 3, 6]
+        assert stops.tolist() == [2, 4, 7]
+
+    def test_nan_is_not_flagged(self):
+        starts, stops = SharedUtils.flag_edges(pd.Series([0.0, np.nan, 1.0, np.nan]))
+        assert starts.tolist() == [2]
+        assert stops.tolist() == [3]
+
+
+class TestExtractEpisodes:
+
+    def test_episode_table(self):
+        df = frame(
+            [0, 1, 1, 1, 0, 0, 1, 0, 1, 1],
+            [50.0, 60.0, np.nan, 62.0, 50.0, 50.0, 55.0, 50.0, 57.0, 58.0],
+        )
+
+        episodes = extract_episodes(df, metrics=["sat"], stats=("max", "min", "mean"))
+
+        assert episodes.index.names == ["fault", "start"]
+        assert list(episodes.index.get_level_values("start")) == list(
+            df.index[[1, 6, 8]]
+        )
+        assert list(episodes["end"]) == list(df.index[[3, 6, 9]])
+        assert episodes["samples"].tolist() == [3, 1, 2]
+        assert episodes["duration"].tolist() == [
+            pd.Timedelta(minutes=3),
+            pd.Timedelta(minutes=1),
+            pd.Timedelta(minutes=2),
+        ]
+        assert episodes["ongoing"].tolist() == [False, False, True]
+        assert episodes["sat_max"].tolist() == [62.0, 55.0, 58.0]
+        assert episodes["sat_min"].tolist() == [60.0, 55.0, 57.0]
+        assert episodes["sat_mean"].tolist() == [61.0, 55.0, 57.5]
+
+    def test_no_episodes(self):
+        df = frame([0, 0, 0], [1.0, 2.0, 3.0])
+        episodes = extract_episodes(df, metrics=["sat"])
+        assert episodes.empty
+        assert list(episodes.columns) == [
+            "end",
+            "duration",
+            "samples",
+            "ongoing",
+            "sat_max",
+            "sat_mean",
+        ]
+
+    def test_unknown_stat(self):
+        with pytest.raises(ValueError):
+            extract_episodes(frame([1], [1.0]), stats=("median",))
+
+    def test_index_is_stable_when_data_is_appended(self):
+        flags = [0, 1, 1, 0, 1, 1]
+        df = frame(flags, np.arange(6.0))
+        longer = frame(flags + [1, 0, 0, 1], np.arange(10.0))
+
+        first = extract_episodes(df)
+        second = extract_episodes(longer)
+
+        assert first.index.isin(second.index).all()
+        assert second.loc[first.index[-1], "samples"] == 3
+        assert not second.loc[first.index[-1], "ongoing"]
+
+    def test_round_trip(self, fault_frames):
+        df_combined, _ = fault_frames
+        flag_cols = [col for col in df_combined.columns if col.endswith("_flag")]
+
+        episodes = extract_episodes(df_combined)
+        flags = episodes_to_flags(episodes, df_combined.index, flag_cols)
+
+        assert (flags.to_numpy() == df_combined[flag_cols].to_numpy()).all()
+
+    def test_durations_match_report_hours(self, fault_frames):
+        df_combined, df_fc4 = fault_frames
+        summary = FaultSummaryEngine(config_dict).summarize(df_combined, df_fc4)
+        hours = summary[summary["metric"].str.match(r"hours_fc\d+_mode")]
+
+        episodes = FaultResults(df_combined, df_fc4).episodes(metrics=["sat"])
+        fault_hours = episodes.groupby(level="fault")["duration"].sum() / pd.Timedelta(
+            hours=1
+        )
+
+        for fault, expected in zip(hours["fault"], hours["value"]):
+            assert round(fault_hours.get(f"{fault}_flag", 0.0)) == expected
+        assert "fc4_flag" in fault_hours.index
+        # FC4 episodes are hourly, their metrics come from the df_fc4 columns
+        assert (episodes.loc["fc4_flag", "duration"] >= pd.Timedelta(hours=1)).all()
@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+import pytest
+import open_fdd.air_handling_unit.faults as faults
+from open_fdd.air_handling_unit.faults.expression_cache import ExpressionCache
+from open_fdd.air_handling_unit.faults.fault_condition import (
+    MissingColumnError,
+    InvalidParameterError,
+)
+from open_fdd.air_handling_unit.faults.fault_registry import (
+    FAULT_REGISTRY,
+    FaultRegistry,
+    FaultSpec,
+    RuleFaultCondition,
+)
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_fault_registry.py -rP -s
+
+The FaultConditionN classes are compiled from the registry specs and flag
+the same samples as the rules the registry builds.
+"""
+
+FAULT_CLASSES = {
+    "fc1": faults.FaultConditionOne,
+    "fc2": faults.FaultConditionTwo,
+    "fc3": faults.FaultConditionThree,
+    "fc5": faults.FaultConditionFive,
+    "fc6": faults.FaultConditionSix,
+    "fc7": faults.FaultConditionSeven,
+    "fc8": faults.FaultConditionEight,
+    "fc9": faults.FaultConditionNine,
+    "fc10": faults.FaultConditionTen,
+    "fc11": faults.FaultConditionEleven,
+    "fc12": faults.FaultConditionTwelve,
+    "fc13": faults.FaultConditionThirteen,
+    "fc14": faults.FaultConditionFourteen,
+    "fc15": faults.FaultConditionFifteen,
+}
+
+
+class TestFaultRegistry:
+
+    def test_default_registry(self):
+        assert FAULT_REGISTRY.names() == [f"fc{n}" for n in range(1, 16)]
+        fc4 = FAULT_REGISTRY["fc4"].build(config_dict)
+        assert isinstance(fc4, faults.FaultConditionFour)
+
+    @pytest.mark.parametrize("name", list(FAULT_CLASSES))
+    def test_fault_class_built_from_spec(self, name):
+        fc = FAULT_CLASSES[name](config_dict)
+        rule = FAULT_REGISTRY[name].build(config_dict)
+        assert isinstance(fc, RuleFaultCondition)
+        assert fc.spec is FAULT_REGISTRY[name]
+        assert fc.kernel == rule.kernel
+        assert fc.flag_col == f"{name}_flag"
+
+    @pytest.mark.parametrize("compact", [False, True])
+    @pytest.mark.parametrize("name", list(FAULT_CLASSES))
+    def test_matches_fault_class(self, name, compact):
+        df = generate_data(rows=3000)
+        if compact:
+            df = SharedUtils.compact_dtypes(df)
+        rule = FAULT_REGISTRY[name].build(config_dict)
+        assert isinstance(rule, RuleFaultCondition)
+        expected = FAULT_CLASSES[name](config_dict).evaluate(df)
+        pd.testing.assert_series_equal(rule.evaluate(df), expected)
+
+    def test_config_keys_are_attributes(self):
+        fc1 = faults.FaultConditionOne(config_dict)
+        assert fc1.duct_static_col == config_dict["DUCT_STATIC_COL"]
+        assert fc1.vfd_speed_percent_max == config_dict["VFD_SPEED_PERCENT_MAX"]
+        assert "duct static pressure" in fc1.get_required_columns()
+
+    def test_streaming_matches_batch(self):
+        df = generate_data(rows=1000)
+        rule = FAULT_REGISTRY["fc6"].build(config_dict)
+        expected = rule.evaluate(df)
+        rule.reset_stream()
+        flags = pd.concat(
+            [rule.update(df.iloc[i : i + 97]) for i in range(0, 1000, 97)]
+        )
+        pd.testing.assert_series_equal(flags, expected)
+
+    def test_invalid_parameter(self):
+        with pytest.raises(InvalidParameterError, match="mix_degf_err_thres"):
+            FAULT_REGISTRY["fc2"].build({**config_dict, "MIX_DEGF_ERR_THRES": "2"})
+
+    @pytest.mark.parametrize("name", ["fc14", "fc15"])
+    def test_int_min_oa_damper_accepted(self, name):
+        fc = FAULT_REGISTRY[name].build({**config_dict, "AHU_MIN_OA_DPR": 0})
+        assert fc.ahu_min_oa_dpr == 0
+
+    @pytest.mark.parametrize("key", ["OUTDOOR_DEGF_ERR_THRES", "RETURN_DEGF_ERR_THRES"])
+    def test_validates_params_outside_expression(self, key):
+        # fc6 checks these like the class it replaced, though it never reads them
+        assert key not in FAULT_REGISTRY["fc6"].params
+        with pytest.raises(InvalidParameterError, match=key.lower()):
+            faults.FaultConditionSix({**config_dict, key: 5})
+
+    def test_missing_column(self):
+        spec = FAULT_REGISTRY["fc14"]
+        with pytest.raises(MissingColumnError):
+            spec.build({**config_dict, "CLG_COIL_ENTER_TEMP_COL": None})
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["SAT_COL.mean() > 1.0", "0.0 < SAT_COL < 1.0", "round(SAT_COL) > 1.0"],
+    )
+    def test_unsupported_expression(self, expression):
+        with pytest.raises(ValueError):
+            FaultSpec("bad", expression)
+
+    def test_custom_rule(self):
+        registry = FaultRegistry(FAULT_REGISTRY)
+        registry.register(
+            FaultSpec(
+                "ahu_hot",
+                "(SAT_COL > SAT_SETPOINT_COL + 10.0) & (SUPPLY_VFD_SPEED_COL > 0.01)",
+                window=2,
+                analog=["SUPPLY_VFD_SPEED_COL"],
+            )
+        )
+        with pytest.raises(ValueError):
+            registry.register(FaultSpec("fc1", "SAT_COL > 1.0"))
+
+        df = generate_data(rows=1000)
+        df_combined, _, fault_counts_df = HelperUtils().process_all_faults(
+            df, config_dict, registry=registry
+        )
+        check = (df["sat"] > df["sat_setpoint"] + 10.0) & (
+            df["supply_vfd_speed"] > 0.01
+        )
+        expected = (check.rolling(2).sum() >= 2).astype(int)
+        assert (df_combined["ahu_hot_flag"] == expected).all()
+        assert "ahu_hot_fault_sum" in fault_counts_df["Fault Condition"].tolist()
+
+    def test_shared_subexpressions_computed_once(self):
+        df = generate_data(rows=1000)
+        cache = ExpressionCache(df)
+        for name in ["fc8", "fc9"]:
+            rule = FAULT_REGISTRY[name].build(config_dict)
+            rule.expression_cache = cache
+            rule.evaluate(df)
+        # economizer > min OA damper and cooling < 0.1 are shared
+        assert cache.hits >= 2
+        assert all(np.ndim(value) == 1 for value in cache._cache.values())
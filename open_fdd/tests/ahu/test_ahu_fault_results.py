@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.fault_results import FaultResults
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_fault_results.py -rP -s
+
+FaultResults reads native and hourly flags at either resolution.
+"""
+
+
+@pytest.fixture(scope="module")
+def results():
+    df = generate_data(rows=3000)
+    df_combined, df_fc4, _ = HelperUtils().process_all_faults(
+        df, config_dict, fused=True
+    )
+    return FaultResults(df_combined, df_fc4)
+
+
+class TestFaultResults:
+
+    def test_faults_listed_once(self, results):
+        assert results.faults[-1] == "fc4_flag"
+        assert len(results.faults) == len(set(results.faults))
+        assert results.resolution_of("fc1_flag") == "native"
+        assert results.resolution_of("fc4_flag") == "hourly"
+
+    def test_same_resolution_is_not_copied(self, results):
+        assert np.shares_memory(
+            results.flag("fc1_flag").to_numpy(),
+            results.native["fc1_flag"].to_numpy(),
+        )
+        assert np.shares_memory(
+            results.flag("fc4_flag", "hourly").to_numpy(),
+            results.hourly["fc4_flag"].to_numpy(),
+        )
+
+    def test_hourly_flags_forward_filled(self, results):
+        expected = (
+            results.hourly["fc4_flag"]
+            .reindex(results.native.index, method="ffill")
+            .fillna(0)
+            .astype(results.hourly["fc4_flag"].dtype)
+        )
+        pd.testing.assert_series_equal(results.flag("fc4_flag", "native"), expected)
+
+    @pytest.mark.parametrize("agg", ["max", "sum"])
+    def test_native_flags_reduced_hourly(self, results, agg):
+        expected = results.native["fc1_flag"].resample("60min").agg(agg)
+        actual = results.flag("fc1_flag", "hourly", agg=agg)
+        assert actual.index.equals(results.hourly.index)
+        assert (actual.to_numpy() == expected.to_numpy()).all()
+
+    def test_samples_outside_hours_get_zero(self):
+        index = pd.date_range("2024-01-01 00:00", periods=6, freq="30min")
+        df_combined = pd.DataFrame({"fc1_flag": [1, 0, 1, 1, 0, 1]}, index=index)
+        df_fc4 = pd.DataFrame(
+            {"fc4_flag": [1]},
+            index=pd.date_range("2024-01-01 01:00", periods=1, freq="60min"),
+        )
+        results = FaultResults(df_combined, df_fc4)
+        assert results.flag("fc4_flag").tolist() == [0, 0, 1, 1, 0, 0]
+        assert results.flag("fc1_flag", "hourly").tolist() == [1]
+
+    def test_flags_frame(self, results):
+        hourly = results.flags("hourly")
+        assert list(hourly.columns) == results.faults
+        assert hourly.index.equals(results.hourly.index)
+        assert results.flags().index.equals(results.native.index)
+
+    def test_unknown_fault(self, results):
+        with pytest.raises(KeyError):
+            results.flag("fc99_flag")
+        with pytest.raises(ValueError):
+            results.flag("fc1_flag", "daily")
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_fill_gaps.py -rP -s
+
+NaN cleaning and per column gap filling.
+"""
+
+nan = np.nan
+
+
+def make_frame() -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=10, freq="1min")
+    return pd.DataFrame(
+        {
+            "oat": [nan, 1.0, nan, 3.0, nan, nan, nan, 7.0, 8.0, nan],
+            "rat": [0.0, 1.0, 2.0, nan, nan, 5.0, 6.0, 7.0, 8.0, 9.0],
+            "sat": np.arange(10.0),
+        },
+        index=index,
+    )
+
+
+class TestCleanNanValues:
+
+    def test_matches_dropna(self):
+        df = make_frame()
+        pd.testing.assert_frame_equal(SharedUtils.clean_nan_values(df), df.dropna())
+
+    def test_clean_frame_returned_as_is(self):
+        df = make_frame().fillna(0.0)
+        assert SharedUtils.clean_nan_values(df) is df
+
+    def test_message_reports_dropped_rows(self, capsys):
+        df = make_frame()
+        SharedUtils.clean_nan_values(df)
+        out = capsys.readouterr().out
+        assert f"{int(df.isna().any(axis=1).sum())} rows dropped" in out
+        assert "fill_gaps" in out
+        assert "backfilled" not in out
+
+
+class TestFillGaps:
+
+    def test_default_drops_rows(self):
+        df = make_frame()
+        filled = SharedUtils.fill_gaps(df)
+        pd.testing.assert_frame_equal(filled, df.dropna())
+        assert filled.attrs["gap_report"]["rows_dropped"] == 7
+
+    def test_ffill_with_max_gap(self):
+        filled = SharedUtils.fill_gaps(make_frame(), default="ffill", max_gap=2)
+        # the leading NaN and the 3 sample gap in oat are not filled
+        assert list(filled.index.minute) == [1, 2, 3, 7, 8, 9]
+        assert filled["oat"].tolist() == [1.0, 1.0, 3.0, 7.0, 8.0, 8.0]
+        assert filled["rat"].tolist() == [1.0, 2.0, 2.0, 7.0, 8.0, 9.0]
+
+    def test_interpolate_per_column(self):
+        filled = SharedUtils.fill_gaps(
+            make_frame(),
+            strategy={"oat": "interpolate", "rat": "interpolate"},
+            max_gap={"oat": 3},
+        )
+        # trailing gaps are not extrapolated
+        assert list(filled.index.minute) == list(range(1, 9))
+        assert filled["oat"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+        assert filled["rat"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+
+    def test_input_not_modified(self):
+        df = make_frame()
+        expected = df.copy()
+        SharedUtils.fill_gaps(df, default="ffill")
+        pd.testing.assert_frame_equal(df, expected)
+        assert "gap_report" not in df.attrs
+
+    def test_gap_report(self):
+        filled = SharedUtils.fill_gaps(make_frame(), default="ffill", max_gap=2)
+        report = SharedUtils.gap_report(filled)
+        assert report.loc["oat"].tolist() == [6, 4, 3, 2]
+        assert report.loc["rat"].tolist() == [2, 1, 2, 2]
+        assert report.loc["sat"].tolist() == [0, 0, 0, 0]
+
+    def test_gaps_filled(self):
+        df = make_frame()
+        filled = SharedUtils.fill_gaps(df, default="ffill")
+        assert SharedUtils.gaps_filled(filled, ["oat", "rat"])
+        assert not SharedUtils.gaps_filled(filled, ["oat", "mat"])
+        assert not SharedUtils.gaps_filled(df, ["oat"])
+        # a subset inherits the attrs but not the guarantee
+        assert not SharedUtils.gaps_filled(filled.iloc[2:], ["oat"])
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            SharedUtils.fill_gaps(make_frame(), strategy={"oat": "mean"})
@@ -0,0 +1,87 @@
+import os
+
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.fleet_runner import FleetRunner
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_fleet_runner.py -rP -s
+
+The fleet summary must hold the same counts as process_all_faults per unit,
+and a unit with missing columns or a chunk that fails in the pool must not
+stop the other units.
+"""
+
+
+def crash_worker():
+    os._exit(1)
+
+
+def expected_counts(df) -> dict:
+    _, _, fault_counts_df = HelperUtils().process_all_faults(df, config_dict)
+    return dict(zip(fault_counts_df["Fault Condition"], fault_counts_df["Count"]))
+
+
+class TestFleetRunner:
+
+    def test_fleet_summary_and_error_isolation(self):
+        units = {
+            f"ahu_{seed}": (generate_data(rows=300, seed=seed), config_dict)
+            for seed in range(3)
+        }
+        bad_df = generate_data(rows=300).drop(columns=["duct_static"])
+        units["ahu_bad"] = (bad_df, config_dict)
+
+        runner = FleetRunner(units, max_workers=2, chunksize=2)
+        summary = runner.run()
+
+        assert list(summary.index) == ["ahu_0", "ahu_1", "ahu_2"]
+        for seed in range(3):
+            expected = expected_counts(generate_data(rows=300, seed=seed))
+            assert summary.loc[f"ahu_{seed}"].to_dict() == expected
+
+        assert list(runner.errors) == ["ahu_bad"]
+        assert runner.errors["ahu_bad"].startswith("MissingColumnError")
+
+    def test_csv_source(self, tmp_path):
+        path = tmp_path / "ahu.csv"
+        df = generate_data(rows=300)
+        df.rename_axis("timestamp").to_csv(path)
+
+        summary = FleetRunner({"ahu": (str(path), config_dict)}, max_workers=1).run()
+        assert summary.loc["ahu"].to_dict() == expected_counts(df)
+
+    def test_unpicklable_source_fails_its_chunk(self):
+        units = {
+            "ahu_0": (generate_data(rows=300), config_dict),
+            "ahu_local": (lambda: generate_data(rows=300), config_dict),
+            "ahu_2": (generate_data(rows=300, seed=2), config_dict),
+        }
+
+        runner = FleetRunner(units, max_workers=1, chunksize=2)
+        summary = runner.run()
+
+        assert list(summary.index) == ["ahu_2"]
+        assert sorted(runner.errors) == ["ahu_0", "ahu_local"]
+        assert len(runner.records) == 3
+
+    def test_worker_crash_is_recorded(self):
+        units = {
+            "ahu_crash": (crash_worker, config_dict),
+            "ahu_1": (generate_data(rows=300), config_dict),
+        }
+
+        runner = FleetRunner(units, max_workers=1)
+        summary = runner.run()
+
+        assert runner.errors["ahu_crash"].startswith("BrokenProcessPool")
+        assert len(runner.records) == 2
+        for record in runner.records:
+            assert (record["error"] is None) == (record["unit_id"] in summary.index)
+
+    def test_invalid_chunksize(self):
+        with pytest.raises(ValueError):
+            FleetRunner({}, chunksize=0)
@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+from open_fdd.air_handling_unit.faults.fault_condition import FaultCondition
+from open_fdd.air_handling_unit.faults.fault_registry import (
+    FAULT_REGISTRY,
+    FaultRegistry,
+    FaultSpec,
+    RuleFaultCondition,
+)
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_fused_engine.py -rP -s
+
+The fused engine must return the same flags as the per-fault df.copy() path.
+"""
+
+# Constants
+TEST_DATASET_ROWS = 600
+
+config_dict = {
+    "DUCT_STATIC_COL": "duct_static",
+    "DUCT_STATIC_SETPOINT_COL": "duct_static_setpoint",
+    "SUPPLY_VFD_SPEED_COL": "supply_vfd_speed",
+    "MAT_COL": "mat",
+    "OAT_COL": "oat",
+    "SAT_COL": "sat",
+    "RAT_COL": "rat",
+    "HEATING_SIG_COL": "heating_sig",
+    "COOLING_SIG_COL": "cooling_sig",
+    "ECONOMIZER_SIG_COL": "economizer_sig",
+    "SUPPLY_FAN_AIR_VOLUME_COL": "supply_cfm",
+    "SAT_SETPOINT_COL": "sat_setpoint",
+    "CLG_COIL_ENTER_TEMP_COL": "clg_enter",
+    "CLG_COIL_LEAVE_TEMP_COL": "clg_leave",
+    "HTG_COIL_ENTER_TEMP_COL": "htg_enter",
+    "HTG_COIL_LEAVE_TEMP_COL": "htg_leave",
+    "VFD_SPEED_PERCENT_ERR_THRES": 0.05,
+    "VFD_SPEED_PERCENT_MAX": 0.99,
+    "DUCT_STATIC_INCHES_ERR_THRES": 0.1,
+    "OUTDOOR_DEGF_ERR_THRES": 5.0,
+    "MIX_DEGF_ERR_THRES": 2.0,
+    "RETURN_DEGF_ERR_THRES": 2.0,
+    "SUPPLY_DEGF_ERR_THRES": 2.0,
+    "DELTA_T_SUPPLY_FAN": 2.0,
+    "DELTA_SUPPLY_FAN": 2.0,
+    "DELTA_OS_MAX": 3,
+    "AHU_MIN_OA_DPR": 0.2,
+    "OAT_RAT_DELTA_MIN": 10.0,
+    "AIRFLOW_ERR_THRES": 0.3,
+    "AHU_MIN_OA_CFM_DESIGN": 2500,
+    "COIL_TEMP_ENTER_ERR_THRES": 1.0,
+    "COIL_TEMP_LEAV_ERR_THRES": 1.0,
+    "TROUBLESHOOT_MODE": False,
+    "ROLLING_WINDOW_SIZE": 2,
+}
+
+
+def generate_data(rows=TEST_DATASET_ROWS, seed=42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-06-06 14:30", periods=rows, freq="2min")
+
+    def temps(center, spread):
+        return center + spread * rng.standard_normal(rows)
+
+    def signal():
+        # mostly off with some fully open and min OA samples mixed in
+        return rng.choice([0.0, 0.2, 0.5, 0.95, 1.0], size=rows)
+
+    data = {
+        "duct_static": temps(0.9, 0.3),
+        "duct_static_setpoint": np.full(rows, 1.0),
+        "supply_vfd_speed": rng.choice([0.0, 0.5, 0.96, 0.99], size=rows),
+        "mat": temps(60.0, 10.0),
+        "oat": temps(55.0, 20.0),
+        "sat": temps(58.0, 8.0),
+        "rat": temps(70.0, 4.0),
+        "heating_sig": signal(),
+        "cooling_sig": signal(),
+        "economizer_sig": signal(),
+        "supply_cfm": temps(8000.0, 1500.0),
+        "sat_setpoint": np.full(rows, 55.0),
+        "clg_enter": temps(60.0, 5.0),
+        "clg_leave": temps(55.0, 5.0),
+        "htg_enter": temps(55.0, 5.0),
+        "htg_leave": temps(60.0, 5.0),
+    }
+    return pd.DataFrame(data, index=index)
+
+
+class HotSatAfterFirstRow(RuleFaultCondition):
+    """Registry rule that only flags the rows after the first."""
+
+    def __init__(self, dict_):
+        super().__init__(FaultSpec("hot_sat", "SAT_COL > 60.0"), dict_)
+
+    def evaluate(self, df):
+        return super().evaluate(df.iloc[1:])
+
+
+class NoHourlyFlags(FaultCondition):
+    """Stands in for fault condition 4 when it has no hours to flag."""
+
+    def __init__(self, dict_):
+        super().__init__()
+
+    def apply(self, df):
+        return pd.DataFrame()
+
+
+class TestFusedEngine:
+
+    def test_flags_match_copy_path(self):
+        df = generate_data()
+        expected, expected_fc4, expected_counts = HelperUtils().process_all_faults(
+            df.copy(), config_dict
+        )
+        actual, actual_fc4, actual_counts = HelperUtils().process_all_faults(
+            df.copy(), config_dict, fused=True
+        )
+
+        flag_cols = [col for col in expected.columns if col.endswith("_flag")]
+        assert len(flag_cols) == 14
+        pd.testing.assert_frame_equal(actual[flag_cols], expected[flag_cols])
+        pd.testing.assert_frame_equal(actual_fc4, expected_fc4)
+        pd.testing.assert_frame_equal(actual_counts, expected_counts)
+
+    def test_input_is_not_modified(self):
+        df = generate_data()
+        original = df.copy()
+        HelperUtils().run_fused_engine(df, [])
+        HelperUtils().process_all_faults(df, config_dict, fused=True)
+        pd.testing.assert_frame_equal(df, original)
+
+    def test_short_result_is_aligned(self):
+        df = generate_data()
+        registry = FaultRegistry(
+            [
+                FAULT_REGISTRY["fc1"],
+                FaultSpec("hot_sat", fault_class=HotSatAfterFirstRow),
+            ]
+        )
+        expected, _, expected_counts = HelperUtils().process_all_faults(
+            df.copy(), config_dict, registry=registry
+        )
+        actual, _, actual_counts = HelperUtils().process_all_faults(
+            df.copy(), config_dict, fused=True, registry=registry
+        )
+
+        # the copy path leaves NaN on the row the rule skipped
+        assert np.isnan(expected["hot_sat_flag"].iloc[0])
+        assert actual["hot_sat_flag"].iloc[0] == 0
+        assert (
+            actual["hot_sat_flag"].iloc[1:] == expected["hot_sat_flag"].iloc[1:]
+        ).all()
+        pd.testing.assert_frame_equal(actual_counts, expected_counts, check_dtype=False)
+
+    def test_empty_fc4(self):
+        df = generate_data()
+        registry = FaultRegistry(
+            [FAULT_REGISTRY["fc1"], FaultSpec("fc4", fault_class=NoHourlyFlags)]
+        )
+        expected = HelperUtils().process_all_faults(
+            df.copy(), config_dict, registry=registry
+        )
+        actual = HelperUtils().process_all_faults(
+            df.copy(), config_dict, fused=True, registry=registry
+        )
+
+        assert actual[1].empty
+        assert list(actual[2]["Fault Condition"]) == ["fc1_fault_sum"]
+        pd.testing.assert_frame_equal(actual[2], expected[2])
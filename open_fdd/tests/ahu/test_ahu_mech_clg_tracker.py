@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.energy_efficiency.reports.ahu_mech_clg_tracker import (
+    MechanicalCoolingTracker,
+)
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_mech_clg_tracker.py -rP -s
+
+The vectorized mode classifier must label every row like the row by row
+if/elif rules it replaced.
+"""
+
+config = {
+    "STATIC_MIN": 0.5,
+    "STATIC_COL": "duct_static",
+    "ECONOMIZER_MIN_OA_POS": 0.2,
+    "ECONOMIZER_DAMPER_POSITION": 0.5,
+    "MECHANICAL_VALVE_POSITION": 0.1,
+    "OAT_COL": "oat",
+    "MA_DAMPERS_COL": "ma_dampers",
+    "CW_VALVE_COL": "cw_valve",
+}
+
+
+def reference_mode(row):
+    if row["oat"] > 40:
+        if row["ma_dampers"] > 0.5 and row["cw_valve"] > 0.1:
+            return "Economizer_plus_Mech"
+        elif row["ma_dampers"] > 0.2 and row["cw_valve"] < 0.1:
+            return "Economizer"
+        elif row["ma_dampers"] <= 0.2 and row["cw_valve"] > 0.1:
+            return "Mechanical"
+    return "Not_Mechanical"
+
+
+def generate_data(rows=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-06-01", periods=rows, freq="5min")
+    df = pd.DataFrame(
+        {
+            "duct_static": rng.uniform(0.0, 1.5, rows),
+            "oat": rng.choice([30.0, 40.0, 41.0, 75.0], rows),
+            # Values on each threshold to check the boundaries
+            "ma_dampers": rng.choice([0.0, 0.2, 0.3, 0.5, 0.8], rows),
+            "cw_valve": rng.choice([0.0, 0.1, 0.6], rows),
+        },
+        index=index,
+    )
+    df.loc[df.index[::11], "oat"] = np.nan
+    df.loc[df.index[::17], "cw_valve"] = np.nan
+    return df
+
+
+class TestMechanicalCoolingTracker:
+
+    def test_modes_match_row_rules(self):
+        df = generate_data()
+        modes = MechanicalCoolingTracker(config).identify_modes(df)
+
+        assert isinstance(modes.dtype, pd.CategoricalDtype)
+        assert list(modes.cat.categories) == MechanicalCoolingTracker.MODES
+        assert (modes.astype(str) == df.apply(reference_mode, axis=1)).all()
+
+    def test_mode_percentages(self):
+        df = generate_data()
+        tracker = MechanicalCoolingTracker(config)
+        df["Mode"] = tracker.identify_modes(df)
+
+        percentages = tracker._calculate_mode_percentages(df)
+
+        assert list(percentages.columns) == MechanicalCoolingTracker.MODES
+        assert list(percentages.index) == list(df.resample("D").size().index)
+        assert percentages.sum(axis=1).to_numpy() == pytest.approx(100.0)
+        first_day = df[df.index.normalize() == df.index[0]]
+        expected = first_day["Mode"].value_counts(normalize=True) * 100
+        assert percentages.iloc[0].to_dict() == pytest.approx(expected.to_dict())
+
+    def test_run_time_deltas_clip_gaps(self):
+        index = pd.DatetimeIndex(
+            [
+                "2024-06-01 00:00",
+                "2024-06-01 00:05",
+                "2024-06-01 00:05",
+                "2024-06-01 00:10",
+                "2024-06-01 02:00",
+                "2024-06-01 02:05",
+            ]
+        )
+
+        deltas = MechanicalCoolingTracker._run_time_deltas(index)
+
+        assert deltas.tolist() == [300.0, 300.0, 300.0, 300.0]
+        assert list(deltas.index) == list(index[[1, 3, 4, 5]])
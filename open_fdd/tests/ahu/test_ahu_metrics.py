@@ -0,0 +1,153 @@
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults import FaultConditionOne, FaultConditionSixteen
+from open_fdd.air_handling_unit.faults.fleet_runner import FleetRunner
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.faults.metrics import FaultMetrics, MetricsRecorder
+from open_fdd.tests.ahu.test_ahu_fc16 import fault_condition_params
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_metrics.py -rP -s
+
+Per fault metrics must count the same flags as process_all_faults and render
+as valid OpenMetrics text.
+"""
+
+
+class TestMetricsRecorder:
+
+    @pytest.mark.parametrize("fused", [False, True])
+    def test_process_all_faults_records_every_fault(self, fused):
+        df = generate_data(rows=300)
+        recorder = MetricsRecorder(unit="AHU1")
+        _, _, fault_counts_df = HelperUtils().process_all_faults(
+            df, config_dict, fused=fused, metrics=recorder
+        )
+
+        records = {metrics.fault: metrics for metrics in recorder.records}
+        counts = dict(zip(fault_counts_df["Fault Condition"], fault_counts_df["Count"]))
+        for key, count in counts.items():
+            name = key[: -len("_fault_sum")]
+            assert records[name].flags == count
+            assert records[name].rows == len(df)
+            assert records[name].seconds >= 0
+            assert records[name].unit == "AHU1"
+
+        run = recorder.records[-1]
+        assert (run.fault, run.stage) == ("all", "process_all_faults")
+        # FC4 counts hourly buckets, so it is kept out of the sample total
+        assert run.flags == sum(counts.values()) - counts["fc4_fault_sum"]
+        assert records["fc4"].flags == counts["fc4_fault_sum"]
+        assert records["fc4"].stage == "apply"
+
+        frame = recorder.to_frame()
+        assert list(frame.columns) == FaultMetrics.FIELDS
+        assert len(frame) == len(counts) + 1
+
+    @pytest.mark.parametrize("fused", [False, True])
+    @pytest.mark.parametrize("fail", [False, True])
+    def test_recorder_detached_after_run(self, monkeypatch, fused, fail):
+        df = generate_data(rows=300)
+        if fail:
+            # the first fault that reads mat raises, after fc1 has run
+            df["mat"] = "bad"
+        built = []
+        build = HelperUtils.build_fault_conditions
+
+        def build_and_keep(self, config_dict, registry=None):
+            fault_conditions = build(self, config_dict, registry)
+            built.extend(fc for _, fc in fault_conditions if fc is not None)
+            return fault_conditions
+
+        monkeypatch.setattr(HelperUtils, "build_fault_conditions", build_and_keep)
+        try:
+            HelperUtils().process_all_faults(
+                df, config_dict, fused=fused, metrics=MetricsRecorder()
+            )
+        except Exception:
+            assert fail
+
+        assert built
+        assert all(fc.metrics is None for fc in built)
+
+    def test_track_memory(self):
+        df = generate_data(rows=300)
+        recorder = MetricsRecorder(track_memory=True)
+        HelperUtils().process_all_faults(df, config_dict, metrics=recorder)
+
+        assert all(metrics.peak_bytes > 0 for metrics in recorder.records)
+        run = recorder.records[-1]
+        assert run.peak_bytes >= max(m.peak_bytes for m in recorder.records[:-1])
+
+    def test_apply_records_only_when_attached(self):
+        df = generate_data(rows=300)
+        fc1 = FaultConditionOne(config_dict)
+        fc1.apply(df.copy())
+
+        recorder = MetricsRecorder()
+        fc1.metrics = recorder
+        result = fc1.apply(df.copy())
+        fc16 = FaultConditionSixteen(
+            {
+                **fault_condition_params,
+                "ERV_OAT_ENTER_COL": "oat",
+                "ERV_OAT_LEAVING_COL": "mat",
+                "ERV_EAT_ENTER_COL": "rat",
+                "ERV_EAT_LEAVING_COL": "sat",
+            }
+        )
+        fc16.metrics = recorder
+        result16 = fc16.apply(df.copy())
+
+        assert [(m.fault, m.stage) for m in recorder.records] == [
+            ("fc1", "apply"),
+            ("fc16", "apply"),
+        ]
+        assert recorder.records[0].flags == int(result["fc1_flag"].sum())
+        assert recorder.records[1].flags == int(result16["fc16_flag"].sum())
+
+    def test_openmetrics_text(self):
+        recorder = MetricsRecorder(unit='AHU "1"')
+        for flags in [pd.Series([0, 1, 1]), pd.Series([1, 0, 0])]:
+            with recorder.measure("fc1", 3) as metrics:
+                metrics.flags = flags
+
+        text = recorder.to_openmetrics()
+        lines = text.splitlines()
+        assert lines[-1] == "# EOF"
+        assert "# TYPE open_fdd_fault_runs counter" in lines
+        assert "# UNIT open_fdd_fault_seconds seconds" in lines
+        assert any(line.startswith("# HELP open_fdd_fault_flags") for line in lines)
+        labels = 'unit="AHU \\"1\\"",fault="fc1",stage="evaluate"'
+        assert f"open_fdd_fault_runs_total{{{labels}}} 2" in lines
+        assert f"open_fdd_fault_flags_total{{{labels}}} 3" in lines
+        assert f"open_fdd_fault_rows_total{{{labels}}} 6" in lines
+        # Memory was not tracked
+        assert "peak_bytes" not in text
+
+    def test_error_is_still_recorded(self):
+        recorder = MetricsRecorder()
+        with pytest.raises(ValueError):
+            with recorder.measure("fc1", 10):
+                raise ValueError("boom")
+        assert recorder.records[0].flags is None
+        assert recorder.records[0].seconds >= 0
+
+
+class TestFleetMetrics:
+
+    def test_fleet_metrics(self):
+        units = {
+            f"ahu_{seed}": (generate_data(rows=200, seed=seed), config_dict)
+            for seed in range(2)
+        }
+        runner = FleetRunner(units, max_workers=1)
+        runner.run()
+
+        frame = runner.metrics().to_frame()
+        assert sorted(frame["unit"].unique()) == ["ahu_0", "ahu_1"]
+        runs = frame[frame["stage"] == "process_all_faults"]
+        assert len(runs) == 2
+        assert 'unit="ahu_1"' in runner.metrics().to_openmetrics()
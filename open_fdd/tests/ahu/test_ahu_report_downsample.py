@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.figure import Figure
+from open_fdd.air_handling_unit.reports import FaultCodeOneReport
+from open_fdd.air_handling_unit.reports.fault_report import BaseFaultReport
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_report_downsample.py -rP -s
+
+Report lines are downsampled to a fixed number of points that keep the
+envelope of the data and every fault flag run.
+"""
+
+
+def series(values):
+    index = pd.date_range("2024-01-01", periods=len(values), freq="1min")
+    return pd.Series(values, index=index)
+
+
+def bucket_of(positions, rows, buckets):
+    starts = np.linspace(0, rows, buckets + 1).astype(np.int64)
+    return np.searchsorted(starts, positions, side="right") - 1
+
+
+class TestDownsample:
+
+    def test_short_series_unchanged(self):
+        data = series(np.arange(100.0))
+        assert BaseFaultReport.downsample(data, 1000) is data
+        assert BaseFaultReport.downsample(data, None) is data
+
+    @pytest.mark.parametrize("rows", [10_001, 123_457, 500_000])
+    def test_keeps_envelope(self, rows):
+        rng = np.random.default_rng(rows)
+        data = series(rng.standard_normal(rows).cumsum())
+
+        result = BaseFaultReport.downsample(data, 4000)
+
+        assert len(result) <= 4000
+        assert result.index.is_monotonic_increasing
+        assert result.index[0] == data.index[0]
+        assert result.index[-1] == data.index[-1]
+        # Every bucket keeps its own min and max
+        positions = data.index.get_indexer(result.index)
+        result_buckets = bucket_of(positions, rows, 1000)
+        data_buckets = bucket_of(np.arange(rows), rows, 1000)
+        by_bucket = data.groupby(data_buckets)
+        kept = result.groupby(result_buckets)
+        pd.testing.assert_series_equal(kept.min(), by_bucket.min())
+        pd.testing.assert_series_equal(kept.max(), by_bucket.max())
+
+    def test_keeps_every_flag_run(self):
+        rows = 100_000
+        flags = np.zeros(rows, dtype=int)
+        runs = np.random.default_rng(0).choice(rows, size=50, replace=False)
+        flags[runs] = 1
+        data = series(flags)
+
+        result = BaseFaultReport.downsample(data, 1000)
+
+        positions = data.index.get_indexer(result.index[result == 1])
+        assert set(bucket_of(positions, rows, 250)) == set(bucket_of(runs, rows, 250))
+        assert result.iloc[0] == 0
+
+    def test_nan_gaps(self):
+        values = np.arange(50_000.0)
+        values[10_000:20_000] = np.nan
+        result = BaseFaultReport.downsample(series(values), 1000)
+
+        assert result.isna().any()
+        assert result.min() == 0
+        assert result.max() == 49_999
+
+
+class TestReportDownsample:
+
+    def test_plot_draws_at_most_max_points(self):
+        df = generate_data(rows=20_000)
+        df["fc1_flag"] = (np.arange(len(df)) % 1000 == 0).astype(int)
+        report = FaultCodeOneReport(config_dict)
+        report.max_points = 2000
+
+        fig = report.create_plot(df, Figure())
+
+        for ax in fig.axes:
+            assert all(len(line.get_xdata()) <= 2000 for line in ax.lines)
+        (flag_line,) = fig.axes[2].lines
+        assert flag_line.get_ydata().sum() == df["fc1_flag"].sum()
@@ -0,0 +1,118 @@
+import os
+
+import matplotlib.pyplot as plt
+import pytest
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.reports import FaultCodeFiveReport
+from open_fdd.air_handling_unit.reports.report_renderer import (
+    ReportRenderer,
+    render_fleet,
+)
+from open_fdd.tests.ahu.test_ahu_fleet_runner import crash_worker
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_report_renderer.py -rP -s
+
+Reports must render to files headlessly, on one reused figure, for one AHU
+or a fleet.
+"""
+
+FAULTS = ["fc1", "fc4", "fc5", "fc8"]
+
+
+def fault_frames(seed=0):
+    df = generate_data(rows=300, seed=seed)
+    df_combined, df_fc4, _ = HelperUtils().process_all_faults(df, config_dict)
+    return df_combined, df_fc4
+
+
+class TestReportRenderer:
+
+    def test_render_unit_formats(self, tmp_path):
+        df_combined, df_fc4 = fault_frames()
+        renderer = ReportRenderer(
+            config_dict, tmp_path, formats=("png", "svg"), dpi=20, faults=FAULTS
+        )
+        figure = renderer.figure
+
+        paths = renderer.render(df_combined, df_fc4, unit_id="AHU1")
+
+        assert paths
+        assert all(os.path.getsize(path) > 0 for path in paths)
+        assert {os.path.splitext(path)[1] for path in paths} == {".png", ".svg"}
+        assert all(os.path.dirname(path) == str(tmp_path / "AHU1") for path in paths)
+        # Only faults that flagged are rendered, each with its histogram
+        for name, report in renderer.reports.items():
+            expected = str(tmp_path / "AHU1" / f"{name}.png") in paths
+            df = df_fc4 if name == "fc4" else df_combined
+            if expected:
+                assert df[report.fault_col].max() == 1
+                assert str(tmp_path / "AHU1" / f"{name}_hist.png") in paths
+
+        renderer.render(df_combined, df_fc4, unit_id="AHU2")
+        assert renderer.figure is figure
+        assert plt.get_fignums() == []
+
+    def test_reused_axes_are_cleared(self, tmp_path):
+        df_combined, _ = fault_frames()
+        report = FaultCodeFiveReport(config_dict)
+        renderer = ReportRenderer(config_dict, tmp_path, faults=["fc5"])
+
+        fig = report.create_plot(df_combined, renderer.figure)
+        axes = list(fig.axes)
+        report.create_plot(df_combined, fig)
+
+        assert fig.axes == axes
+        assert [len(ax.lines) for ax in fig.axes] == [2, 1, 1]
+
+    def test_unsupported_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            ReportRenderer(config_dict, tmp_path, formats=("bmp",))
+
+
+class TestRenderFleet:
+
+    def test_render_fleet(self, tmp_path):
+        units = {
+            f"ahu_{seed}": (generate_data(rows=300, seed=seed), config_dict)
+            for seed in range(2)
+        }
+        units["ahu_bad"] = (
+            generate_data(rows=300).drop(columns=["duct_static"]),
+            config_dict,
+        )
+
+        records = render_fleet(
+            units, tmp_path, dpi=20, faults=FAULTS, max_workers=2, chunksize=2
+        )
+
+        assert [record["unit_id"] for record in records] == [
+            "ahu_0",
+            "ahu_1",
+            "ahu_bad",
+        ]
+        for record in records[:2]:
+            assert record["error"] is None
+            assert record["paths"]
+            assert all(os.path.exists(path) for path in record["paths"])
+        assert records[2]["error"].startswith("MissingColumnError")
+
+    def test_failed_chunk_is_recorded(self, tmp_path):
+        units = {
+            "ahu_0": (generate_data(rows=300), config_dict),
+            "ahu_local": (lambda: generate_data(rows=300), config_dict),
+            "ahu_crash": (crash_worker, config_dict),
+        }
+
+        records = render_fleet(units, tmp_path, dpi=20, faults=FAULTS, max_workers=1)
+
+        assert [record["unit_id"] for record in records] == [
+            "ahu_0",
+            "ahu_crash",
+            "ahu_local",
+        ]
+        errors = {record["unit_id"]: record["error"] for record in records}
+        assert errors["ahu_local"] is not None
+        assert errors["ahu_crash"].startswith("BrokenProcessPool")
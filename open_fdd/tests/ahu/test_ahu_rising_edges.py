@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_rising_edges.py -rP -s
+
+The FC4 transition counter must match the resample().apply(lambda) path.
+"""
+
+
+def resample_counts(df, freq) -> pd.DataFrame:
+    return df.resample(freq).apply(lambda x: (x.eq(1) & x.shift().ne(1)).sum())
+
+
+def make_df(rows=3000, seed=0, tz=None) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-03-09 22:13", periods=rows, freq="1min", tz=tz)
+    # drop random samples plus one long outage so some buckets are empty
+    keep = rng.random(rows) > 0.1
+    keep[500:800] = False
+    index = index[keep]
+    data = rng.integers(0, 2, size=(len(index), 4))
+    return pd.DataFrame(data, index=index, columns=["a", "b", "c", "d"])
+
+
+class TestRisingEdges:
+
+    def test_counts(self):
+        index = pd.date_range("2024-06-06 00:00", periods=6, freq="30min")
+        df = pd.DataFrame({"mode": [1, 1, 0, 1, 1, 1]}, index=index)
+        actual = SharedUtils.count_rising_edges(df, "60min")["mode"].tolist()
+        # the first sample of a bucket counts as an edge when it is 1
+        assert actual == [1, 1, 1]
+
+    @pytest.mark.parametrize("freq", ["15min", "60min", "90min", "1D"])
+    @pytest.mark.parametrize("tz", [None, "US/Central"])
+    def test_matches_resample_apply(self, freq, tz):
+        df = make_df(tz=tz)
+        actual = SharedUtils.count_rising_edges(df, freq)
+        pd.testing.assert_frame_equal(actual, resample_counts(df, freq))
@@ -0,0 +1,147 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_rolling_average.py -rP -s
+
+The rolling mean must match pandas' time based rolling mean exactly, so
+signals held at a constant value keep that value and flag the same.
+"""
+
+
+def make_frame(rows=2000, freq="1min", seed=0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=rows, freq=freq)
+    df = pd.DataFrame(
+        {
+            "sat": 55.0 + 5.0 * rng.standard_normal(rows),
+            "supply_cfm": 8000.0 + 1500.0 * rng.standard_normal(rows),
+            "heating_sig": rng.choice([0.0, 0.5, 1.0], size=rows),
+        },
+        index=index,
+    )
+    df.iloc[::37, 0] = np.nan
+    df.iloc[:12, 1] = np.nan
+    return df
+
+
+class TestRollingAverage:
+
+    @pytest.mark.parametrize("freq", ["1min", "45s", "20s"])
+    def test_regular_grid_matches_pandas(self, freq):
+        df = make_frame(freq=freq)
+        expected = df.rolling("5min").mean()
+        actual = SharedUtils.apply_rolling_average_if_needed(df)
+        assert df.attrs["sample_period"]["regular"]
+        pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+    def test_irregular_grid_matches_pandas(self):
+        df = make_frame().drop(
+            pd.date_range("2024-01-01 00:10", periods=7, freq="1min")
+        )
+        expected = df.rolling("5min").mean()
+        actual = SharedUtils.apply_rolling_average_if_needed(df)
+        assert not df.attrs["sample_period"]["regular"]
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_only_selected_columns_smoothed(self):
+        df = make_frame()
+        df["unit_name"] = "AHU1"
+        df["fc1_flag"] = np.arange(len(df)) % 2
+        actual = SharedUtils.apply_rolling_average_if_needed(df)
+        pd.testing.assert_series_equal(actual["fc1_flag"], df["fc1_flag"])
+        pd.testing.assert_series_equal(actual["unit_name"], df["unit_name"])
+
+        actual = SharedUtils.apply_rolling_average_if_needed(df, columns=["sat"])
+        pd.testing.assert_series_equal(actual["heating_sig"], df["heating_sig"])
+        assert not actual["sat"].equals(df["sat"])
+
+    def test_constant_runs_stay_exact(self):
+        df = make_frame(rows=5000)
+        df.iloc[1000:1096, 2] = 0.2
+        df.iloc[2000:2096, 2] = 0.0
+        actual = SharedUtils.apply_rolling_average_if_needed(df)
+        # the first 4 samples of each run still average in the previous value
+        assert (actual["heating_sig"].iloc[1004:1096] == 0.2).all()
+        assert not (actual["heating_sig"].iloc[2004:2096] > 0).any()
+
+    def test_fault_flags_match_baseline_smoothing(self):
+        df = generate_data(rows=3000, seed=7)
+        df.index = pd.date_range("2024-06-06 14:30", periods=len(df), freq="1min")
+        # Held signals, the case where a drifting window mean used to
+        # flip the == and > comparisons of the faults
+        for col in ["economizer_sig", "heating_sig", "cooling_sig"]:
+            df.iloc[100:196, df.columns.get_loc(col)] = 0.2
+            df.iloc[500:596, df.columns.get_loc(col)] = 0.0
+            df.iloc[900:996, df.columns.get_loc(col)] = 1.0
+        df.iloc[1200:1400, df.columns.get_loc("supply_vfd_speed")] = 0.0
+
+        helper = HelperUtils()
+        columns = [col for col in helper.config_columns(config_dict) if col in df]
+        baseline = df.copy()
+        baseline[columns] = df[columns].rolling("5min").mean()
+        expected = {
+            fc.flag_col: fc.evaluate(baseline)
+            for name, fc in helper.build_fault_conditions(config_dict)
+            if fc is not None and name not in ("fc4", "fc16")
+        }
+
+        for fused in (False, True):
+            df_combined, _, _ = helper.process_all_faults(df, config_dict, fused=fused)
+            for flag_col, flags in expected.items():
+                pd.testing.assert_series_equal(
+                    df_combined[flag_col], flags, check_dtype=False, check_names=False
+                )
+
+    def test_input_not_modified(self):
+        df = make_frame()
+        expected = df.copy()
+        SharedUtils.apply_rolling_average_if_needed(df)
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_float32_kept(self):
+        df = make_frame().astype(np.float32)
+        actual = SharedUtils.apply_rolling_average_if_needed(df)
+        assert (actual.dtypes == np.float32).all()
+
+    def test_slow_sampling_skipped(self, caplog):
+        df = make_frame(freq="15min")
+        with caplog.at_level(logging.INFO):
+            actual = SharedUtils.apply_rolling_average_if_needed(df)
+        assert actual is df
+        assert "skipping" in caplog.text
+
+    def test_custom_logger(self, caplog):
+        logger = logging.getLogger("open_fdd.tests.rolling")
+        with caplog.at_level(logging.INFO, logger="open_fdd.tests.rolling"):
+            SharedUtils.apply_rolling_average_if_needed(make_frame(), logger=logger)
+        assert [record.name for record in caplog.records] == ["open_fdd.tests.rolling"]
+
+    def test_sample_period_cached(self):
+        df = make_frame()
+        first = SharedUtils.sample_period(df)
+        assert first["period"] == pd.Timedelta("1min")
+        df.attrs["sample_period"]["period_ns"] = pd.Timedelta("3min").value
+        assert SharedUtils.sample_period(df)["period"] == pd.Timedelta("3min")
+
+        # a frame that inherits the attrs is measured again
+        subset = df.iloc[::2]
+        assert SharedUtils.sample_period(subset)["period"] == pd.Timedelta("2min")
+
+    def test_sample_period_same_ends_measured_again(self):
+        df = make_frame()
+        assert SharedUtils.sample_period(df)["regular"]
+
+        # same length and end points, uneven spacing inside
+        times = df.index.to_numpy().copy()
+        times[1:-1] += np.timedelta64(20, "s")
+        shifted = df.set_axis(pd.DatetimeIndex(times))
+        assert shifted.attrs["sample_period"]["regular"]
+        assert not SharedUtils.sample_period(shifted)["regular"]
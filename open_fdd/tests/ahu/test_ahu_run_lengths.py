@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_run_lengths.py -rP -s
+
+The consecutive run kernel must match the rolling(window).sum() == N path.
+"""
+
+
+def rolling_flags(mask, window) -> pd.Series:
+    rolling_sum = mask.rolling(window=window).sum()
+    return (rolling_sum == window).astype(int)
+
+
+class TestRunLengths:
+
+    def test_run_lengths(self):
+        mask = pd.Series([True, True, False, True, True, True, False])
+        actual = SharedUtils.run_lengths(mask).tolist()
+        assert actual == [1, 2, 0, 1, 2, 3, 0]
+
+    @pytest.mark.parametrize("window", [0, 1, 2, 5, 12])
+    def test_matches_rolling_sum(self, window):
+        rng = np.random.default_rng(window)
+        mask = pd.Series(rng.random(2000) < 0.8)
+        actual = SharedUtils.consecutive_true_flags(mask, window)
+        pd.testing.assert_series_equal(actual, rolling_flags(mask, window))
+
+    def test_nan_treated_like_rolling(self):
+        mask = pd.Series([1.0, 1.0, np.nan, 1.0, 1.0, 1.0, 0.0, 1.0])
+        actual = SharedUtils.consecutive_true_flags(mask, 2)
+        pd.testing.assert_series_equal(actual, rolling_flags(mask, 2))
+
+    def test_missing_window(self):
+        with pytest.raises(ValueError):
+            SharedUtils.consecutive_true_flags(pd.Series([True]), None)
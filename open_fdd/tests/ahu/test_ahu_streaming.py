@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults import (
+    FaultConditionOne,
+    FaultConditionTwo,
+    FaultConditionThree,
+    FaultConditionFour,
+    FaultConditionFive,
+    FaultConditionSix,
+    FaultConditionSeven,
+    FaultConditionEight,
+    FaultConditionNine,
+    FaultConditionTen,
+    FaultConditionEleven,
+    FaultConditionTwelve,
+    FaultConditionThirteen,
+    FaultConditionFourteen,
+    FaultConditionFifteen,
+)
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_streaming.py -rP -s
+
+Flags from update() over chunks must match a batch apply() over all of them.
+"""
+
+FAULT_CLASSES = [
+    FaultConditionOne,
+    FaultConditionTwo,
+    FaultConditionThree,
+    FaultConditionFive,
+    FaultConditionSix,
+    FaultConditionSeven,
+    FaultConditionEight,
+    FaultConditionNine,
+    FaultConditionTen,
+    FaultConditionEleven,
+    FaultConditionTwelve,
+    FaultConditionThirteen,
+    FaultConditionFourteen,
+    FaultConditionFifteen,
+]
+
+
+def chunks(df, seed=0):
+    # uneven chunk sizes, including empty ones, like a poller would deliver
+    rng = np.random.default_rng(seed)
+    start = 0
+    while start < len(df):
+        stop = start + int(rng.integers(0, 40))
+        yield df.iloc[start:stop]
+        start = stop
+
+
+class TestStreaming:
+
+    @pytest.mark.parametrize("fault_class", FAULT_CLASSES)
+    def test_update_matches_apply(self, fault_class):
+        df = generate_data()
+        fc = fault_class(config_dict)
+        expected = fault_class(config_dict).apply(df.copy())[fc.flag_col]
+
+        actual = pd.concat([fc.update(chunk) for chunk in chunks(df)] + [fc.flush()])
+        pd.testing.assert_series_equal(actual, expected, check_freq=False)
+
+    @pytest.mark.parametrize("window", ["60min", "7min", "1D"])
+    def test_fc4_update_matches_apply(self, window):
+        df = generate_data(rows=2000)
+        params = {**config_dict, "DELTA_OS_WINDOW": window}
+        fc = FaultConditionFour(params)
+        expected = FaultConditionFour(params).apply(df.copy())["fc4_flag"]
+
+        parts = [fc.update(chunk) for chunk in chunks(df)]
+        actual = pd.concat(parts + [fc.flush()])
+        pd.testing.assert_series_equal(actual, expected, check_freq=False)
+
+    def test_reset_stream(self):
+        df = generate_data()
+        fc = FaultConditionTwo(config_dict)
+        first = fc.update(df)
+        fc.reset_stream()
+        pd.testing.assert_series_equal(fc.update(df), first)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.reports.summary_engine import FaultSummaryEngine
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/ahu/test_ahu_summary_engine.py -rP -s
+
+The single pass summary must hold the same statistics as every report's
+summarize_fault_times.
+"""
+
+
+def fault_frames(rows=2000, seed=0):
+    df = generate_data(rows=rows, seed=seed)
+    # Gaps in a sensor column must be skipped like Series.mean does
+    df.loc[df.index[::7], "mat"] = np.nan
+    df_combined, df_fc4, _ = HelperUtils().process_all_faults(df, config_dict)
+    return df_combined, df_fc4
+
+
+def assert_same(expected, actual):
+    assert set(expected) == set(actual)
+    for key, value in expected.items():
+        if pd.isna(value):
+            assert pd.isna(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, abs=0.011), key
+
+
+class TestFaultSummaryEngine:
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_matches_reports(self, seed):
+        df_combined, df_fc4 = fault_frames(seed=seed)
+        engine = FaultSummaryEngine(config_dict)
+
+        summary = engine.summarize(df_combined, df_fc4)
+
+        assert list(summary.columns) == ["fault", "metric", "value"]
+        assert not summary.duplicated(["fault", "metric"]).any()
+        by_fault = {
+            fault: dict(zip(group["metric"], group["value"]))
+            for fault, group in summary.groupby("fault")
+        }
+        for name, report in engine.reports.items():
+            df = df_fc4 if name == "fc4" else df_combined
+            if report.fault_col not in df.columns:
+                assert name not in by_fault
+                continue
+            assert_same(report.summarize_fault_times(df), by_fault[name])
+
+    def test_pivot_and_subset(self):
+        df_combined, df_fc4 = fault_frames(rows=500)
+        engine = FaultSummaryEngine(config_dict, faults=["fc1", "fc8"])
+
+        wide = engine.summarize(df_combined, df_fc4).pivot(
+            index="metric", columns="fault", values="value"
+        )
+
+        assert list(wide.columns) == ["fc1", "fc8"]
+        assert wide.loc["total_hours", "fc1"] == wide.loc["total_hours", "fc8"]
+        assert (
+            wide.loc["hours_motor_runtime", "fc1"]
+            == wide.loc["hours_motor_runtime", "fc8"]
+        )
+
+    def test_no_flags(self):
+        engine = FaultSummaryEngine(config_dict)
+        summary = engine.summarize(generate_data(rows=100), pd.DataFrame())
+        assert summary.empty
+        assert list(summary.columns) == ["fault", "metric", "value"]
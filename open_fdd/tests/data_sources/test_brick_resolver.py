@@ -0,0 +1,79 @@
+import pytest
+
+rdflib = pytest.importorskip("rdflib")
+
+from rdflib import RDF, Graph, Literal, Namespace, URIRef
+from open_fdd.data_sources.brick_resolver import BrickResolver
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/data_sources/test_brick_resolver.py -rP -s
+
+Brick points must map to config keys, and the mapping must be served from
+the JSON cache until the model changes.
+"""
+
+BRICK = Namespace("https://brickschema.org/schema/Brick#")
+REF = Namespace("https://brickschema.org/schema/Reference#")
+
+config_dict_template = {
+    "VFD_SPEED_PERCENT_ERR_THRES": 0.05,
+    "VFD_SPEED_PERCENT_MAX": 0.99,
+    "DUCT_STATIC_INCHES_ERR_THRES": 0.1,
+    "ROLLING_WINDOW_SIZE": 10,
+}
+
+
+def write_model(path, ahus=("AHU1", "AHU2")):
+    # same layout as examples/brick_model_and_sqlite/2_make_rdf.py
+    g = Graph()
+    points = [
+        ("SaStatic", BRICK.Supply_Air_Static_Pressure_Sensor),
+        ("StaticSPt", BRICK.Supply_Air_Static_Pressure_Setpoint),
+        ("SaFanSpeedAO", BRICK.Supply_Fan_VFD_Speed_Sensor),
+    ]
+    for ahu in ahus:
+        ahu_uri = URIRef(f"http://example.org/{ahu}")
+        g.add((ahu_uri, RDF.type, BRICK.Air_Handling_Unit))
+        for point, brick_class in points:
+            sensor = URIRef(f"http://example.org/{ahu}_{point}_value")
+            g.add((sensor, RDF.type, brick_class))
+            g.add((ahu_uri, BRICK.hasPoint, sensor))
+            timeseries_ref = URIRef(f"http://example.org/timeseries_{ahu}_{point}")
+            g.add((timeseries_ref, RDF.type, REF.TimeseriesReference))
+            g.add(
+                (timeseries_ref, REF.hasTimeseriesId, Literal(f"{ahu}_{point}_value"))
+            )
+            g.add((sensor, REF.hasExternalReference, timeseries_ref))
+    g.serialize(path, format="turtle")
+
+
+class TestBrickResolver:
+
+    def test_config_dicts(self, tmp_path):
+        ttl = tmp_path / "model.ttl"
+        write_model(ttl)
+        config_dicts = BrickResolver(ttl).config_dicts(config_dict_template)
+
+        assert sorted(config_dicts) == ["AHU1", "AHU2"]
+        assert config_dicts["AHU2"] == {
+            **config_dict_template,
+            "DUCT_STATIC_COL": "AHU2_SaStatic_value",
+            "DUCT_STATIC_SETPOINT_COL": "AHU2_StaticSPt_value",
+            "SUPPLY_VFD_SPEED_COL": "AHU2_SaFanSpeedAO_value",
+        }
+
+    def test_mapping_cached_until_model_changes(self, tmp_path, monkeypatch):
+        ttl = tmp_path / "model.ttl"
+        write_model(ttl)
+        first = BrickResolver(ttl).resolve()
+
+        def no_sparql(self):
+            raise AssertionError("mapping should be read from the cache")
+
+        with monkeypatch.context() as m:
+            m.setattr(BrickResolver, "run_query", no_sparql)
+            assert BrickResolver(ttl).resolve() == first
+
+        write_model(ttl, ahus=("AHU1", "AHU2", "AHU3"))
+        assert sorted(BrickResolver(ttl).resolve()) == ["AHU1", "AHU2", "AHU3"]
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.air_handling_unit.faults.shared_utils import SharedUtils
+from open_fdd.data_sources.chunked_csv import (
+    ChunkedCsvRunner,
+    csv_sample_period,
+    iter_csv_chunks,
+)
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/data_sources/test_chunked_csv.py -rP -s
+
+Flags written chunk by chunk must match process_all_faults on the whole file.
+1 minute data is averaged over the same samples, up to the last bit.
+"""
+
+
+def write_csv(path, df):
+    df.rename_axis("timestamp").to_csv(path)
+
+
+def one_minute_data(rows, irregular=False):
+    df = generate_data(rows=rows)
+    df.index = pd.date_range("2024-06-06 14:30", periods=rows, freq="1min")
+    # The running sum of a chunk starts at its carried rows, so a mean can
+    # differ from the whole file in the last bit. Jitter the stepped signals
+    # so no 5 minute mean lands exactly on a threshold.
+    jitter = np.random.default_rng(1).uniform(0.0, 1e-6, size=(rows, 3))
+    df[["heating_sig", "cooling_sig", "economizer_sig"]] *= 1.0 - jitter
+    if irregular:
+        # a few dropped samples and 30 second steps, median still 1 minute
+        df = df.drop(df.index[5::23])
+        df.index = df.index.where(
+            df.index.minute % 17 != 3, df.index - pd.Timedelta("30s")
+        )
+    return df
+
+
+class TestChunkedCsv:
+
+    def test_flags_match_process_all_faults(self, tmp_path):
+        source = tmp_path / "ahu.csv"
+        output = tmp_path / "flags.csv"
+        df = generate_data(rows=1000)
+        write_csv(source, df)
+
+        # re-read so both paths see the same CSV round tripped floats
+        df = next(iter_csv_chunks(source, chunksize=10_000))
+        expected, expected_fc4, expected_counts = HelperUtils().process_all_faults(
+            df.copy(), config_dict
+        )
+
+        runner = ChunkedCsvRunner(source, config_dict, output, chunksize=77)
+        fault_counts_df, fc4_flags = runner.run()
+
+        flags = pd.read_csv(output, index_col="timestamp", parse_dates=True)
+        pd.testing.assert_frame_equal(
+            flags, expected[flags.columns], check_freq=False, check_names=False
+        )
+        pd.testing.assert_series_equal(
+            fc4_flags, expected_fc4["fc4_flag"], check_freq=False
+        )
+        pd.testing.assert_frame_equal(fault_counts_df, expected_counts)
+
+    @pytest.mark.parametrize(
+        "chunksize,irregular", [(77, False), (3, False), (77, True)]
+    )
+    def test_one_minute_data_is_smoothed(self, tmp_path, chunksize, irregular):
+        source = tmp_path / "ahu.csv"
+        output = tmp_path / "flags.csv"
+        write_csv(source, one_minute_data(1000, irregular))
+
+        df = next(iter_csv_chunks(source, chunksize=10_000))
+        expected, expected_fc4, expected_counts = HelperUtils().process_all_faults(
+            df.copy(), config_dict
+        )
+
+        runner = ChunkedCsvRunner(source, config_dict, output, chunksize=chunksize)
+        fault_counts_df, fc4_flags = runner.run()
+
+        flags = pd.read_csv(output, index_col="timestamp", parse_dates=True)
+        pd.testing.assert_frame_equal(
+            flags, expected[flags.columns], check_freq=False, check_names=False
+        )
+        pd.testing.assert_series_equal(
+            fc4_flags, expected_fc4["fc4_flag"], check_freq=False
+        )
+        pd.testing.assert_frame_equal(fault_counts_df, expected_counts)
+
+    @pytest.mark.parametrize("irregular", [False, True])
+    def test_csv_sample_period(self, tmp_path, irregular):
+        source = tmp_path / "ahu.csv"
+        write_csv(source, one_minute_data(500, irregular))
+        df = next(iter_csv_chunks(source, chunksize=10_000))
+
+        assert csv_sample_period(source, chunksize=37) == SharedUtils.sample_period(df)
+
+    def test_unsorted_rows(self, tmp_path):
+        source = tmp_path / "ahu.csv"
+        write_csv(source, generate_data(rows=100).iloc[::-1])
+        with pytest.raises(ValueError):
+            list(iter_csv_chunks(source, chunksize=30))
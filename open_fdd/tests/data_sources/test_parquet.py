@@ -0,0 +1,96 @@
+import pandas as pd
+import pytest
+from open_fdd.air_handling_unit.faults.helper_utils import HelperUtils
+from open_fdd.tests.ahu.test_ahu_fused_engine import config_dict, generate_data
+
+pytest.importorskip("pyarrow")
+
+from open_fdd.data_sources.parquet import (
+    config_columns,
+    csv_to_parquet,
+    read_parquet,
+    write_parquet,
+)
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/data_sources/test_parquet.py -rP -s
+
+Parquet reads must project the configured columns and filter on time.
+"""
+
+
+def make_parquet(path) -> pd.DataFrame:
+    df = generate_data(rows=500)
+    df["unused_point"] = 1.0
+    df = df.rename_axis("timestamp")
+    write_parquet(df, path, row_group_size=100)
+    return df
+
+
+class TestParquet:
+
+    def test_column_projection(self, tmp_path):
+        path = tmp_path / "ahu.parquet"
+        df = make_parquet(path)
+
+        actual = read_parquet(path, config_dict=config_dict)
+        assert list(actual.columns) == config_columns(config_dict)
+        assert "unused_point" not in actual.columns
+        pd.testing.assert_frame_equal(actual, df[actual.columns], check_freq=False)
+
+    def test_time_range_filter(self, tmp_path):
+        path = tmp_path / "ahu.parquet"
+        df = make_parquet(path)
+        start, end = df.index[120], df.index[260]
+
+        actual = read_parquet(path, columns=["mat", "oat"], start=start, end=end)
+        pd.testing.assert_frame_equal(
+            actual, df.loc[start:end, ["mat", "oat"]], check_freq=False
+        )
+
+    def test_missing_column(self, tmp_path):
+        path = tmp_path / "ahu.parquet"
+        make_parquet(path)
+        with pytest.raises(KeyError):
+            read_parquet(path, columns=["not_a_point"])
+
+    def test_write_flags(self, tmp_path):
+        path = tmp_path / "flags.parquet"
+        df = generate_data(rows=300)
+        df_combined, _, _ = HelperUtils().process_all_faults(df, config_dict)
+        write_parquet(df_combined, path)
+
+        actual = pd.read_parquet(path)
+        assert actual["fc1_flag"].dtype == "int8"
+        pd.testing.assert_frame_equal(
+            actual, df_combined, check_dtype=False, check_freq=False
+        )
+
+    def test_csv_to_parquet(self, tmp_path):
+        csv_path = tmp_path / "ahu.csv"
+        parquet_path = tmp_path / "ahu.parquet"
+        df = generate_data(rows=500).rename_axis("timestamp")
+        df.to_csv(csv_path)
+
+        assert csv_to_parquet(csv_path, parquet_path, chunksize=128) == 500
+        actual = read_parquet(parquet_path)
+        pd.testing.assert_frame_equal(actual, df, check_freq=False)
+
+    def test_csv_to_parquet_whole_numbers_first(self, tmp_path):
+        csv_path = tmp_path / "ahu.csv"
+        parquet_path = tmp_path / "ahu.parquet"
+        index = pd.date_range("2024-01-01", periods=6, freq="5min", name="timestamp")
+        df = pd.DataFrame(
+            {
+                "economizer_sig": [0, 0, 1, 0.35, 0.5, 1],
+                "sat": [55, 56, 57, 58, 59, 60],
+            },
+            index=index,
+        )
+        df.to_csv(csv_path)
+
+        assert csv_to_parquet(csv_path, parquet_path, chunksize=3) == 6
+        actual = read_parquet(parquet_path)
+        assert list(actual.dtypes) == ["float64", "float64"]
+        pd.testing.assert_frame_equal(actual, df.astype(float), check_freq=False)
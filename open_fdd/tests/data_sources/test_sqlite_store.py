@@ -0,0 +1,204 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+from open_fdd.data_sources.sqlite_store import TimeseriesStore, to_epoch_seconds
+
+"""
+To see print statements in pytest run with:
+$ py -3.12 -m pytest open_fdd/tests/data_sources/test_sqlite_store.py -rP -s
+
+The bulk loader must store every non-missing reading with epoch timestamps,
+and databases with text timestamps must be converted, not read as is.
+"""
+
+
+def make_df() -> pd.DataFrame:
+    index = pd.date_range("2024-07-01", periods=50, freq="5min", name="timestamp")
+    df = pd.DataFrame(
+        {
+            "AHU1_SaStatic_value": np.linspace(0.5, 1.5, 50),
+            "AHU1_SaFanSpeedAO_value": np.linspace(10.0, 90.0, 50),
+        },
+        index=index,
+    )
+    df.iloc[3, 0] = np.nan
+    return df
+
+
+def make_text_db(path, df):
+    """Writes ``df`` like the original example, with text timestamps."""
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("""
+            CREATE TABLE TimeseriesData (
+                id INTEGER PRIMARY KEY,
+                sensor_name TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                value REAL NOT NULL
+            )
+            """)
+        for column in df.columns:
+            conn.executemany(
+                "INSERT INTO TimeseriesData (sensor_name, timestamp, value) VALUES (?, ?, ?)",
+                [
+                    (column, timestamp.strftime("%Y-%m-%d %H:%M:%S"), value)
+                    for timestamp, value in df[column].dropna().items()
+                ],
+            )
+    conn.close()
+
+
+class TestTimeseriesStore:
+
+    def test_load_dataframe(self, tmp_path):
+        df = make_df()
+        with TimeseriesStore(tmp_path / "brick.db") as store:
+            inserted = store.load_dataframe(df, batch_size=7)
+            assert inserted == 99
+
+            rows = store.conn.execute(
+                """
+                SELECT timestamp, value FROM TimeseriesData
+                WHERE sensor_name = ? ORDER BY timestamp
+                """,
+                ("AHU1_SaStatic_value",),
+            ).fetchall()
+            expected = df["AHU1_SaStatic_value"].dropna()
+            assert [row[0] for row in rows] == to_epoch_seconds(expected.index).tolist()
+            assert [row[1] for row in rows] == expected.tolist()
+
+            indexes = store.conn.execute("PRAGMA index_list(TimeseriesData)").fetchall()
+            assert "idx_timeseries_sensor_time" in [row[1] for row in indexes]
+
+    def test_references_not_duplicated(self, tmp_path):
+        df = make_df()
+        with TimeseriesStore(tmp_path / "brick.db") as store:
+            store.load_dataframe(df.reset_index(), columns=["AHU1_SaStatic_value"])
+            store.load_dataframe(df)
+            assert sorted(store.sensor_names()) == sorted(df.columns)
+
+    def test_epoch_seconds(self):
+        index = pd.DatetimeIndex(["1970-01-01 00:01:00", "2024-07-01 00:00:00"])
+        assert to_epoch_seconds(index).tolist() == [60, 1719792000]
+        local = index.tz_localize("US/Central")
+        assert to_epoch_seconds(local).tolist() == [
+            60 + 6 * 3600,
+            1719792000 + 5 * 3600,
+        ]
+
+
+class TestSchema:
+
+    def test_text_timestamps_are_converted(self, tmp_path):
+        df = make_df()
+        make_text_db(tmp_path / "brick.db", df)
+
+        with TimeseriesStore(tmp_path / "brick.db") as store:
+            types = {
+                row[1]: row[2]
+                for row in store.conn.execute("PRAGMA table_info(TimeseriesData)")
+            }
+            assert types["timestamp"] == "INTEGER"
+            result = store.query(list(df.columns))
+
+        pd.testing.assert_frame_equal(
+            result, df, check_freq=False, check_index_type=False
+        )
+
+    def test_bad_text_timestamp(self, tmp_path):
+        make_text_db(tmp_path / "brick.db", make_df())
+        conn = sqlite3.connect(tmp_path / "brick.db")
+        with conn:
+            conn.execute("UPDATE TimeseriesData SET timestamp = 'n/a' WHERE id = 7")
+        conn.close()
+
+        with pytest.raises(ValueError, match="not dates"):
+            TimeseriesStore(tmp_path / "brick.db")
+
+        conn = sqlite3.connect(tmp_path / "brick.db")
+        (count,) = conn.execute(
+            "SELECT count(*) FROM TimeseriesData WHERE typeof(timestamp) = 'text'"
+        ).fetchone()
+        conn.close()
+        assert count == make_df().count().sum()
+
+    def test_unknown_layout(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "brick.db")
+        with conn:
+            conn.execute("CREATE TABLE TimeseriesData (sensor TEXT, reading REAL)")
+        conn.close()
+
+        with pytest.raises(ValueError, match="expected"):
+            TimeseriesStore(tmp_path / "brick.db")
+
+
+class TestQuery:
+
+    def test_query_pivots_to_wide(self, tmp_path):
+        df = make_df()
+        with TimeseriesStore(tmp_path / "brick.db") as store:
+            store.load_dataframe(df)
+            actual = store.query(
+                {
+                    "Supply_Fan_VFD_Speed_Sensor": "AHU1_SaFanSpeedAO_value",
+                    "Supply_Air_Static_Pressure_Sensor": "AHU1_SaStatic_value",
+                },
+                start=df.index[10],
+                end=df.index[20],
+            )
+
+        expected = df.iloc[10:21, [1, 0]].set_axis(
+            ["Supply_Fan_VFD_Speed_Sensor", "Supply_Air_Static_Pressure_Sensor"],
+            axis=1,
+        )
+        pd.testing.assert_frame_equal(
+            actual, expected, check_freq=False, check_index_type=False
+        )
+
+    def test_missing_readings_are_nan(self, tmp_path):
+        df = make_df()
+        with TimeseriesStore(tmp_path / "brick.db") as store:
+            store.load_dataframe(df)
+            actual = store.query(list(df.columns))
+        assert len(actual) == 50
+        assert np.isnan(actual.iloc[3, 0])
+
+    def test_query_cache(self, tmp_path, monkeypatch):
+        df = make_df()
+        db_path = tmp_path / "brick.db"
+        cache_dir = tmp_path / "cache"
+        with TimeseriesStore(db_path, cache_dir=cache_dir) as store:
+            store.load_dataframe(df)
+        with TimeseriesStore(db_path, cache_dir=cache_dir) as store:
+            first = store.query(list(df.columns))
+            first["fc1_flag"] = 1  # callers may add columns to the result
+
+        def no_database(*args):
+            raise AssertionError("query should be served from the disk cache")
+
+        with TimeseriesStore(db_path, cache_dir=cache_dir) as store:
+            monkeypatch.setattr(store, "read_wide", no_database)
+            second = store.query(list(df.columns))
+            assert list(second.columns) == list(df.columns)
+            assert store.query(list(df.columns)) is not second
+
+    def test_update_by_other_connection(self, tmp_path):
+        df = make_df()
+        db_path = tmp_path / "brick.db"
+        cache_dir = tmp_path / "cache"
+        with TimeseriesStore(db_path, cache_dir=cache_dir) as store:
+            store.load_dataframe(df)
+            assert store.query(list(df.columns)).iloc[0, 0] == df.iloc[0, 0]
+
+            # an UPDATE keeps the row count and stays in the WAL file
+            other = sqlite3.connect(db_path)
+            with other:
+                other.execute("UPDATE TimeseriesData SET value = -1.0")
+            other.close()
+            assert (store.query(list(df.columns)).fillna(-1.0) == -1.0).all().all()
+
+        with TimeseriesStore(db_path, cache_dir=cache_dir) as store:
+            assert (store.query(list(df.columns)).fillna(-1.0) == -1.0).all().all()
+        assert len(list(cache_dir.iterdir())) == 1